@@ -13,6 +13,16 @@ from app.domain.ports import (
     RawLoggerFactory,
 )
 
+# Live monitor poll rates; PIDs not listed are read every monitor_interval
+DEFAULT_PID_RATE_HZ: Dict[str, float] = {
+    "05": 0.2,  # coolant temp
+    "42": 0.5,  # module voltage
+    "0C": 10.0,
+    "0D": 10.0,
+    "11": 10.0,
+    "49": 10.0,
+}
+
 
 @dataclass
 class AppState:
@@ -26,12 +36,17 @@ class AppState:
     manufacturer: str = "generic"
     log_format: str = "csv"
     monitor_interval: float = 1.0
+    pid_rate_hz: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_PID_RATE_HZ))
+    elm_fast_responses: bool = True
+    elm_headers_off: bool = False
+    elm_frame_hints: bool = False
     language: str = "en"
     stop_monitoring: bool = False
     demo: bool = False
     verbose: bool = False
     vehicle_profile: Optional[Dict[str, Any]] = None
     last_ble_address: Optional[str] = None
+    last_port: Optional[str] = None
     ble_notice_shown: bool = False
     last_seen_at: Optional[float] = None
     last_seen_rssi: Optional[int] = None
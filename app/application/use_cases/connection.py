@@ -31,6 +31,9 @@ class ConnectionService:
     ) -> Tuple[bool, Dict[str, Any], Optional[Exception]]:
         scanner = self.state.ensure_scanner()
         scanner.set_raw_logger(self.state.raw_logger())
+        scanner.set_fast_responses(
+            self.state.elm_fast_responses, self.state.elm_headers_off, self.state.elm_frame_hints
+        )
         return self.ports_scanner.try_connect(scanner, port)
 
     def try_kline(
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, Optional
 
 from app.application.state import AppState
 from app.domain.ports import I18nRepository
@@ -13,6 +13,9 @@ class I18nService:
         self._languages: Dict[str, Dict[str, str]] = {}
         self._names: Dict[str, str] = {}
         self._loaded = False
+        # Active language merged over "en", rebound only when state.language changes
+        self._active_code: Optional[str] = None
+        self._active: Dict[str, str] = {}
 
     def _load_languages(self) -> None:
         self._languages.clear()
@@ -27,6 +30,7 @@ class I18nService:
                 self._languages[code] = {str(k): str(v) for k, v in strings.items()}
                 self._names[code] = str(name)
         self._loaded = True
+        self._active_code = None
 
     def _ensure_loaded(self) -> None:
         if not self._loaded:
@@ -50,12 +54,22 @@ class I18nService:
         self._ensure_loaded()
         return dict(self._names)
 
-    def t(self, key: str, **kwargs: str) -> str:
-        self._ensure_loaded()
-        lang = self.get_language()
-        lang_table = self._languages.get(lang, self._languages.get("en", {}))
+    def _activate(self, lang: str) -> Dict[str, str]:
         fallback = self._languages.get("en", {})
-        text = lang_table.get(key) or fallback.get(key) or key
+        lang_table = self._languages.get(lang, fallback)
+        # Empty strings fall back to "en", then to the key itself
+        merged = {k: v for k, v in fallback.items() if v}
+        merged.update((k, v) for k, v in lang_table.items() if v)
+        self._active = merged
+        self._active_code = lang
+        return merged
+
+    def t(self, key: str, **kwargs: str) -> str:
+        if not self._loaded:
+            self._load_languages()
+        lang = self.state.language or "en"
+        active = self._active if lang == self._active_code else self._activate(lang)
+        text = active.get(key, key)
         if kwargs:
-            return text.format(**kwargs)
+            return text.format_map(kwargs)
         return text
@@ -26,8 +26,13 @@ class SettingsService:
             "manufacturer": self.state.manufacturer,
             "log_format": self.state.log_format,
             "monitor_interval": self.state.monitor_interval,
+            "pid_rate_hz": self.state.pid_rate_hz,
+            "elm_fast_responses": self.state.elm_fast_responses,
+            "elm_headers_off": self.state.elm_headers_off,
+            "elm_frame_hints": self.state.elm_frame_hints,
             "verbose": self.state.verbose,
             "last_ble_address": self.state.last_ble_address,
+            "last_port": self.state.last_port,
             "ble_notice_shown": self.state.ble_notice_shown,
             "vehicle_group": self.state.vehicle_group,
             "brand_id": self.state.brand_id,
@@ -48,6 +53,24 @@ class SettingsService:
         if isinstance(monitor_interval, (int, float)):
             self.state.monitor_interval = float(monitor_interval)
 
+        pid_rate_hz = settings.get("pid_rate_hz")
+        if isinstance(pid_rate_hz, dict):
+            for pid, rate in pid_rate_hz.items():
+                if isinstance(rate, (int, float)) and not isinstance(rate, bool):
+                    self.state.pid_rate_hz[str(pid).upper()] = float(rate)
+
+        elm_fast_responses = settings.get("elm_fast_responses")
+        if isinstance(elm_fast_responses, bool):
+            self.state.elm_fast_responses = elm_fast_responses
+
+        elm_headers_off = settings.get("elm_headers_off")
+        if isinstance(elm_headers_off, bool):
+            self.state.elm_headers_off = elm_headers_off
+
+        elm_frame_hints = settings.get("elm_frame_hints")
+        if isinstance(elm_frame_hints, bool):
+            self.state.elm_frame_hints = elm_frame_hints
+
         verbose = settings.get("verbose")
         if isinstance(verbose, bool):
             self.state.set_verbose(verbose)
@@ -56,6 +79,10 @@ class SettingsService:
         if isinstance(last_ble_address, str) and last_ble_address.strip():
             self.state.last_ble_address = last_ble_address.strip()
 
+        last_port = settings.get("last_port")
+        if isinstance(last_port, str) and last_port.strip():
+            self.state.last_port = last_port.strip()
+
         ble_notice_shown = settings.get("ble_notice_shown")
         if isinstance(ble_notice_shown, bool):
             self.state.ble_notice_shown = ble_notice_shown
@@ -11,6 +11,7 @@ class ScannerPort(Protocol):
     def set_manufacturer(self, manufacturer: str) -> None: ...
     def set_raw_logger(self, logger: Optional[Any]) -> None: ...
     def set_port(self, port: str) -> None: ...
+    def set_fast_responses(self, enabled: bool, headers_off: bool = False, frame_hints: bool = False) -> None: ...
     def connect(self) -> bool: ...
     def disconnect(self) -> None: ...
     def get_transport(self) -> Any: ...
@@ -54,7 +55,7 @@ class PortsScanner(Protocol):
 
 class DtcLookupPort(Protocol):
     def lookup(self, code: str) -> Optional[Dict[str, Any]]: ...
-    def search(self, text: str) -> List[Dict[str, Any]]: ...
+    def search(self, text: str, limit: Optional[int] = None) -> List[Dict[str, Any]]: ...
     def set_manufacturer(self, manufacturer: str) -> None: ...
 
 
@@ -154,6 +155,7 @@ class UdsDiscoveryPort(Protocol):
 
 class UdsClientPort(Protocol):
     def read_did(self, brand: str, did: str) -> Dict[str, Any]: ...
+    def read_dids(self, brand: str, dids: List[str]) -> List[Dict[str, Any]]: ...
     def send_raw(self, service_id: int, data: bytes, *, raise_on_negative: bool = False) -> bytes: ...
 
 
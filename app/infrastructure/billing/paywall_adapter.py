@@ -8,7 +8,6 @@ from app.infrastructure.billing.paywall_client import PaywallClient, PaywallErro
 from app.infrastructure.billing.paywall_config import (
     is_bypass_enabled,
     pending_total,
-    reset_identity,
     load_balance,
     set_api_base,
 )
@@ -70,4 +69,6 @@ class PaywallAdapter(PaywallPort):
             raise ExternalServiceError(str(exc)) from exc
 
     def reset_identity(self) -> None:
-        reset_identity()
+        # The container keeps one client for the whole session; it must not
+        # keep using the identity that was just discarded
+        self._client.reset_identity()
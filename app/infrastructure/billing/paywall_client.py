@@ -1,16 +1,28 @@
 from __future__ import annotations
 
+import hashlib
+import http.client
 import json
+import random
+import select
+import socket
+import ssl
+import threading
 import time
 import urllib.error
+import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from email.message import Message
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.infrastructure.billing.paywall_config import (
     PaywallIdentity,
     add_pending_consumption,
+    config_transaction,
     ensure_device_id,
+    flush_transaction,
     get_api_base,
     get_identity,
     is_offline_enabled,
@@ -23,6 +35,25 @@ from app.infrastructure.billing.paywall_config import (
 )
 
 
+# Concurrent consume requests when replaying the pending queue item by item;
+# also the number of idle connections kept per host
+_SYNC_WORKERS = 4
+
+# Paywall replies are small JSON documents; anything bigger is refused
+_MAX_RESPONSE_BYTES = 1024 * 1024
+
+# Small JSON requests: don't let Nagle (or delayed ACKs, on Linux) hold them back
+_SOCKET_OPTIONS: List[Tuple[int, int, int]] = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+if hasattr(socket, "TCP_QUICKACK"):
+    _SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1))
+
+# Sent with every request; never mutated, copied when extra headers are added
+_JSON_HEADERS: Dict[str, str] = {"Content-Type": "application/json"}
+
+# Menus redraw faster than the balance changes; reuse a reply this fresh
+_BALANCE_TTL_S = 2.0
+
+
 @dataclass(frozen=True)
 class PaywallBalance:
     free_remaining: int
@@ -39,14 +70,154 @@ class PaymentRequired(PaywallError):
     pass
 
 
+class _Skipped(Exception):
+    """A queued consume not sent because an earlier one hit a network error."""
+
+
+class _ConnectionPool:
+    """Keep-alive HTTP(S) connections to one host, reused across requests."""
+
+    def __init__(self, scheme: str, netloc: str, timeout: float, maxsize: int = _SYNC_WORKERS) -> None:
+        self.key = (scheme, netloc)
+        self.timeout = timeout
+        self.maxsize = maxsize
+        self._idle: List[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def request(
+        self, method: str, target: str, body: Optional[bytes], headers: Dict[str, str]
+    ) -> Tuple[int, http.client.HTTPMessage, bytes]:
+        conn = self._acquire()
+        try:
+            conn.request(method, target, body=body, headers=headers)
+            response = conn.getresponse()
+            data = response.read(_MAX_RESPONSE_BYTES + 1)
+            if len(data) > _MAX_RESPONSE_BYTES:
+                raise ValueError(f"Response larger than {_MAX_RESPONSE_BYTES} bytes")
+        except BaseException:
+            conn.close()
+            raise
+        if response.will_close:
+            conn.close()
+        else:
+            self._release(conn)
+        return response.status, response.msg, data
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def _acquire(self) -> http.client.HTTPConnection:
+        while True:
+            with self._lock:
+                conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                return self._connect()
+            if not _connection_dropped(conn):
+                return conn
+            conn.close()
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if len(self._idle) < self.maxsize:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def _connect(self) -> http.client.HTTPConnection:
+        scheme, netloc = self.key
+        if scheme == "https":
+            conn: http.client.HTTPConnection = http.client.HTTPSConnection(netloc, timeout=self.timeout)
+        else:
+            conn = http.client.HTTPConnection(netloc, timeout=self.timeout)
+        conn.connect()
+        if conn.sock is not None:
+            for level, option, value in _SOCKET_OPTIONS:
+                try:
+                    conn.sock.setsockopt(level, option, value)
+                except OSError:
+                    pass
+        return conn
+
+    def warm(self) -> None:
+        """Open one connection ahead of time (TCP + TLS handshake) and park it idle."""
+        with self._lock:
+            if self._idle:
+                return
+        try:
+            conn = self._connect()
+        except (OSError, http.client.HTTPException):
+            return
+        self._release(conn)
+
+
+def _connection_dropped(conn: http.client.HTTPConnection) -> bool:
+    """An idle keep-alive socket that turned readable was closed by the server."""
+    sock = conn.sock
+    if sock is None:
+        return True
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    if not readable:
+        return False
+    if isinstance(sock, ssl.SSLSocket):
+        # TLS 1.3 servers send NewSessionTicket records after the handshake;
+        # they make the socket readable without carrying any data
+        return not _drain_tls_records(sock)
+    return True
+
+
+def _drain_tls_records(sock: ssl.SSLSocket) -> bool:
+    """Process pending non-application TLS records; True if the connection is still usable."""
+    timeout = sock.gettimeout()
+    try:
+        sock.settimeout(0)
+        sock.recv(1)
+    except ssl.SSLWantReadError:
+        return True
+    except OSError:
+        return False
+    finally:
+        try:
+            sock.settimeout(timeout)
+        except OSError:
+            pass
+    # EOF, or unsolicited application data: either way not reusable
+    return False
+
+
 class PaywallClient:
-    def __init__(self, api_base: Optional[str] = None, timeout: int = 20) -> None:
+    def __init__(self, api_base: Optional[str] = None, timeout: int = 20, *, warm_up: bool = True) -> None:
         self.api_base = (api_base or get_api_base() or "").rstrip("/")
         self.timeout = timeout
-        self._identity: PaywallIdentity = get_identity()
-        if not self._identity.device_id:
-            ensure_device_id()
-            self._identity = get_identity()
+        self._pool: Optional[_ConnectionPool] = None
+        self._pool_lock = threading.Lock()
+        # Cleared the first time the server answers 404/405 to consume_batch
+        self._batch_consume_supported = True
+        # (monotonic time, (subject_id, access_token), balance) of the last /v1/me/balance
+        self._balance_cache: Optional[Tuple[float, Tuple[Optional[str], Optional[str]], PaywallBalance]] = None
+        self._balance_ttl = _BALANCE_TTL_S
+        # Server-requested delay before the next poll (X-Next-Poll-After), if any
+        self._poll_after: Optional[float] = None
+        self._auth_header_cache: Optional[Tuple[str, Dict[str, str]]] = None
+        with config_transaction():
+            self._identity: PaywallIdentity = get_identity()
+            if not self._identity.device_id:
+                ensure_device_id()
+                self._identity = get_identity()
+        if warm_up and self.is_configured and not is_offline_enabled():
+            self.warm_up()
+
+    def warm_up(self) -> None:
+        """Connect to the API in the background so the first menu action skips the handshake."""
+        pool = self._pool_for(f"{self.api_base}/")
+        if pool is None:
+            return
+        threading.Thread(target=pool.warm, name="paywall-warmup", daemon=True).start()
 
     @property
     def is_configured(self) -> bool:
@@ -67,11 +238,28 @@ class PaywallClient:
         access_token = data.get("access_token")
         if not subject_id or not access_token:
             raise PaywallError("Invalid identity response")
-        update_identity(subject_id, access_token)
-        self._identity = get_identity()
+        with config_transaction():
+            update_identity(subject_id, access_token)
+            self._identity = get_identity()
         return True
 
+    def reset_identity(self) -> None:
+        """Forget the stored subject/token, on disk and in this (shared) client."""
+        with config_transaction():
+            reset_identity()
+            self._identity = get_identity()
+        self._balance_cache = None
+
     def consume(self, action: str, cost: int = 1) -> PaywallBalance:
+        # Pending sync, identity bootstrap and the new balance share one write
+        with config_transaction():
+            try:
+                return self._consume(action, cost)
+            finally:
+                # Credits were (or may have been) spent: the cached reply is stale
+                self._balance_cache = None
+
+    def _consume(self, action: str, cost: int) -> PaywallBalance:
         self.sync_pending()
         self.ensure_identity()
         payload = {
@@ -103,7 +291,16 @@ class PaywallClient:
             raise PaywallError("Checkout URL missing")
         return str(url)
 
-    def get_balance(self) -> PaywallBalance:
+    def get_balance(self, *, force: bool = False) -> PaywallBalance:
+        """Server balance; a reply younger than the TTL is reused unless force."""
+        if not force and self._balance_cache is not None:
+            fetched_at, key, balance = self._balance_cache
+            if key == self._identity_key() and time.monotonic() - fetched_at < self._balance_ttl:
+                return balance
+        with config_transaction():
+            return self._get_balance()
+
+    def _get_balance(self) -> PaywallBalance:
         self.ensure_identity()
         data = self._request_json("GET", "/v1/me/balance", None, use_auth=True)
         balance = _parse_balance(data)
@@ -113,11 +310,23 @@ class PaywallClient:
                 return PaywallBalance(*cached)
             return PaywallBalance(0, 0)
         save_balance(balance.free_remaining, balance.paid_credits)
+        self._balance_cache = (time.monotonic(), self._identity_key(), balance)
         return balance
 
+    def _identity_key(self) -> Tuple[Optional[str], Optional[str]]:
+        return (self._identity.subject_id, self._identity.access_token)
+
     def sync_pending(self) -> None:
         if not self.is_configured:
             return
+        with config_transaction():
+            self._sync_pending()
+            # Items the server has taken must leave the queue on disk now, even
+            # when an outer transaction (consume) has more requests to make
+            flush_transaction()
+        self._balance_cache = None
+
+    def _sync_pending(self) -> None:
         pending = load_pending_consumptions()
         if not pending:
             return
@@ -125,21 +334,32 @@ class PaywallClient:
             self.ensure_identity()
         except PaywallError:
             return
-        remaining = []
-        for item in pending:
-            action = item.get("action")
-            cost = item.get("cost")
-            request_id = item.get("id")
-            if not isinstance(action, str) or not isinstance(cost, int) or not request_id:
-                continue
+        valid = [item for item in pending if _is_valid_pending(item)]
+        if len(valid) > 1 and self._batch_consume_supported:
+            synced = self._consume_batch(valid)
+            if synced is not None:
+                save_pending_consumptions([] if synced else valid)
+                return
+        self._consume_each(valid)
+
+    def _consume_each(self, items: List[Dict[str, Any]]) -> None:
+        """Replay pending items one request each, up to _SYNC_WORKERS at a time."""
+        results: Dict[int, Any] = {}
+        balances: List[PaywallBalance] = []
+        network_down = threading.Event()
+
+        def send(item: Dict[str, Any]) -> Dict[str, Any]:
+            if network_down.is_set():
+                raise _Skipped()
+            request_id = item["id"]
             payload = {
                 "subject_id": self._identity.subject_id,
-                "action": action,
-                "cost": cost,
+                "action": item["action"],
+                "cost": item["cost"],
                 "request_id": request_id,
             }
             try:
-                data = self._request_json(
+                return self._request_json(
                     "POST",
                     "/v1/credits/consume",
                     payload,
@@ -147,15 +367,69 @@ class PaywallClient:
                     extra_headers={"Idempotency-Key": str(request_id)},
                 )
             except PaywallError as exc:
-                remaining.append(item)
                 if exc.status_code is None:
-                    break
-                continue
-            balance = _parse_balance(data)
-            if balance:
-                save_balance(balance.free_remaining, balance.paid_credits)
+                    network_down.set()
+                raise
+
+        workers = min(_SYNC_WORKERS, len(items))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="paywall-sync") as pool:
+            futures = {pool.submit(send, item): index for index, item in enumerate(items)}
+            for future in as_completed(futures):
+                try:
+                    data = future.result()
+                except (PaywallError, _Skipped) as exc:
+                    results[futures[future]] = exc
+                    continue
+                results[futures[future]] = data
+                balance = _parse_balance(data)
+                if balance:
+                    balances.append(balance)
+
+        # Config writes stay on this thread. Completion order says nothing about
+        # the order the server applied the consumptions in, so keep the lowest
+        # balance: a too-high one would let offline mode spend missing credits
+        if balances:
+            lowest = min(balances, key=lambda b: b.free_remaining + b.paid_credits)
+            save_balance(lowest.free_remaining, lowest.paid_credits)
+        remaining = [item for index, item in enumerate(items) if isinstance(results[index], Exception)]
         save_pending_consumptions(remaining)
 
+    def _consume_batch(self, items: List[Dict[str, Any]]) -> Optional[bool]:
+        """
+        Send every pending item in one consume_batch request.
+
+        Returns True when the server took them all, False when the network
+        failed (keep them queued), and None when the caller should retry
+        them one by one (no batch endpoint, or the batch was rejected).
+        """
+        request_ids = [str(item["id"]) for item in items]
+        payload = {
+            "subject_id": self._identity.subject_id,
+            "items": [
+                {"action": item["action"], "cost": item["cost"], "request_id": item["id"]}
+                for item in items
+            ],
+        }
+        batch_key = hashlib.sha256("\n".join(request_ids).encode("utf-8")).hexdigest()
+        try:
+            data = self._request_json(
+                "POST",
+                "/v1/credits/consume_batch",
+                payload,
+                use_auth=True,
+                extra_headers={"Idempotency-Key": batch_key},
+            )
+        except PaywallError as exc:
+            if exc.status_code is None:
+                return False
+            if exc.status_code in (404, 405):
+                self._batch_consume_supported = False
+            return None
+        balance = _parse_balance(data)
+        if balance:
+            save_balance(balance.free_remaining, balance.paid_credits)
+        return True
+
     def _offline_consume(self, action: str, cost: int) -> PaywallBalance:
         cached = load_balance()
         if not cached:
@@ -180,16 +454,30 @@ class PaywallClient:
         self,
         *,
         min_paid: int = 1,
-        poll_interval: float = 2.0,
+        poll_interval: float = 0.5,
+        max_poll_interval: float = 8.0,
         timeout_seconds: int = 120,
     ) -> PaywallBalance:
+        """
+        Poll the balance until paid_credits reaches min_paid or time runs out.
+
+        The delay starts at poll_interval and grows 1.5x per poll up to
+        max_poll_interval, with +/-20% jitter; an X-Next-Poll-After reply
+        header (seconds) overrides it. Sleeps never overrun timeout_seconds.
+        """
         start = time.time()
-        last_balance = self.get_balance()
+        delay = poll_interval
+        last_balance = self.get_balance(force=True)
         while time.time() - start < timeout_seconds:
             if last_balance.paid_credits >= min_paid:
                 return last_balance
-            time.sleep(poll_interval)
-            last_balance = self.get_balance()
+            wait = self._poll_after
+            if wait is None:
+                wait = delay * random.uniform(0.8, 1.2)
+                delay = min(delay * 1.5, max_poll_interval)
+            remaining = timeout_seconds - (time.time() - start)
+            time.sleep(max(0.0, min(wait, remaining)))
+            last_balance = self.get_balance(force=True)
         return last_balance
 
     def _request_json(
@@ -204,21 +492,81 @@ class PaywallClient:
         if not self.api_base:
             raise PaywallError("API base not configured")
         url = f"{self.api_base}{path}"
-        headers = {"Content-Type": "application/json"}
-        if use_auth:
-            token = self._identity.access_token
-            if not token:
-                raise PaywallError("Missing access token")
-            headers["Authorization"] = f"Bearer {token}"
+        headers = self._auth_headers() if use_auth else _JSON_HEADERS
         if extra_headers:
-            headers.update(extra_headers)
+            headers = {**headers, **extra_headers}
         data = None
         if payload is not None:
             data = json.dumps(payload).encode("utf-8")
+        pool = self._pool_for(url)
+        if pool is None:
+            body, reply_headers = self._urlopen(url, method, data, headers)
+        else:
+            parts = urllib.parse.urlsplit(url)
+            target = parts.path or "/"
+            if parts.query:
+                target = f"{target}?{parts.query}"
+            try:
+                status, reply_headers, raw = pool.request(method, target, data, headers)
+            except Exception as exc:
+                raise PaywallError(str(exc)) from exc
+            if not 200 <= status < 300:
+                detail = raw.decode("utf-8", errors="replace")
+                raise PaywallError(_extract_error_message(detail), status_code=status)
+            body = raw
+        self._poll_after = _poll_after_seconds(reply_headers)
+        try:
+            # json.loads takes the raw bytes; no intermediate str copy
+            return json.loads(body)
+        except ValueError as exc:
+            raise PaywallError("Invalid JSON response") from exc
+
+    def _auth_headers(self) -> Dict[str, str]:
+        """Default headers plus Authorization, rebuilt only when the token changes."""
+        token = self._identity.access_token
+        if not token:
+            raise PaywallError("Missing access token")
+        cached = self._auth_header_cache
+        if cached is None or cached[0] != token:
+            cached = (token, {**_JSON_HEADERS, "Authorization": f"Bearer {token}"})
+            self._auth_header_cache = cached
+        return cached[1]
+
+    def close(self) -> None:
+        """Close the kept-alive connections to the paywall API."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close()
+
+    def _pool_for(self, url: str) -> Optional[_ConnectionPool]:
+        """Connection pool for url's host; None when urlopen must handle it (proxies)."""
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.netloc:
+            return None
+        if parts.scheme in urllib.request.getproxies() and not urllib.request.proxy_bypass(parts.hostname or ""):
+            return None
+        key = (parts.scheme, parts.netloc)
+        with self._pool_lock:
+            # api_base can change at runtime (set_api_base); drop the old host's sockets
+            stale = self._pool if self._pool is not None and self._pool.key != key else None
+            if self._pool is None or stale is not None:
+                self._pool = _ConnectionPool(parts.scheme, parts.netloc, self.timeout)
+            pool = self._pool
+        if stale is not None:
+            stale.close()
+        return pool
+
+    def _urlopen(
+        self, url: str, method: str, data: Optional[bytes], headers: Dict[str, str]
+    ) -> Tuple[bytes, Message]:
         req = urllib.request.Request(url, data=data, headers=headers, method=method)
         try:
             with urllib.request.urlopen(req, timeout=self.timeout) as response:
-                body = response.read().decode("utf-8")
+                body = response.read(_MAX_RESPONSE_BYTES + 1)
+                if len(body) > _MAX_RESPONSE_BYTES:
+                    raise ValueError(f"Response larger than {_MAX_RESPONSE_BYTES} bytes")
+                return body, response.headers
         except urllib.error.HTTPError as exc:
             detail = ""
             try:
@@ -229,10 +577,6 @@ class PaywallClient:
             raise PaywallError(message, status_code=exc.code) from exc
         except Exception as exc:
             raise PaywallError(str(exc)) from exc
-        try:
-            return json.loads(body)
-        except json.JSONDecodeError as exc:
-            raise PaywallError("Invalid JSON response") from exc
 
 
 def _extract_error_message(raw: str) -> str:
@@ -248,6 +592,21 @@ def _extract_error_message(raw: str) -> str:
     return raw or "Unknown error"
 
 
+def _poll_after_seconds(headers: Message) -> Optional[float]:
+    value = headers.get("X-Next-Poll-After")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        return None
+    return seconds if seconds >= 0 else None
+
+
+def _is_valid_pending(item: Dict[str, Any]) -> bool:
+    return isinstance(item.get("action"), str) and isinstance(item.get("cost"), int) and bool(item.get("id"))
+
+
 def _parse_balance(data: Dict[str, Any]) -> Optional[PaywallBalance]:
     if not isinstance(data, dict):
         return None
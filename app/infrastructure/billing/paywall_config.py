@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import copy
 import json
 import os
+import tempfile
+import threading
 import uuid
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
 
 from app.infrastructure.persistence.paywall_paths import paywall_config_dir, paywall_config_path
 
@@ -14,6 +18,8 @@ CONFIG_DIR = paywall_config_dir()
 CONFIG_PATH = paywall_config_path()
 PAYWALL_KEY = "paywall"
 
+_T = TypeVar("_T")
+
 
 @dataclass
 class PaywallIdentity:
@@ -22,21 +28,72 @@ class PaywallIdentity:
     access_token: Optional[str]
 
 
-def load_config() -> Dict[str, Any]:
-    if not CONFIG_PATH.exists():
-        return {}
+# Last config read/written, keyed on the file's (mtime_ns, size); every
+# getter/setter goes through it instead of re-reading and re-parsing the file
+_CONFIG_CACHE: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
+
+# Per-thread state of the open config_transaction(), if any: "config" being
+# edited and "saved", its last persisted contents
+_TRANSACTION = threading.local()
+
+
+def _open_transaction() -> Optional[Dict[str, Any]]:
+    return getattr(_TRANSACTION, "config", None)
+
+
+def _config_stamp() -> Optional[Tuple[int, int]]:
     try:
-        return json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
+        st = os.stat(CONFIG_PATH)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _read_config() -> Dict[str, Any]:
+    """Shared, cached config dict: callers must not mutate it."""
+    global _CONFIG_CACHE
+    config = _open_transaction()
+    if config is not None:
+        return config
+    stamp = _config_stamp()
+    if stamp is None:
+        _CONFIG_CACHE = None
         return {}
+    if _CONFIG_CACHE is not None and _CONFIG_CACHE[0] == stamp:
+        return _CONFIG_CACHE[1]
+    try:
+        config = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        config = {}
+    if not isinstance(config, dict):
+        config = {}
+    _CONFIG_CACHE = (stamp, config)
+    return config
+
+
+def load_config() -> Dict[str, Any]:
+    return copy.deepcopy(_read_config())
 
 
 def save_config(config: Dict[str, Any]) -> None:
+    global _CONFIG_CACHE
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    CONFIG_PATH.write_text(
-        json.dumps(config, ensure_ascii=False, indent=2, sort_keys=True) + "\n",
-        encoding="utf-8",
-    )
+    text = json.dumps(config, ensure_ascii=False, indent=2) + "\n"
+    # Write a sibling temp file and swap it in, so readers never see half a file
+    fd, tmp_name = tempfile.mkstemp(dir=str(CONFIG_DIR), prefix=".config-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_name, CONFIG_PATH)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    stamp = _config_stamp()
+    # Cache what is on disk now, not the caller's (still mutable) dict
+    _CONFIG_CACHE = (stamp, json.loads(text)) if stamp is not None else None
 
 
 def _get_paywall_section(config: Dict[str, Any]) -> Dict[str, Any]:
@@ -47,41 +104,95 @@ def _get_paywall_section(config: Dict[str, Any]) -> Dict[str, Any]:
     return section
 
 
+def _peek_paywall_section() -> Dict[str, Any]:
+    """Read-only view of the paywall section (no copy, no insert)."""
+    section = _read_config().get(PAYWALL_KEY)
+    return section if isinstance(section, dict) else {}
+
+
+@contextmanager
+def config_transaction() -> Iterator[Dict[str, Any]]:
+    """Group setters into one config write.
+
+    Yields the paywall section; getters and setters called inside the block
+    see and edit it in memory, and it is saved once on exit if it changed.
+    Nested blocks join the outer one. The transaction belongs to the thread
+    that opened it; other threads keep reading and writing the file.
+    """
+    current = _open_transaction()
+    if current is not None:
+        yield _get_paywall_section(current)
+        return
+    config = load_config()
+    _TRANSACTION.config = config
+    _TRANSACTION.saved = copy.deepcopy(config)
+    try:
+        yield _get_paywall_section(config)
+    finally:
+        saved = _TRANSACTION.saved
+        del _TRANSACTION.config, _TRANSACTION.saved
+        # Setters that completed before an error still reach disk, as they
+        # did when each one saved on its own
+        if config != saved:
+            save_config(config)
+
+
+def flush_transaction() -> None:
+    """Write the open config_transaction()'s changes now instead of on exit."""
+    config = _open_transaction()
+    if config is None or config == _TRANSACTION.saved:
+        return
+    save_config(config)
+    _TRANSACTION.saved = copy.deepcopy(config)
+
+
+def _mutate_section(fn: Callable[[Dict[str, Any]], _T]) -> _T:
+    """Load once, let fn edit the paywall section, save once."""
+    current = _open_transaction()
+    if current is not None:
+        return fn(_get_paywall_section(current))
+    config = load_config()
+    result = fn(_get_paywall_section(config))
+    save_config(config)
+    return result
+
+
 def get_api_base() -> Optional[str]:
     env_base = os.environ.get("PAYWALL_API_BASE")
     if env_base:
         return env_base.strip()
-    config = load_config()
-    section = _get_paywall_section(config)
-    value = section.get("api_base")
+    value = _peek_paywall_section().get("api_base")
     return value.strip() if isinstance(value, str) and value.strip() else None
 
 
 def set_api_base(api_base: str) -> None:
-    config = load_config()
-    section = _get_paywall_section(config)
-    section["api_base"] = api_base.strip()
-    save_config(config)
+    def apply(section: Dict[str, Any]) -> None:
+        section["api_base"] = api_base.strip()
+
+    _mutate_section(apply)
 
 
 def ensure_device_id() -> str:
-    config = load_config()
-    section = _get_paywall_section(config)
-    device_id = section.get("device_id")
-    if not isinstance(device_id, str) or not device_id.strip():
-        device_id = str(uuid.uuid4())
-        section["device_id"] = device_id
-        save_config(config)
-    return device_id
+    device_id = _peek_paywall_section().get("device_id")
+    if isinstance(device_id, str) and device_id.strip():
+        return device_id
+
+    def apply(section: Dict[str, Any]) -> str:
+        current = section.get("device_id")
+        if isinstance(current, str) and current.strip():
+            return current
+        section["device_id"] = str(uuid.uuid4())
+        return section["device_id"]
+
+    return _mutate_section(apply)
 
 
 def get_identity() -> PaywallIdentity:
-    config = load_config()
-    section = _get_paywall_section(config)
+    section = _peek_paywall_section()
     device_id = section.get("device_id")
     if not isinstance(device_id, str) or not device_id.strip():
         device_id = ensure_device_id()
-        section = _get_paywall_section(load_config())
+        section = _peek_paywall_section()
     subject_id = section.get("subject_id")
     access_token = section.get("access_token")
     return PaywallIdentity(
@@ -92,35 +203,35 @@ def get_identity() -> PaywallIdentity:
 
 
 def update_identity(subject_id: str, access_token: str) -> None:
-    config = load_config()
-    section = _get_paywall_section(config)
-    section["subject_id"] = subject_id
-    section["access_token"] = access_token
-    save_config(config)
+    def apply(section: Dict[str, Any]) -> None:
+        section["subject_id"] = subject_id
+        section["access_token"] = access_token
+
+    _mutate_section(apply)
 
 
 def reset_identity() -> None:
-    config = load_config()
-    section = _get_paywall_section(config)
-    section.pop("subject_id", None)
-    section.pop("access_token", None)
-    save_config(config)
+    def apply(section: Dict[str, Any]) -> None:
+        section.pop("subject_id", None)
+        section.pop("access_token", None)
+
+    _mutate_section(apply)
 
 
 def save_balance(free_remaining: int, paid_credits: int) -> None:
-    config = load_config()
-    section = _get_paywall_section(config)
-    section["balance"] = {
+    balance = {
         "free_remaining": int(free_remaining),
         "paid_credits": int(paid_credits),
     }
-    save_config(config)
+
+    def apply(section: Dict[str, Any]) -> None:
+        section["balance"] = balance
+
+    _mutate_section(apply)
 
 
 def load_balance() -> Optional[Tuple[int, int]]:
-    config = load_config()
-    section = _get_paywall_section(config)
-    balance = section.get("balance")
+    balance = _peek_paywall_section().get("balance")
     if not isinstance(balance, dict):
         return None
     free_remaining = balance.get("free_remaining")
@@ -131,19 +242,17 @@ def load_balance() -> Optional[Tuple[int, int]]:
 
 
 def load_pending_consumptions() -> List[Dict[str, Any]]:
-    config = load_config()
-    section = _get_paywall_section(config)
-    pending = section.get("pending_consumptions")
+    pending = _peek_paywall_section().get("pending_consumptions")
     if isinstance(pending, list):
-        return [item for item in pending if isinstance(item, dict)]
+        return [dict(item) for item in pending if isinstance(item, dict)]
     return []
 
 
 def save_pending_consumptions(pending: List[Dict[str, Any]]) -> None:
-    config = load_config()
-    section = _get_paywall_section(config)
-    section["pending_consumptions"] = pending
-    save_config(config)
+    def apply(section: Dict[str, Any]) -> None:
+        section["pending_consumptions"] = pending
+
+    _mutate_section(apply)
 
 
 def add_pending_consumption(action: str, cost: int) -> str:
@@ -180,7 +289,8 @@ def is_offline_enabled() -> bool:
     return _is_truthy(os.environ.get("PAYWALL_OFFLINE"))
 
 
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+
 def _is_truthy(value: Optional[str]) -> bool:
-    if not value:
-        return False
-    return value.strip().lower() in {"1", "true", "yes", "on"}
+    return bool(value) and value.strip().lower() in _TRUTHY
@@ -53,6 +53,11 @@ class OBDScannerAdapter(ScannerPort):
     def set_port(self, port: str) -> None:
         self._scanner.elm.port = port
 
+    def set_fast_responses(self, enabled: bool, headers_off: bool = False, frame_hints: bool = False) -> None:
+        self._scanner.fast_responses = enabled
+        self._scanner.headers_off = headers_off
+        self._scanner.frame_hints = frame_hints
+
     def set_manufacturer(self, manufacturer: str) -> None:
         self._scanner.set_manufacturer(manufacturer)
 
@@ -107,8 +112,8 @@ class OBDScannerAdapter(ScannerPort):
     def read_live_data(self, pids: Optional[List[str]] = None) -> Dict[str, Any]:
         try:
             if pids is None:
-                return self._scanner.read_live_data()
-            return self._scanner.read_live_data(pids)
+                return self._scanner.read_live_data_batched()
+            return self._scanner.read_live_data_batched(pids)
         except Exception as exc:
             _raise_domain_scanner_error(exc)
             raise
@@ -251,8 +256,8 @@ class DtcDatabaseAdapter(DtcLookupPort):
     def lookup(self, code: str) -> Optional[Dict[str, Any]]:
         return self._db.lookup(code)
 
-    def search(self, text: str) -> List[Dict[str, Any]]:
-        return self._db.search(text)
+    def search(self, text: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        return self._db.search(text, limit=limit)
 
 
 class DtcDatabaseFactoryImpl(DtcDatabaseFactory):
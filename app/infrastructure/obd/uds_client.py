@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from obd.uds.client import UdsClient
 from obd.uds.exceptions import UdsNegativeResponse, UdsResponseError
@@ -20,6 +20,12 @@ class UdsClientAdapter(UdsClientPort):
         except (UdsNegativeResponse, UdsResponseError) as exc:
             raise UdsError(str(exc)) from exc
 
+    def read_dids(self, brand: str, dids: List[str]) -> List[Dict[str, Any]]:
+        try:
+            return self._client.read_dids(brand, dids)
+        except (UdsNegativeResponse, UdsResponseError) as exc:
+            raise UdsError(str(exc)) from exc
+
     def send_raw(self, service_id: int, data: bytes, *, raise_on_negative: bool = False) -> bytes:
         try:
             return self._client.send_raw(service_id, data, raise_on_negative=raise_on_negative)
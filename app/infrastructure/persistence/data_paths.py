@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 
@@ -45,5 +46,10 @@ def vin_cache_path() -> Path:
     return data_dir() / "vin_cache.json"
 
 
+def cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME")
+    return (Path(base) if base else Path.home() / ".cache") / "obd2py"
+
+
 def settings_path() -> Path:
     return data_dir() / "cli_settings.json"
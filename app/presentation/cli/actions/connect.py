@@ -113,6 +113,10 @@ def connect_vehicle(state: AppState, *, auto: bool = False, mode: str = "auto")
     ports = list(usb_ports)
     if selected_ble and selected_ble not in ports:
         ports.append(selected_ble)
+    # Warm start: the adapter usually sits on the port that worked last time
+    if state.last_port in ports and ports[0] != state.last_port:
+        ports.remove(state.last_port)
+        ports.insert(0, state.last_port)
 
     if not ports:
         if not usb_ports and scan_ble not in {"y", "yes", "s", "si"}:
@@ -148,9 +152,7 @@ def connect_vehicle(state: AppState, *, auto: bool = False, mode: str = "auto")
             print(f"  {t('transport')}: {transport}")
             if transport != t("transport_serial"):
                 print(f"  ✅ {t('bluetooth_ok')}")
-            if port.lower().startswith("ble:"):
-                state.last_ble_address = port.split(":", 1)[1]
-                get_container().settings.save()
+            _remember_port(state, port)
             state.clear_kline_scanner()
 
             if info:
@@ -189,9 +191,7 @@ def connect_vehicle(state: AppState, *, auto: bool = False, mode: str = "auto")
                         transport = _transport_label(port, is_bt)
                         print(f"  {t('transport')}: {transport}")
                         print(f"  ✅ {t('bluetooth_ok')}")
-                        if port.lower().startswith("ble:"):
-                            state.last_ble_address = port.split(":", 1)[1]
-                            get_container().settings.save()
+                        _remember_port(state, port)
                         state.clear_kline_scanner()
                         return True
                     except Exception:
@@ -200,6 +200,9 @@ def connect_vehicle(state: AppState, *, auto: bool = False, mode: str = "auto")
                 scanner.disconnect()
             except Exception:
                 pass
+            if port == state.last_port:
+                state.last_port = None
+                get_container().settings.save()
 
             if port.lower().startswith("ble:"):
                 continue
@@ -219,6 +222,13 @@ def disconnect_vehicle(state: AppState) -> None:
     print(f"\n  🔌 {t('disconnected_at', time=cr_timestamp())}")
 
 
+def _remember_port(state: AppState, port: str) -> None:
+    state.last_port = port
+    if port.lower().startswith("ble:"):
+        state.last_ble_address = port.split(":", 1)[1]
+    get_container().settings.save()
+
+
 def _try_kline(state: AppState, port: str) -> bool:
     print(f"\n  ⚙️  {t('kline_trying')}")
     kline_scanner, info, err = get_container().connection.try_kline(port)
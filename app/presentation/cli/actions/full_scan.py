@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from datetime import datetime, timezone
 
 from app.application.time_utils import cr_timestamp
@@ -10,6 +11,22 @@ from app.bootstrap import get_container
 from app.presentation.cli.i18n import t
 from app.application.state import AppState
 from app.presentation.cli.ui import print_header, print_subheader, handle_disconnection
+# Reported by read_readiness() alongside the monitors; the scan shows MIL separately
+from obd.obd2.readiness import MIL_MONITOR
+
+_DTC_EMOJI = {"stored": "🚨"}
+
+_INFO_TEMPLATE = (
+    "  {elm_label}: {elm_version}\n"
+    "  {protocol_label}: {protocol}\n"
+    "  {mil_label}: {mil_on}\n"
+    "  {dtc_label}: {dtc_count}"
+)
+
+
+class _UnknownDefault(dict):
+    def __missing__(self, key: str) -> str:
+        return "unknown"
 
 
 def run_full_scan(state: AppState) -> None:
@@ -23,6 +40,10 @@ def run_full_scan(state: AppState) -> None:
         print(line)
         lines.append(line)
 
+    def emit_block(block: list) -> None:
+        sys.stdout.write("\n".join(block) + "\n")
+        lines.extend(block)
+
     def subheader(title: str) -> None:
         print_subheader(title)
         lines.append("-" * 40)
@@ -44,20 +65,26 @@ def run_full_scan(state: AppState) -> None:
     try:
         subheader(t("vehicle_connection"))
         info = scan_service.get_vehicle_info()
-        emit(f"  {t('elm_version')}: {info.get('elm_version', 'unknown')}")
-        emit(f"  {t('protocol')}: {info.get('protocol', 'unknown')}")
-        emit(f"  {t('mil_status')}: {info.get('mil_on', 'unknown')}")
-        emit(f"  {t('dtc_count')}: {info.get('dtc_count', 'unknown')}")
+        info_text = _INFO_TEMPLATE.format_map(
+            _UnknownDefault(
+                info,
+                elm_label=t("elm_version"),
+                protocol_label=t("protocol"),
+                mil_label=t("mil_status"),
+                dtc_label=t("dtc_count"),
+            )
+        )
+        emit_block(info_text.split("\n"))
 
         subheader(t("dtc_header"))
         dtcs = scan_service.read_dtcs()
         if dtcs:
+            block = []
             for dtc in dtcs:
-                emoji = "🚨" if dtc.status == "stored" else "⚠️"
+                emoji = _DTC_EMOJI.get(dtc.status, "⚠️")
                 status = f" ({dtc.status})" if dtc.status != "stored" else ""
-                emit(f"")
-                emit(f"  {emoji} {dtc.code}{status}")
-                emit(f"     └─ {dtc.description}")
+                block += ("", f"  {emoji} {dtc.code}{status}", f"     └─ {dtc.description}")
+            emit_block(block)
         else:
             emit(f"")
             emit(f"  ✅ {t('no_codes')}")
@@ -66,9 +93,8 @@ def run_full_scan(state: AppState) -> None:
         readiness = scan_service.read_readiness()
         if readiness:
             complete = incomplete = 0
-            for name, status in readiness.items():
-                if name == "MIL (Check Engine Light)":
-                    continue
+            monitors = ((name, status) for name, status in readiness.items() if name != MIL_MONITOR)
+            for name, status in monitors:
                 if not status.available:
                     emoji = "➖"
                 elif status.complete:
@@ -84,6 +110,9 @@ def run_full_scan(state: AppState) -> None:
         subheader(t("live_header"))
         readings = scan_service.read_live_data()
         if readings:
+            warn_high_temp = t("warning_high_temp")
+            warn_low_temp = t("warning_low_temp")
+            warn_throttle = t("warning_throttle")
             for reading in readings.values():
                 emit(f"")
                 emit(f"  📈 {reading.name}")
@@ -91,11 +120,11 @@ def run_full_scan(state: AppState) -> None:
 
                 if reading.name == "Engine Coolant Temperature":
                     if reading.value > 105:
-                        emit(f"     🔥 {t('warning_high_temp')}")
+                        emit(f"     🔥 {warn_high_temp}")
                     elif reading.value < 70:
-                        emit(f"     ⚠️  {t('warning_low_temp')}")
+                        emit(f"     ⚠️  {warn_low_temp}")
                 elif "Throttle" in reading.name and reading.value > 5:
-                    emit(f"     ⚠️  {t('warning_throttle')}")
+                    emit(f"     ⚠️  {warn_throttle}")
 
         emit("")
         emit("=" * 60)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import signal
 import time
+from typing import Any, Dict, Optional
 
 from app.application.time_utils import cr_timestamp, cr_time_only
 from app.domain.entities import ConnectionLostError, NotConnectedError, ScannerError
@@ -12,6 +13,33 @@ from app.presentation.cli.i18n import t
 from app.application.state import AppState
 from app.presentation.cli.ui import handle_disconnection, print_header
 
+# Coolant, RPM, speed, throttle, pedal, module voltage (one batched query)
+MONITOR_PIDS = ["05", "0C", "0D", "11", "49", "42"]
+
+# Floor for the poll tick, so a zero interval cannot turn the loop into a spin
+MIN_TICK_S = 0.05
+
+
+def _period_ms(rate_hz: Optional[float]) -> int:
+    if not rate_hz or rate_hz <= 0:
+        return 0
+    return int(1000 / rate_hz)
+
+
+def _poll_periods_ms(state: AppState) -> Dict[str, int]:
+    # PIDs without a rate of their own are polled every monitor_interval
+    default_ms = max(0, int(state.monitor_interval * 1000))
+    return {pid: _period_ms(state.pid_rate_hz.get(pid)) or default_ms for pid in MONITOR_PIDS}
+
+
+def _wait_for_tick(next_tick: float, tick_s: float) -> float:
+    next_tick += tick_s
+    delay = next_tick - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+        return next_tick
+    return time.monotonic()
+
 
 def _signal_handler(sig, frame, state: AppState) -> None:
     state.stop_monitoring = True
@@ -39,7 +67,12 @@ def live_monitor(state: AppState) -> None:
 
         print_header(t("live_telemetry"))
         print(f"  {t('started')}: {cr_timestamp()}")
-        print(f"  {t('refresh')}: {state.monitor_interval}s")
+        # Per-PID poll period (ms); the loop ticks at the fastest one, while
+        # rows are printed at most once per monitor_interval
+        period_ms = _poll_periods_ms(state)
+        tick_s = max(MIN_TICK_S, min(period_ms.values()) / 1000)
+        refresh_ms = max(int(tick_s * 1000), int(state.monitor_interval * 1000))
+        print(f"  {t('refresh')}: {refresh_ms / 1000:g}s")
         print(f"\n  {t('press_ctrl_c')}\n")
         print("-" * 70)
         print(
@@ -48,12 +81,39 @@ def live_monitor(state: AppState) -> None:
         )
         print("-" * 70)
 
-        pids = ["05", "0C", "0D", "11", "49", "42"]
+        scans = get_container().scans
+        # Slow PIDs skip ticks and keep their last value on screen; only the
+        # samples read on a tick are logged
+        last_sent: Dict[str, int] = {}
+        readings: Dict[str, Any] = {}
+        last_print_ms: Optional[int] = None
+        # Fixed-rate schedule: the interval includes the ECU round-trip instead of adding to it
+        next_tick = time.monotonic()
         while not state.stop_monitoring:
             try:
-                readings = get_container().scans.read_live_data(pids)
+                now_ms = int(time.monotonic() * 1000)
+                due = [
+                    pid
+                    for pid in MONITOR_PIDS
+                    if pid not in last_sent or now_ms - last_sent[pid] >= period_ms[pid]
+                ]
+                fresh = scans.read_live_data(due) if due else {}
+                for pid in due:
+                    last_sent[pid] = now_ms
+                    if pid in fresh:
+                        readings[pid] = fresh[pid]
+                    else:
+                        # Asked for and not answered: the old value is no longer current
+                        readings.pop(pid, None)
+                if not fresh:
+                    next_tick = _wait_for_tick(next_tick, tick_s)
+                    continue
                 if logger:
-                    logger.log_readings(readings)
+                    logger.log_readings(fresh)
+                if last_print_ms is not None and now_ms - last_print_ms < refresh_ms:
+                    next_tick = _wait_for_tick(next_tick, tick_s)
+                    continue
+                last_print_ms = now_ms
 
                 coolant = readings.get("05")
                 rpm = readings.get("0C")
@@ -74,7 +134,7 @@ def live_monitor(state: AppState) -> None:
                     f"{time_str:<10} {coolant_str:<10} {rpm_str:<8} {speed_str:<8} "
                     f"{throttle_str:<10} {pedal_str:<8} {volts_str:<8}"
                 )
-                time.sleep(state.monitor_interval)
+                next_tick = _wait_for_tick(next_tick, tick_s)
             except ConnectionLostError:
                 handle_disconnection(state)
                 break
@@ -23,8 +23,8 @@ def lookup_code(state: AppState) -> None:
         print(f"     └─ {t('source')}: {info.source}")
     else:
         print(f"\n  ❌ {t('code_not_found', code=code)}")
-        results = dtc_db.search(code)
+        results = dtc_db.search(code, limit=5)
         if results:
             print(f"\n  {t('similar_codes')}:")
-            for result in results[:5]:
+            for result in results:
                 print(f"    {result.code}: {result.description}")
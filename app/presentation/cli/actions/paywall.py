@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import webbrowser
+from functools import lru_cache
 
 from app.bootstrap import get_container
 from app.domain.entities import ExternalServiceError, PaymentRequiredError
@@ -8,6 +9,14 @@ from app.presentation.cli.i18n import t
 from app.presentation.cli.ui import clear_screen, press_enter, print_header, print_menu
 
 
+# Static menu entries (option, i18n key); 1-3 get their current value appended
+_STATIC_ITEMS = (
+    ("4", "paywall_checkout"),
+    ("5", "paywall_reset_identity"),
+    ("0", "back"),
+)
+
+
 def paywall_menu() -> None:
     while True:
         clear_screen()
@@ -28,9 +37,7 @@ def paywall_menu() -> None:
                 ("1", f"{t('paywall_api_base')}: {api_base}"),
                 ("2", f"{t('paywall_subject_id')}: {subject_id}"),
                 ("3", balance_label),
-                ("4", t("paywall_checkout")),
-                ("5", t("paywall_reset_identity")),
-                ("0", t("back")),
+                *[(option, t(key)) for option, key in _STATIC_ITEMS],
             ],
         )
         choice = input(f"\n  {t('select_option')}: ").strip()
@@ -127,6 +134,7 @@ def _start_checkout() -> None:
     press_enter()
 
 
+@lru_cache(maxsize=64)
 def _short_id(value: str) -> str:
     if len(value) <= 8:
         return value
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import sys
+
 from app.application.time_utils import cr_timestamp
 from app.domain.entities import ConnectionLostError, NotConnectedError, ScannerError
 
@@ -21,9 +23,11 @@ def read_codes(state: AppState) -> None:
     try:
         dtcs = get_container().scans.read_dtcs()
         if dtcs:
+            rows = []
             for dtc in dtcs:
                 status = f" [{dtc.status}]" if dtc.status != "stored" else ""
-                print(f"  {dtc.code}{status}: {dtc.description}")
+                rows.append(f"  {dtc.code}{status}: {dtc.description}\n")
+            sys.stdout.write("".join(rows))
         else:
             print(f"  ✅ {t('no_codes')}")
     except ConnectionLostError:
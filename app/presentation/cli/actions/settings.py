@@ -27,6 +27,9 @@ def settings_menu(state: AppState) -> None:
                 ("8", t("paywall_settings")),
                 ("9", t("disconnect_now")),
                 ("10", t("full_scan_reports")),
+                ("11", f"{t('elm_fast_responses'):<20} [{t('on') if state.elm_fast_responses else t('off')}]"),
+                ("12", f"{t('elm_headers_off'):<20} [{t('on') if state.elm_headers_off else t('off')}]"),
+                ("13", f"{t('elm_frame_hints'):<20} [{t('on') if state.elm_frame_hints else t('off')}]"),
                 ("0", t("back")),
             ],
         )
@@ -131,6 +134,27 @@ def settings_menu(state: AppState) -> None:
         elif choice == "10":
             show_full_scan_reports()
             press_enter()
+        elif choice == "11":
+            state.elm_fast_responses = not state.elm_fast_responses
+            status = t("on") if state.elm_fast_responses else t("off")
+            print(f"\n  ✅ {t('set_to', value=status)}")
+            print(f"     {t('elm_applies_on_reconnect')}")
+            get_container().settings.save()
+            press_enter()
+        elif choice == "12":
+            state.elm_headers_off = not state.elm_headers_off
+            status = t("on") if state.elm_headers_off else t("off")
+            print(f"\n  ✅ {t('set_to', value=status)}")
+            print(f"     {t('elm_applies_on_reconnect')}")
+            get_container().settings.save()
+            press_enter()
+        elif choice == "13":
+            state.elm_frame_hints = not state.elm_frame_hints
+            status = t("on") if state.elm_frame_hints else t("off")
+            print(f"\n  ✅ {t('set_to', value=status)}")
+            print(f"     {t('elm_applies_on_reconnect')}")
+            get_container().settings.save()
+            press_enter()
         elif choice == "0":
             break
 
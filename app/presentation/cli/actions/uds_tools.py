@@ -39,12 +39,13 @@ def _select_module(state: AppState, brand: str) -> Optional[Dict[str, Any]]:
     cached = _cached_map_for_state(state)
     if cached:
         proto = cached.get("protocol") or "6"
+        cached_tag = t("uds_cached_tag")
         for mod in cached.get("modules", []):
             tx = mod.get("tx_id")
             rx = mod.get("rx_id")
             mtype = mod.get("module_type") or ""
             suffix = f" · {mtype}" if mtype else ""
-            label = f"{t('uds_cached_tag')} · {tx}->{rx}{suffix}"
+            label = f"{cached_tag} · {tx}->{rx}{suffix}"
             entries.append(
                 {
                     "kind": "cached",
@@ -151,12 +152,19 @@ def _read_vin(client, brand: str) -> None:
 
 
 def _read_did(client, brand: str) -> None:
-    did = input(f"\n  {t('uds_read_did')} (e.g., F190): ").strip()
-    if not did:
+    raw = input(f"\n  {t('uds_read_did')} (e.g., F190 F187): ").strip()
+    dids = raw.replace(",", " ").split()
+    if not dids:
         return
     try:
-        info = client.read_did(brand, did)
-        _print_did_response(info)
+        if len(dids) == 1:
+            _print_did_response(client.read_did(brand, dids[0]))
+            return
+        for info in client.read_dids(brand, dids):
+            if info.get("error"):
+                print(f"\n  ❌ {info.get('did')}: {info.get('error')}")
+            else:
+                _print_did_response(info)
     except UdsError as exc:
         print(f"\n  ❌ {t('error')}: {exc}")
 
@@ -275,23 +283,29 @@ def _discover_modules(state: AppState) -> None:
     if vin:
         print(f"  {t('uds_discovery_vin')}: {vin}")
 
+    label_responses = t("uds_discovery_responses")
+    label_alt_tx = t("uds_discovery_alt_tx")
+    label_type = t("uds_discovery_type")
+    label_dtcs = t("uds_discovery_dtcs_summary")
+    label_security = t("uds_discovery_security")
+    label_confidence = t("uds_discovery_confidence")
     for mod in modules:
         print(f"\n  - TX {mod.tx_id} -> RX {mod.rx_id}")
         if mod.responses:
-            print(f"    {t('uds_discovery_responses')}: {', '.join(mod.responses)}")
+            print(f"    {label_responses}: {', '.join(mod.responses)}")
         if mod.alt_tx_ids:
-            print(f"    {t('uds_discovery_alt_tx')}: {', '.join(mod.alt_tx_ids)}")
+            print(f"    {label_alt_tx}: {', '.join(mod.alt_tx_ids)}")
         if mod.fingerprint.get("vin"):
             print(f"    VIN: {mod.fingerprint.get('vin')}")
         if mod.module_type:
-            print(f"    {t('uds_discovery_type')}: {mod.module_type}")
+            print(f"    {label_type}: {mod.module_type}")
         if mod.fingerprint.get("dtc_summary"):
             summary = mod.fingerprint.get("dtc_summary") or {}
             counts = " ".join(f"{k}:{v}" for k, v in summary.items())
-            print(f"    {t('uds_discovery_dtcs_summary')}: {counts}")
+            print(f"    {label_dtcs}: {counts}")
         if mod.requires_security:
-            print(f"    {t('uds_discovery_security')}")
-        print(f"    {t('uds_discovery_confidence')}: {mod.confidence}")
+            print(f"    {label_security}")
+        print(f"    {label_confidence}: {mod.confidence}")
 
 
 def _parse_timeout(value: str) -> float:
@@ -321,17 +335,21 @@ def _print_cached_map(cached: Dict[str, Any]) -> None:
     proto = cached.get("protocol") or "?"
     addressing = cached.get("addressing") or "?"
     print(f"  {t('uds_discovery_protocol')}: {proto} ({addressing})")
+    label_type = t("uds_discovery_type")
+    label_dtcs = t("uds_discovery_dtcs_summary")
+    label_responses = t("uds_discovery_responses")
+    label_security = t("uds_discovery_security")
     for mod in modules:
         tx = mod.get("tx_id")
         rx = mod.get("rx_id")
         print(f"\n  - TX {tx} -> RX {rx}")
         if mod.get("module_type"):
-            print(f"    {t('uds_discovery_type')}: {mod.get('module_type')}")
+            print(f"    {label_type}: {mod.get('module_type')}")
         if mod.get("fingerprint", {}).get("dtc_summary"):
             summary = mod.get("fingerprint", {}).get("dtc_summary") or {}
             counts = " ".join(f"{k}:{v}" for k, v in summary.items())
-            print(f"    {t('uds_discovery_dtcs_summary')}: {counts}")
+            print(f"    {label_dtcs}: {counts}")
         if mod.get("responses"):
-            print(f"    {t('uds_discovery_responses')}: {', '.join(mod.get('responses'))}")
+            print(f"    {label_responses}: {', '.join(mod.get('responses'))}")
         if mod.get("requires_security"):
-            print(f"    {t('uds_discovery_security')}")
+            print(f"    {label_security}")
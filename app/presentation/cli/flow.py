@@ -15,7 +15,7 @@ from app.presentation.cli.actions.readiness import read_readiness
 from app.presentation.cli.actions.search import search_codes
 from app.presentation.cli.actions.settings import settings_menu
 from app.presentation.cli.actions.uds_tools import uds_tools_menu
-from app.presentation.cli.i18n import get_available_languages, set_language, t
+from app.presentation.cli.i18n import get_available_languages, get_language, set_language, t
 from app.application.state import AppState
 from app.presentation.cli.ui import clear_screen, press_enter, print_header, print_menu, print_status
 from app.bootstrap import get_container
@@ -163,63 +163,55 @@ def _normalize_label(value: str) -> str:
     )
 
 
+# (choice, label key, action, pause after)
+MAIN_MENU_ITEMS = (
+    ("1", "full_scan", run_full_scan, True),
+    ("2", "read_codes", read_codes, True),
+    ("3", "live_monitor", live_monitor, True),
+    ("4", "freeze_frame", read_freeze_frame, True),
+    ("5", "readiness", read_readiness, True),
+    ("6", "clear_codes", clear_codes, True),
+    ("7", "lookup", lookup_code, True),
+    ("8", "search", search_codes, True),
+    ("9", "uds_tools", uds_tools_menu, False),
+    ("10", "ai_report", ai_report_menu, False),
+    ("S", "settings", settings_menu, False),
+)
+MAIN_MENU_ACTIONS = {key: (action, pause) for key, _label, action, pause in MAIN_MENU_ITEMS}
+
+
+def _main_menu_screen() -> tuple[str, str, list[tuple[str, str]], str]:
+    banner = (
+        f"\n  ╔════════════════════════════════════════════════════════╗\n"
+        f"  ║           {t('app_name')} {VERSION:<23} ║\n"
+        f"  ╚════════════════════════════════════════════════════════╝"
+    )
+    options = [(key, t(label)) for key, label, _action, _pause in MAIN_MENU_ITEMS]
+    options.append(("0", t("exit")))
+    return banner, t("main_menu"), options, f"\n  {t('select_option')}: "
+
+
 def main_menu(state: AppState) -> None:
     state.ensure_dtc_db()
+    # Translated labels only change with the language (settings menu can switch it)
+    screen_lang = get_language()
+    banner, title, options, prompt = _main_menu_screen()
     while True:
+        if get_language() != screen_lang:
+            screen_lang = get_language()
+            banner, title, options, prompt = _main_menu_screen()
         clear_screen()
-        print(f"\n  ╔════════════════════════════════════════════════════════╗")
-        print(f"  ║           {t('app_name')} {VERSION:<23} ║")
-        print(f"  ╚════════════════════════════════════════════════════════╝")
+        print(banner)
         print_status(state)
-        print_menu(
-            t("main_menu"),
-            [
-                ("1", t("full_scan")),
-                ("2", t("read_codes")),
-                ("3", t("live_monitor")),
-                ("4", t("freeze_frame")),
-                ("5", t("readiness")),
-                ("6", t("clear_codes")),
-                ("7", t("lookup")),
-                ("8", t("search")),
-                ("9", t("uds_tools")),
-                ("10", t("ai_report")),
-                ("S", t("settings")),
-                ("0", t("exit")),
-            ],
-        )
-
-        choice = input(f"\n  {t('select_option')}: ").strip().upper()
-        if choice == "1":
-            run_full_scan(state)
-            press_enter()
-        elif choice == "2":
-            read_codes(state)
-            press_enter()
-        elif choice == "3":
-            live_monitor(state)
-            press_enter()
-        elif choice == "4":
-            read_freeze_frame(state)
-            press_enter()
-        elif choice == "5":
-            read_readiness(state)
-            press_enter()
-        elif choice == "6":
-            clear_codes(state)
-            press_enter()
-        elif choice == "7":
-            lookup_code(state)
-            press_enter()
-        elif choice == "8":
-            search_codes(state)
-            press_enter()
-        elif choice == "9":
-            uds_tools_menu(state)
-        elif choice == "10":
-            ai_report_menu(state)
-        elif choice == "S":
-            settings_menu(state)
+        print_menu(title, options)
+
+        choice = input(prompt).strip().upper()
+        entry = MAIN_MENU_ACTIONS.get(choice)
+        if entry:
+            action, pause = entry
+            action(state)
+            if pause:
+                press_enter()
         elif choice == "0":
             if state.active_scanner():
                 state.disconnect_all()
@@ -1,13 +1,22 @@
 from __future__ import annotations
 
 import os
+import sys
 from typing import List, Tuple
 
 from .i18n import t, get_language
 from app.application.state import AppState
 
 
+# Checked once: ANSI-capable terminals get the escape sequence instead of a clear/cls subprocess
+_ANSI_CLEAR = sys.stdout.isatty() and os.environ.get("TERM") not in (None, "", "dumb")
+
+
 def clear_screen() -> None:
+    if _ANSI_CLEAR:
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
+        return
     os.system("cls" if os.name == "nt" else "clear")
 
 
@@ -15,25 +24,24 @@ def press_enter() -> None:
     input(f"\n  {t('press_enter')}")
 
 
+_HEADER_RULE = "=" * 60
+_SUBHEADER_RULE = "-" * 40
+_MENU_TOP = "╔" + "═" * 58 + "╗"
+_MENU_SEP = "╠" + "═" * 58 + "╣"
+_MENU_BOTTOM = "╚" + "═" * 58 + "╝"
+
+
 def print_header(title: str) -> None:
-    print("\n" + "=" * 60)
-    print(f"  {title}")
-    print("=" * 60)
+    sys.stdout.write(f"\n{_HEADER_RULE}\n  {title}\n{_HEADER_RULE}\n")
 
 
 def print_subheader(title: str) -> None:
-    print("\n" + "-" * 40)
-    print(f"  {title}")
-    print("-" * 40)
+    sys.stdout.write(f"\n{_SUBHEADER_RULE}\n  {title}\n{_SUBHEADER_RULE}\n")
 
 
 def print_menu(title: str, options: List[Tuple[str, str]]) -> None:
-    print("\n" + "╔" + "═" * 58 + "╗")
-    print(f"║  {title:<55} ║")
-    print("╠" + "═" * 58 + "╣")
-    for num, text in options:
-        print(f"║  {num}. {text:<53} ║")
-    print("╚" + "═" * 58 + "╝")
+    rows = "".join(f"║  {num}. {text:<53} ║\n" for num, text in options)
+    sys.stdout.write(f"\n{_MENU_TOP}\n║  {title:<55} ║\n{_MENU_SEP}\n{rows}{_MENU_BOTTOM}\n")
 
 
 def print_status(state: AppState) -> None:
@@ -45,9 +53,9 @@ def print_status(state: AppState) -> None:
     vin_label = ""
     if state.last_vin:
         vin_label = f" | {t('vin_label')}: {state.last_vin}"
-    print(
+    sys.stdout.write(
         f"\n  {t('status')}: {conn_status} | {t('vehicle')}: {mfr}{vin_label} | "
-        f"{t('format')}: {state.log_format.upper()} | {t('protocol')}: {protocol} | {lang}"
+        f"{t('format')}: {state.log_format.upper()} | {t('protocol')}: {protocol} | {lang}\n"
     )
 
 
@@ -7,6 +7,8 @@ from .pids import (
     OBDPid,
     PIDS,
     decode_pid_response,
+    decode_pid_response_bytes,
+    decode_pid_responses,
     get_pid_info,
     list_available_pids,
     DIAGNOSTIC_PIDS,
@@ -27,6 +29,8 @@ __all__ = [
     "OBDPid",
     "PIDS",
     "decode_pid_response",
+    "decode_pid_response_bytes",
+    "decode_pid_responses",
     "get_pid_info",
     "list_available_pids",
     "DIAGNOSTIC_PIDS",
@@ -5,7 +5,7 @@ from .compat import (
     supports_classic_serial,
     supports_ble,
 )
-from .ports import find_bluetooth_ports, is_bluetooth_port_info
+from .ports import clear_port_cache, find_bluetooth_ports, is_bluetooth_port_info, list_serial_ports
 
 __all__ = [
     "platform_name",
@@ -15,4 +15,6 @@ __all__ = [
     "supports_ble",
     "find_bluetooth_ports",
     "is_bluetooth_port_info",
+    "list_serial_ports",
+    "clear_port_cache",
 ]
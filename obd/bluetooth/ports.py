@@ -1,19 +1,52 @@
 from __future__ import annotations
 
 import glob
-from typing import Iterable, List, Optional, Tuple
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import serial.tools.list_ports
 
+PORT_CACHE_TTL_S = 5.0
+
+_port_cache: Dict[str, Tuple[float, List[Any]]] = {}
+_port_cache_lock = threading.Lock()
+
+
+def _cached(key: str, fetch: Callable[[], Iterable[Any]]) -> List[Any]:
+    now = time.monotonic()
+    with _port_cache_lock:
+        hit = _port_cache.get(key)
+        if hit is not None and now - hit[0] < PORT_CACHE_TTL_S:
+            return list(hit[1])
+    result = list(fetch())
+    if result:
+        # An empty list isn't kept: an adapter plugged in right after must show up
+        with _port_cache_lock:
+            _port_cache[key] = (now, result)
+    return list(result)
+
+
+def list_serial_ports() -> List[Any]:
+    """serial.tools.list_ports.comports(), reused for PORT_CACHE_TTL_S seconds."""
+    return _cached("comports", serial.tools.list_ports.comports)
+
+
+def clear_port_cache() -> None:
+    with _port_cache_lock:
+        _port_cache.clear()
+
+
+_BT_NEEDLES = ("bluetooth", "bthenum", "rfcomm")
+
 
 def is_bluetooth_port_info(
     device: Optional[str],
     description: Optional[str],
     hwid: Optional[str],
 ) -> bool:
-    dev = (device or "").lower()
-    desc = (description or "").lower()
-    hw = (hwid or "").lower()
+    blob = f"{device or ''}\0{description or ''}\0{hwid or ''}".lower()
+    dev = blob.partition("\0")[0]
 
     if "incoming-port" in dev:
         return False
@@ -21,23 +54,14 @@ def is_bluetooth_port_info(
     if dev.startswith("/dev/rfcomm"):
         return True
 
-    if "bluetooth" in desc or "bluetooth" in hw or "bluetooth" in dev:
-        return True
-
-    if "bthenum" in hw:
-        return True
-
-    if "rfcomm" in desc or "rfcomm" in hw:
-        return True
-
-    return False
+    return any(needle in blob for needle in _BT_NEEDLES)
 
 
 def find_bluetooth_ports() -> List[str]:
     ports: List[str] = []
 
     try:
-        ports_list = serial.tools.list_ports.comports()
+        ports_list = list_serial_ports()
     except Exception:
         ports_list = []
 
@@ -46,7 +70,7 @@ def find_bluetooth_ports() -> List[str]:
             if p.device:
                 ports.append(p.device)
 
-    for path in glob.glob("/dev/rfcomm*"):
+    for path in _cached("rfcomm", lambda: glob.glob("/dev/rfcomm*")):
         if path not in ports:
             ports.append(path)
 
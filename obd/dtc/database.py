@@ -1,11 +1,46 @@
 from __future__ import annotations
 
+import codecs
 import csv
+import hashlib
+import mmap
+import os
+import pickle
+import sys
+from collections import ChainMap
+from itertools import islice
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Any, Iterator, Mapping, Optional, List, Dict, Set, Tuple
 
 from .models import DTCInfo
-from .paths import data_dir
+from .paths import cache_dir, data_dir
+
+# Bump when the pickled layout changes so stale caches are ignored.
+CACHE_VERSION = 1
+
+# (code, description, source) as stored per row; DTCInfo is built on access
+_Row = Tuple[str, str, str]
+
+
+class _CodeMap(Mapping[str, DTCInfo]):
+    """Read-only DTCInfo view over the database's row tuples."""
+
+    __slots__ = ("_raw",)
+
+    def __init__(self, raw: Dict[str, _Row]):
+        self._raw = raw
+
+    def __getitem__(self, code: str) -> DTCInfo:
+        return DTCInfo(*self._raw[code])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __contains__(self, code: object) -> bool:
+        return code in self._raw
 
 
 class DTCDatabase:
@@ -18,20 +53,38 @@ class DTCDatabase:
         "jaguar": "dtc_land_rover.csv",
     }
 
+    # Parsed rows shared by every instance in the process:
+    # CSV path -> ((mtime_ns, size), rows). Rows are never mutated.
+    _FILE_CACHE: Dict[str, Tuple[Tuple[int, int], List[Tuple[str, str]]]] = {}
+    # Built code -> row layers, per (CSV path, source): ((mtime_ns, size), layer).
+    # Layers are shared between instances and never mutated.
+    _LAYER_CACHE: Dict[Tuple[str, str], Tuple[Tuple[int, int], Dict[str, _Row]]] = {}
+
     def __init__(self, manufacturer: Optional[str] = None):
-        self.codes: Dict[str, DTCInfo] = {}
+        # code -> (code, description, source), one layer per CSV with later
+        # files (the manufacturer) first; most rows are never looked up
+        self._raw: ChainMap[str, _Row] = ChainMap()
+        self.codes: Mapping[str, DTCInfo] = _CodeMap(self._raw)
         self.manufacturer = manufacturer
         self._loaded_files: List[str] = []
+        # Trigram index for search(), built on first use: trigram -> row positions
+        self._search_rows: List[_Row] = []
+        self._search_codes: List[str] = []
+        self._search_descs: List[str] = []
+        self._trigrams: Optional[Dict[str, Set[int]]] = None
+        self._cache_key: Optional[str] = None
+        self._count = 0
         self._load_databases()
 
-    def _load_databases(self) -> None:
+    def _source_files(self) -> List[Tuple[Path, str]]:
         dd = data_dir()
         if not dd.exists():
-            return
+            return []
 
+        sources: List[Tuple[Path, str]] = []
         generic_path = dd / "dtc_generic.csv"
         if generic_path.exists():
-            self._load_from_csv(generic_path, "generic")
+            sources.append((generic_path, "generic"))
 
         if self.manufacturer:
             mfr_lower = self.manufacturer.lower().replace(" ", "_")
@@ -39,7 +92,7 @@ class DTCDatabase:
             if filename:
                 p = dd / filename
                 if p.exists():
-                    self._load_from_csv(p, mfr_lower)
+                    sources.append((p, mfr_lower))
         else:
             loaded_files = set()
             for mfr_name, filename in self.MANUFACTURER_FILES.items():
@@ -47,65 +100,296 @@ class DTCDatabase:
                     continue
                 p = dd / filename
                 if p.exists():
-                    self._load_from_csv(p, mfr_name)
+                    sources.append((p, mfr_name))
                     loaded_files.add(filename)
+        return sources
 
-    def _load_from_csv(self, csv_path: Path, source: str) -> None:
+    def _load_databases(self) -> None:
+        sources = self._source_files()
+        # Rows are cached per CSV; the search index is cached per set of CSVs
+        self._cache_key = self._compute_cache_key(sources)
+        layers = [self._load_from_csv(path, source) for path, source in sources]
+        self._raw.maps[:] = [layer for layer in reversed(layers) if layer is not None] or [{}]
+        self._count = len(self._raw)
+
+    # ------------------------------------------------------------------
+    # On-disk cache (~/.cache/obd2py), keyed by CSV name/mtime/size
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _file_meta(csv_path: Path) -> Optional[Dict[str, Any]]:
         try:
-            with csv_path.open("r", encoding="utf-8-sig", newline="") as f:
-                self._loaded_files.append(csv_path.name)
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith("#"):
-                        continue
+            st = csv_path.stat()
+        except OSError:
+            return None
+        return {"file": csv_path.name, "mtime_ns": st.st_mtime_ns, "size": st.st_size}
 
-                    try:
-                        row = next(csv.reader([line]))
-                    except Exception:
-                        continue
+    @staticmethod
+    def _make_cache_key(identity: str, stamp: str) -> str:
+        # "<what>-<which version>": files sharing the first part are stale
+        # copies of the same cache and get pruned when a new one is written
+        ident = hashlib.blake2b(identity.encode(), digest_size=4).hexdigest()
+        version = hashlib.blake2b(f"v{CACHE_VERSION}|{stamp}".encode(), digest_size=16).hexdigest()
+        return f"{ident}-{version}"
 
-                    if len(row) < 2:
-                        continue
+    @classmethod
+    def _compute_cache_key(cls, sources: List[Tuple[Path, str]]) -> Optional[str]:
+        if not sources:
+            return None
+        names: List[str] = []
+        stamps: List[str] = []
+        for path, source in sources:
+            try:
+                st = path.stat()
+            except OSError:
+                return None
+            names.append(f"{path.name}:{source}")
+            stamps.append(f"{st.st_mtime_ns}:{st.st_size}")
+        return cls._make_cache_key("|".join(names), "|".join(stamps))
 
-                    code = row[0].strip().upper()
-                    desc = row[1].strip()
-                    if not code:
-                        continue
+    @staticmethod
+    def _cache_path(key: str, kind: str) -> Path:
+        return cache_dir() / f"dtc-{key}.{kind}.pkl"
 
-                    self.codes[code] = DTCInfo(code=code, description=desc, source=source)
+    @staticmethod
+    def _prune_cache(path: Path, key: str, kind: str) -> None:
+        ident = key.split("-", 1)[0]
+        for stale in path.parent.glob(f"dtc-{ident}-*.{kind}.pkl"):
+            if stale != path:
+                try:
+                    stale.unlink()
+                except OSError:
+                    pass
+
+    def _read_cache(self, key: str, kind: str) -> Any:
+        try:
+            with self._cache_path(key, kind).open("rb") as f:
+                return pickle.load(f)
+        except Exception:
+            return None
 
+    def _write_cache(self, key: str, kind: str, payload: Any) -> None:
+        path = self._cache_path(key, kind)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp.open("wb") as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+            self._prune_cache(path, key, kind)
+        except Exception:
+            # The cache is an optimisation; a read-only home must not break lookups
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+    def _load_from_csv(self, csv_path: Path, source: str) -> Optional[Dict[str, _Row]]:
+        meta = self._file_meta(csv_path)
+        if meta is None:
+            rows = self._parse_csv(csv_path)
+            if rows is None:
+                return None
+            self._loaded_files.append(csv_path.name)
+            return self._build_layer(rows, source)
+
+        stamp = (meta["mtime_ns"], meta["size"])
+        layer_key = (str(csv_path), source)
+        built = self._LAYER_CACHE.get(layer_key)
+        if built is None or built[0] != stamp:
+            rows = self._load_rows(csv_path, meta)
+            if rows is None:
+                return None
+            built = (stamp, self._build_layer(rows, source))
+            self._LAYER_CACHE[layer_key] = built
+        self._loaded_files.append(csv_path.name)
+        return built[1]
+
+    def _load_rows(self, csv_path: Path, meta: Dict[str, Any]) -> Optional[List[Tuple[str, str]]]:
+        stamp = (meta["mtime_ns"], meta["size"])
+        hit = self._FILE_CACHE.get(str(csv_path))
+        if hit is not None and hit[0] == stamp:
+            return hit[1]
+
+        key = self._make_cache_key(meta["file"], f"{meta['mtime_ns']}:{meta['size']}")
+        cached = self._read_cache(key, "rows")
+        if isinstance(cached, dict) and cached.get("meta") == meta:
+            try:
+                rows = [(code, desc) for code, desc in cached["rows"]]
+            except Exception:
+                rows = None
+            if rows is not None:
+                self._remember_rows(csv_path, meta, rows)
+                return rows
+
+        rows = self._parse_csv(csv_path)
+        if rows is not None:
+            self._remember_rows(csv_path, meta, rows)
+            self._write_cache(key, "rows", {"meta": meta, "rows": rows})
+        return rows
+
+    @classmethod
+    def _remember_rows(cls, csv_path: Path, meta: Dict[str, Any], rows: List[Tuple[str, str]]) -> None:
+        cls._FILE_CACHE[str(csv_path)] = ((meta["mtime_ns"], meta["size"]), rows)
+
+    @staticmethod
+    def _build_layer(rows: List[Tuple[str, str]], source: str) -> Dict[str, _Row]:
+        # One shared object per source name, code and repeated description
+        source = sys.intern(source)
+        layer: Dict[str, _Row] = {}
+        pool: Dict[str, str] = {}
+        intern = sys.intern
+        for code, desc in rows:
+            code = intern(code)
+            desc = pool.setdefault(desc, desc)
+            layer[code] = (code, desc, source)
+        return layer
+
+    @staticmethod
+    def _read_text(f: Any) -> str:
+        # Map the file and decode straight from the mapping in one call, with
+        # no intermediate bytes copy; skip the BOM some exports carry
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can't be mapped
+            return f.read().decode("utf-8-sig")
+        with mm, memoryview(mm) as view:
+            start = len(codecs.BOM_UTF8) if view[:3] == codecs.BOM_UTF8 else 0
+            return str(view[start:], "utf-8")
+
+    @staticmethod
+    def _parse_csv(csv_path: Path) -> Optional[List[Tuple[str, str]]]:
+        rows: List[Tuple[str, str]] = []
+        try:
+            with csv_path.open("rb") as f:
+                text = DTCDatabase._read_text(f)
+            append = rows.append
+            # Each line parses on its own, so a bad line (stray quote, oversized
+            # field) costs only that line; unquoted lines skip the csv module
+            for line in text.splitlines():
+                if '"' in line:
+                    try:
+                        row = next(csv.reader((line,)), [])
+                    except csv.Error:
+                        continue
+                else:
+                    row = line.split(",")
+                if len(row) < 2:
+                    continue
+                code = row[0].strip().upper()
+                if not code or code.startswith("#"):
+                    continue
+                append((code, row[1].strip()))
         except (OSError, IOError) as e:
             # No loggers aquí; dejar eso al caller si quiere
             print(f"Warning: Could not load {csv_path}: {e}")
+            return None
+        return rows
 
     def set_manufacturer(self, manufacturer: str) -> None:
         self.manufacturer = manufacturer
-        self.codes.clear()
         self._loaded_files.clear()
+        self._trigrams = None
         self._load_databases()
 
     def lookup(self, code: str) -> Optional[DTCInfo]:
         if not code:
             return None
-        return self.codes.get(code.strip().upper())
+        key = code.strip().upper()
+        # Straight dict gets per layer; ChainMap.get() goes through __contains__ first
+        for layer in self._raw.maps:
+            row = layer.get(key)
+            if row is not None:
+                return DTCInfo(*row)
+        return None
 
     def get_description(self, code: str) -> str:
         info = self.lookup(code)
         return info.description if info else "Unknown code - not in database"
 
-    def search(self, query: str) -> List[DTCInfo]:
-        if not query:
+    def _build_search_index(self) -> Dict[str, Set[int]]:
+        rows = list(self._raw.values())
+        codes = [code.lower() for code, _, _ in rows]
+        descs = [desc.lower() for _, desc, _ in rows]
+        index: Optional[Dict[str, Set[int]]] = None
+        if self._cache_key:
+            cached = self._read_cache(self._cache_key, "idx")
+            if isinstance(cached, tuple) and len(cached) == 2 and cached[0] == len(rows):
+                index = cached[1]
+        if index is None:
+            index = {}
+            for pos, (code, desc) in enumerate(zip(codes, descs)):
+                text = f"{code}\0{desc}"
+                for i in range(len(text) - 2):
+                    index.setdefault(text[i : i + 3], set()).add(pos)
+            if self._cache_key:
+                self._write_cache(self._cache_key, "idx", (len(rows), index))
+        self._search_rows = rows
+        self._search_codes = codes
+        self._search_descs = descs
+        self._trigrams = index
+        return index
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[DTCInfo]:
+        """Codes whose code or description contains query, in DB order; at most limit."""
+        if not query or (limit is not None and limit <= 0):
             return []
         q = query.strip().lower()
-        out: List[DTCInfo] = []
-        for info in self.codes.values():
-            if q in (info.description or "").lower() or q in (info.code or "").lower():
-                out.append(info)
+        index = self._trigrams if self._trigrams is not None else self._build_search_index()
+
+        rows, codes, descs = self._search_rows, self._search_codes, self._search_descs
+        if len(q) < 3:
+            # Full scan: walk the three parallel lists together, no indexing
+            matches = (row for row, code, desc in zip(rows, codes, descs) if q in desc or q in code)
+            return [DTCInfo(*row) for row in islice(matches, limit)]
+
+        postings = []
+        for i in range(len(q) - 2):
+            hits = index.get(q[i : i + 3])
+            if not hits:
+                return []
+            postings.append(hits)
+        postings.sort(key=len)
+        candidates = sorted(set.intersection(*postings))
+
+        # Trigram hits are candidates only; confirm the substring (keeps DB order)
+        matches = (rows[pos] for pos in candidates if q in descs[pos] or q in codes[pos])
+        return [DTCInfo(*row) for row in islice(matches, limit)]
+
+    def search_many(self, queries: List[str], limit: Optional[int] = None) -> Dict[str, List[DTCInfo]]:
+        """
+        search() for several queries at once, keyed by the original query.
+
+        Queries with a trigram go through the index; shorter ones share a
+        single pass over the rows instead of one full scan each.
+        """
+        out: Dict[str, List[DTCInfo]] = {}
+        short: List[Tuple[str, str]] = []
+        for query in queries:
+            if query in out:
+                continue
+            q = (query or "").strip().lower()
+            if len(q) >= 3 or not q or (limit is not None and limit <= 0):
+                out[query] = self.search(query, limit=limit)
+            else:
+                out[query] = []
+                short.append((query, q))
+
+        if short:
+            if self._trigrams is None:
+                self._build_search_index()
+            rows, codes, descs = self._search_rows, self._search_codes, self._search_descs
+            for row, code, desc in zip(rows, codes, descs):
+                for query, q in short:
+                    hits = out[query]
+                    if (limit is None or len(hits) < limit) and (q in desc or q in code):
+                        hits.append(DTCInfo(*row))
         return out
 
     @property
     def count(self) -> int:
-        return len(self.codes)
+        return self._count
 
     @property
     def loaded_files(self) -> List[str]:
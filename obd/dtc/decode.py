@@ -1,17 +1,13 @@
-def decode_dtc_bytes(hex_bytes: str) -> str:
-    if not hex_bytes or len(hex_bytes) != 4:
-        return f"INVALID:{hex_bytes}"
+import re
 
-    try:
-        first_nibble = int(hex_bytes[0], 16)
+# First hex digit -> "P0".."U3": bits 3-2 pick the letter, bits 1-0 the first digit
+_PREFIX_BY_NIBBLE = tuple("PCBU"[(n >> 2) & 0x03] + str(n & 0x03) for n in range(16))
+# Same table keyed by the ASCII digit itself, so callers skip int(c, 16)
+PREFIX_BY_HEX = {c: _PREFIX_BY_NIBBLE[int(c, 16)] for c in "0123456789ABCDEFabcdef"}
+_HEX4 = re.compile(r"[0-9A-Fa-f]{4}")
 
-        type_bits = (first_nibble >> 2) & 0x03
-        prefixes = {0: "P", 1: "C", 2: "B", 3: "U"}
-        prefix = prefixes.get(type_bits, "P")
 
-        second_char = str(first_nibble & 0x03)
-        rest = hex_bytes[1:].upper()
-
-        return f"{prefix}{second_char}{rest}"
-    except (ValueError, IndexError):
+def decode_dtc_bytes(hex_bytes: str) -> str:
+    if not hex_bytes or not _HEX4.fullmatch(hex_bytes):
         return f"INVALID:{hex_bytes}"
+    return PREFIX_BY_HEX[hex_bytes[0]] + hex_bytes[1:].upper()
@@ -1,14 +1,22 @@
+from functools import lru_cache
 from typing import Optional
 from .database import DTCDatabase
 
-_default_db: Optional[DTCDatabase] = None
+
+@lru_cache(maxsize=None)
+def _build_db(manufacturer: Optional[str]) -> DTCDatabase:
+    return DTCDatabase(manufacturer=manufacturer)
 
 
 def get_database(manufacturer: Optional[str] = None) -> DTCDatabase:
-    global _default_db
-    if _default_db is None or manufacturer:
-        _default_db = DTCDatabase(manufacturer=manufacturer)
-    return _default_db
+    """
+    Shared DTCDatabase per manufacturer (None = generic + every brand file).
+
+    Instances are cached and shared; don't call set_manufacturer() on the
+    result, ask get_database() for the other manufacturer instead.
+    """
+    key = manufacturer.strip().lower().replace(" ", "_") if manufacturer else None
+    return _build_db(key or None)
 
 
 def lookup_code(code: str) -> str:
@@ -1,7 +1,9 @@
 from dataclasses import dataclass
 
+from ..utils import DATACLASS_SLOTS
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class DTCInfo:
     code: str
     description: str
@@ -1,29 +1,31 @@
-from typing import List
-from .decode import decode_dtc_bytes
+import re
+from typing import Callable, List
 
+from .decode import PREFIX_BY_HEX
 
-def parse_dtc_response(response: str, mode: str = "03") -> List[str]:
-    dtcs: List[str] = []
-    if not response:
-        return dtcs
+# Every alternative consumes exactly 4 characters, so findall() walks the
+# payload in aligned chunks; only valid non-zero chunks fill the groups.
+_DTC_CHUNK_RE = re.compile(r"0000|([0-9A-F])([0-9A-F]{3})|.{4}", re.DOTALL)
+
+# Drop spaces and uppercase ASCII in a single translate() pass
+_NOSPACE_UPPER = str.maketrans({" ": None, **{c: c.upper() for c in "abcdefghijklmnopqrstuvwxyz"}})
 
-    prefixes = {"03": "43", "07": "47", "0A": "4A"}
-    prefix = prefixes.get(mode, "43")
 
-    resp = response.replace(" ", "").upper()
+def _make_parser(prefix: str) -> Callable[[str], List[str]]:
+    def parse(response: str) -> List[str]:
+        resp = response.translate(_NOSPACE_UPPER)
+        if prefix in resp:
+            resp = resp.replace(prefix, "", 1)
+        return [PREFIX_BY_HEX[first] + rest for first, rest in _DTC_CHUNK_RE.findall(resp) if first]
 
-    if prefix in resp:
-        resp = resp.replace(prefix, "", 1)
+    return parse
 
-    for i in range(0, len(resp), 4):
-        chunk = resp[i : i + 4]
-        if len(chunk) < 4:
-            continue
-        if chunk == "0000":
-            continue
 
-        dtc_code = decode_dtc_bytes(chunk)
-        if not dtc_code.startswith("INVALID"):
-            dtcs.append(dtc_code)
+# Response prefix per DTC mode; unknown modes parse like mode 03
+_PARSERS = {"03": _make_parser("43"), "07": _make_parser("47"), "0A": _make_parser("4A")}
 
-    return dtcs
+
+def parse_dtc_response(response: str, mode: str = "03") -> List[str]:
+    if not response:
+        return []
+    return _PARSERS.get(mode, _PARSERS["03"])(response)
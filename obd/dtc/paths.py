@@ -1 +1 @@
-from app.infrastructure.persistence.data_paths import data_dir
+from app.infrastructure.persistence.data_paths import cache_dir, data_dir
@@ -1,16 +1,38 @@
 from __future__ import annotations
 
 import re
+import select
 import time
 from typing import Optional, List, Callable, Any
 
 import serial
 
+from obd.bluetooth.compat import platform_name
+from obd.protocol.normalize import NON_HEX_BYTES
+
 from .errors import CommunicationError, DeviceDisconnectedError
 from .ports import find_ports
-from .init import initialize_elm
+from .init import initialize_elm, apply_fast_responses as _apply_fast_responses
 from .protocol import negotiate_protocol as _negotiate_protocol, get_protocol as _get_protocol
 
+# Serial read timeout used when the port has no selectable fd (Windows):
+# read(1) returns as soon as a byte lands, or after this long.
+BLOCKING_READ_WAIT_S = 0.02
+
+# ELM327 status strings and what send_obd reports for them, highest priority first
+_STATUS_RESULTS = (
+    ("NO DATA", "NO DATA"),
+    ("UNABLE TO CONNECT", "NO CONNECT"),
+    ("ERROR", "ERROR"),
+    ("?", "INVALID"),
+)
+_STATUS_RE = re.compile("|".join(re.escape(status) for status, _ in _STATUS_RESULTS))
+
+# CAN/K-line header in front of a reply line when ATH1 is on
+_HEADER_RE = re.compile(r"^[0-9A-F]{3,8}\s")
+# 0100 replies that mean "no usable answer yet" in test_vehicle_connection()
+_NO_ANSWER_RE = re.compile("NO DATA|UNABLE TO CONNECT|CAN ERROR|STOPPED")
+
 
 class ELM327:
     BAUD_RATES = [38400, 9600, 115200, 57600, 19200]
@@ -29,6 +51,8 @@ class ELM327:
         self.protocol: Optional[str] = None
         self.elm_version: Optional[str] = None
         self._is_connected = False
+        self._poll_fd: Optional[int] = None
+        self._blocking_read = False
 
         self.raw_logger = raw_logger
         self.last_command: Optional[str] = None
@@ -87,6 +111,12 @@ class ELM327:
                     parity=serial.PARITY_NONE,
                     stopbits=serial.STOPBITS_ONE,
                 )
+                self._set_low_latency(self.connection)
+                self._poll_fd = self._readable_fd(self.connection)
+                if self._poll_fd is None:
+                    # No fd to select() on: let the driver block in read(1)
+                    self.connection.timeout = BLOCKING_READ_WAIT_S
+                    self._blocking_read = True
                 time.sleep(0.2)
 
             if not initialize_elm(self):
@@ -118,6 +148,54 @@ class ELM327:
             self._is_connected = False
             raise DeviceDisconnectedError(f"Device disconnected: {e}")
 
+    @staticmethod
+    def _set_low_latency(connection: Any) -> bool:
+        """
+        Linux USB-serial drivers (FTDI & co) hold incoming bytes for up to
+        ~16 ms; ASYNC_LOW_LATENCY makes them forward each byte right away.
+        Best effort: adapters/drivers that refuse it just keep the default.
+        """
+        if platform_name() != "linux":
+            return False
+        set_mode = getattr(connection, "set_low_latency_mode", None)
+        if set_mode is None:
+            return False
+        try:
+            set_mode(True)
+            return True
+        except (OSError, ValueError, serial.SerialException):
+            return False
+
+    @staticmethod
+    def _readable_fd(connection: Any) -> Optional[int]:
+        # select() only accepts sockets on Windows; BLE/replay transports have no fd.
+        if platform_name() == "win32":
+            return None
+        try:
+            return int(connection.fileno())
+        except Exception:
+            return None
+
+    @staticmethod
+    def _split_lines(buf: bytes) -> List[str]:
+        # ELM327 output is ASCII: split the raw bytes and decode each line once
+        raw = buf.replace(b">", b"").replace(b"\r", b"\n")
+        return [ln for ln in (part.decode("ascii", "ignore").strip() for part in raw.split(b"\n")) if ln]
+
+    def _wait_for_input(self, wait_s: float) -> bytes:
+        """Block until the port is readable or wait_s elapses; returns any byte consumed."""
+        if self._blocking_read:
+            return self.connection.read(1)
+        if self._poll_fd is None:
+            time.sleep(min(wait_s, 0.01))
+            return b""
+        try:
+            select.select([self._poll_fd], [], [], wait_s)
+        except (OSError, ValueError):
+            self._poll_fd = None
+            time.sleep(min(wait_s, 0.01))
+        return b""
+
     def _connect_ble(self, address: str) -> None:
         try:
             from obd.ble.ble_serial import BleSerial
@@ -165,6 +243,7 @@ class ELM327:
             received_any = False
             received_meaningful = False
             prompt_seen = False
+            carry = b""
 
             def _is_meaningful(lines: List[str]) -> bool:
                 for ln in lines:
@@ -184,21 +263,16 @@ class ELM327:
                     break
 
                 n = self.connection.in_waiting
-                if n:
-                    chunk = self.connection.read(n)
+                if n or carry:
+                    chunk = carry + self.connection.read(n) if n else carry
+                    carry = b""
                     buf.extend(chunk)
                     last_rx = now
                     received_any = True
                     if b">" in chunk or b">" in buf:
                         prompt_seen = True
                     if not received_meaningful:
-                        text = buf.decode("utf-8", errors="ignore")
-                        lines = [
-                            ln.strip()
-                            for ln in text.replace(">", "").replace("\r", "\n").split("\n")
-                            if ln.strip()
-                        ]
-                        if _is_meaningful(lines):
+                        if _is_meaningful(self._split_lines(buf)):
                             received_meaningful = True
                     if prompt_seen and received_meaningful:
                         break
@@ -212,13 +286,17 @@ class ELM327:
                         and (now - last_rx) > silence_timeout
                     ):
                         break
-                    time.sleep(0.01)
-
-            text = buf.decode("utf-8", errors="ignore")
-            text = text.replace(">", "").replace("\r", "\n")
-            lines = [ln.strip() for ln in text.split("\n") if ln.strip()]
+                    deadline = start + timeout
+                    if received_meaningful:
+                        deadline = min(
+                            deadline,
+                            max(start + min_wait_before_silence_break, last_rx + silence_timeout),
+                        )
+                    carry = self._wait_for_input(max(0.001, min(deadline - now, 0.1)))
+
+            lines = self._split_lines(buf)
             self.last_lines = lines
-            self.last_raw_text = text
+            self.last_raw_text = buf.replace(b">", b"").replace(b"\r", b"\n").decode("ascii", "ignore")
             self.last_duration_s = time.monotonic() - start
 
             if self.raw_logger:
@@ -252,16 +330,13 @@ class ELM327:
 
         up_joined = " ".join(resp_lines).upper()
 
-        if "NO DATA" in up_joined:
-            return "NO DATA"
-        if "UNABLE TO CONNECT" in up_joined:
-            return "NO CONNECT"
-        if "ERROR" in up_joined:
-            return "ERROR"
-        if "?" in up_joined:
-            return "INVALID"
+        found = set(_STATUS_RE.findall(up_joined))
+        if found:
+            for status, result in _STATUS_RESULTS:
+                if status in found:
+                    return result
 
-        return "".join(ch for ch in up_joined if ch in "0123456789ABCDEF")
+        return up_joined.encode("ascii", "ignore").translate(None, NON_HEX_BYTES).decode("ascii")
 
     def send_obd_lines(self, command: str) -> List[str]:
         return self.send_raw_lines(command, timeout=max(self.timeout, 2.0))
@@ -284,7 +359,7 @@ class ELM327:
             if "4100" in compact:
                 if self.headers_on:
                     looks_like_header = any(
-                        re.match(r"^[0-9A-F]{3,8}\s", ln.strip().upper()) for ln in lines
+                        _HEADER_RE.match(ln.strip().upper()) for ln in lines
                     )
                     if not looks_like_header:
                         self.headers_on = False
@@ -301,7 +376,7 @@ class ELM327:
                     continue
                 return False
 
-            if any(err in joined for err in ["NO DATA", "UNABLE TO CONNECT", "CAN ERROR", "STOPPED"]):
+            if _NO_ANSWER_RE.search(joined):
                 if attempt < retries:
                     time.sleep(retry_delay_s)
                     continue
@@ -333,6 +408,9 @@ class ELM327:
             retry_delay_s=retry_delay_s,
         )
 
+    def apply_fast_responses(self, headers_off: bool = False) -> bool:
+        return _apply_fast_responses(self, headers_off=headers_off)
+
     def get_protocol(self) -> str:
         return _get_protocol(self)
 
@@ -345,6 +423,8 @@ class ELM327:
                 pass
             finally:
                 self.connection = None
+                self._poll_fd = None
+                self._blocking_read = False
 
     def __enter__(self):
         self.connect()
@@ -52,3 +52,22 @@ def initialize_elm(elm: "ELM327") -> bool:
         return True
     except Exception:
         return False
+
+
+def apply_fast_responses(elm: "ELM327", *, headers_off: bool = False) -> bool:
+    """
+    "Faster responses" tuning, applied after the vehicle answered 0100:
+    - ATAT2: aggressive adaptive timing (shorter wait per request)
+    - ATS0:  no spaces between bytes (~25% fewer bytes on the wire)
+    - ATH0:  optional, drops CAN headers (single-ECU parsing only)
+    Returns True/False (never throws up to connect()).
+    """
+    try:
+        elm.send_raw_lines("ATAT2", timeout=1.0)
+        elm.send_raw_lines("ATS0", timeout=1.0)
+        if headers_off and elm.headers_on:
+            elm.send_raw_lines("ATH0", timeout=1.0)
+            elm.headers_on = False
+        return True
+    except Exception:
+        return False
@@ -1,15 +1,18 @@
 # obd/elm/ports.py
 from __future__ import annotations
 
+import re
 from typing import List
-import serial.tools.list_ports
 
-from obd.bluetooth.ports import is_bluetooth_port_info
+from obd.bluetooth.ports import is_bluetooth_port_info, list_serial_ports
+
+# USB-serial chips (and ELM clones) that usually sit behind an OBD adapter
+_ELM_DESC_RE = re.compile("elm|ch340|pl2303|ftdi|cp210")
 
 def find_ports(include_bluetooth: bool = False) -> List[str]:
     ranked: List[tuple[int, str]] = []
     try:
-        ports_list = serial.tools.list_ports.comports()
+        ports_list = list_serial_ports()
     except Exception:
         return []
 
@@ -26,7 +29,7 @@ def find_ports(include_bluetooth: bool = False) -> List[str]:
         score = 0
         if "usb" in desc:
             score += 2
-        if any(x in desc for x in ["elm", "ch340", "pl2303", "ftdi", "cp210"]):
+        if _ELM_DESC_RE.search(desc):
             score += 3
         if "usbserial" in dev or "wchusbserial" in dev:
             score += 2
@@ -24,6 +24,10 @@ _PROTOCOL_MAP = {
     "A": "SAE J1939 CAN",
 }
 
+# Replies to 0100 that mean "retry this protocol" rather than "no answer"
+_RETRY_RE = re.compile("SEARCHING|BUS INIT|NO DATA|UNABLE TO CONNECT|STOPPED|ERROR")
+_DPN_RE = re.compile(r"[0-9A-F]")
+
 
 def negotiate_protocol(
     elm: "ELM327",
@@ -50,18 +54,7 @@ def negotiate_protocol(
                 if "4100" in compact:
                     found = True
                     return p
-                if any(
-                    err in joined
-                    for err in [
-                        "SEARCHING",
-                        "BUS INIT",
-                        "NO DATA",
-                        "UNABLE TO CONNECT",
-                        "CAN ERROR",
-                        "STOPPED",
-                        "ERROR",
-                    ]
-                ):
+                if _RETRY_RE.search(joined):
                     if attempt < retries:
                         time.sleep(retry_delay_s)
                         continue
@@ -85,9 +78,9 @@ def get_protocol(elm: "ELM327") -> str:
         return "Unknown (disconnected)"
 
     code = None
-    m = re.search(r"([0-9A-F])", resp)
+    m = _DPN_RE.search(resp)
     if m:
-        code = m.group(1)
+        code = m.group()
 
     if code and code in _PROTOCOL_MAP:
         elm.protocol = _PROTOCOL_MAP[code]
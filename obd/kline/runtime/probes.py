@@ -3,6 +3,8 @@ from __future__ import annotations
 import re
 from typing import List
 
+from ...protocol.normalize import NON_HEX_BYTES
+
 _HEX_RE = re.compile(r"^[0-9A-F]+$")
 
 
@@ -36,7 +38,7 @@ def extract_hex_blob(lines: List[str]) -> str:
     Une líneas y deja solo hex (tolerante a headers/texto).
     """
     up = " ".join(lines).upper()
-    return "".join(ch for ch in up if ch in "0123456789ABCDEF")
+    return up.encode("ascii", "ignore").translate(None, NON_HEX_BYTES).decode("ascii")
 
 
 def looks_like_hex(hex_blob: str) -> bool:
@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict, Optional
 
+from .probes import extract_hex_blob
+
 
 # Quirk keys (convención)
 QUIRK_FORCE_HEADERS_ON = "force_headers_on"
@@ -55,7 +57,7 @@ def classify_response(lines: list[str]) -> str:
         return "invalid"
 
     # Heurística: si no hay casi hex, no es respuesta real
-    hex_blob = "".join(ch for ch in up if ch in "0123456789ABCDEF")
+    hex_blob = extract_hex_blob(lines)
     if len(hex_blob) < 6:
         return "invalid"
 
@@ -7,6 +7,7 @@ from obd.elm.elm327 import ELM327
 from obd.kline.config.detect import detect_profile_report, DetectReport
 from obd.kline.profiles.base import KLineProfile
 from obd.kline.runtime.policy import KLinePolicy
+from obd.kline.runtime.probes import extract_hex_blob
 from obd.kline.runtime.routing import query_profile
 
 
@@ -75,9 +76,7 @@ class KLineSession:
         """
         Ejecuta query_lines y devuelve hex-only concatenado (como tu send_obd()).
         """
-        lines = self.query_lines(cmd)
-        up = " ".join(lines).upper()
-        return "".join(ch for ch in up if ch in "0123456789ABCDEF")
+        return extract_hex_blob(self.query_lines(cmd))
 
     def close(self) -> None:
         """
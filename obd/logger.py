@@ -7,13 +7,24 @@ Handles logging of OBD sessions to CSV and JSON files.
 from __future__ import annotations
 
 import csv
+import io
 import json
+import queue
+import threading
+import time
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
 from .utils import cr_now, cr_timestamp, cr_timestamp_filename
 from app.infrastructure.persistence.data_paths import logs_dir
 
+# CSV rows are written by a background thread in chunks of up to
+# FLUSH_BYTES, or at least every FLUSH_INTERVAL_S while rows arrive.
+FLUSH_BYTES = 64 * 1024
+FLUSH_INTERVAL_S = 0.25
+
+_STOP = object()
+
 
 class SessionLogger:
     """
@@ -44,6 +55,11 @@ class SessionLogger:
         self._json_data: List[Dict] = []
         self._headers_written: bool = False
         self._csv_fieldnames: List[str] = []
+        self._buffer = io.StringIO()
+        self._queue: Optional["queue.Queue[Any]"] = None
+        self._writer_thread: Optional[threading.Thread] = None
+        # First write failure on the writer thread, raised by end_session()
+        self._write_error: Optional[Exception] = None
     
     def start_session(self, format: str = "csv", filename: Optional[str] = None) -> Path:
         """
@@ -62,6 +78,7 @@ class SessionLogger:
         self._headers_written = False
         self._json_data = []
         self._csv_fieldnames = []
+        self._write_error = None
         
         # Generate filename
         if filename:
@@ -75,6 +92,12 @@ class SessionLogger:
         # Open file for CSV (JSON writes at end)
         if self.session_format == "csv":
             self._file_handle = open(self.session_file, "w", newline="", encoding="utf-8")
+            self._buffer = io.StringIO()
+            self._queue = queue.Queue()
+            self._writer_thread = threading.Thread(
+                target=self._run_writer, name="session-log-writer", daemon=True
+            )
+            self._writer_thread.start()
         
         return self.session_file
     
@@ -98,10 +121,7 @@ class SessionLogger:
             row[col_name] = reading.value
             row[f"{col_name}_unit"] = reading.unit
         
-        if self.session_format == "csv":
-            self._write_csv_row(row)
-        else:
-            self._json_data.append(row)
+        self._emit(row)
         
         self.reading_count += 1
     
@@ -121,10 +141,7 @@ class SessionLogger:
                 "status": dtc.status,
             }
             
-            if self.session_format == "csv":
-                self._write_csv_row(row)
-            else:
-                self._json_data.append(row)
+            self._emit(row)
     
     def log_freeze_frame(self, freeze_data: Dict[str, Any]) -> None:
         """Log freeze frame data."""
@@ -134,10 +151,7 @@ class SessionLogger:
         timestamp = cr_timestamp()
         row = {"timestamp": timestamp, "type": "FREEZE_FRAME", **freeze_data}
         
-        if self.session_format == "csv":
-            self._write_csv_row(row)
-        else:
-            self._json_data.append(row)
+        self._emit(row)
     
     def log_event(self, event_type: str, message: str, data: Optional[Dict] = None) -> None:
         """
@@ -160,11 +174,57 @@ class SessionLogger:
         if data:
             row.update(data)
         
+        self._emit(row)
+    
+    def _emit(self, row: Dict) -> None:
+        """Queue a CSV row for the writer thread, or keep a JSON row for end_session()."""
         if self.session_format == "csv":
-            self._write_csv_row(row)
+            if self._queue is None:
+                raise RuntimeError("CSV writer is not running. Call start_session() first.")
+            self._queue.put_nowait(row)
         else:
             self._json_data.append(row)
-    
+
+    def _run_writer(self) -> None:
+        """Drain queued rows into the buffer and flush it in large writes."""
+        q = self._queue
+        if q is None:
+            return
+        last_flush = time.monotonic()
+        while True:
+            try:
+                row = q.get(timeout=FLUSH_INTERVAL_S)
+            except queue.Empty:
+                row = None
+            if row is _STOP:
+                self._flush_buffer()
+                return
+            if row is not None:
+                try:
+                    self._write_csv_row(row)
+                except (OSError, csv.Error) as exc:
+                    self._record_error(exc)
+            now = time.monotonic()
+            if self._buffer.tell() >= FLUSH_BYTES or now - last_flush >= FLUSH_INTERVAL_S:
+                self._flush_buffer()
+                last_flush = now
+
+    def _flush_buffer(self) -> None:
+        data = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        if not data or not self._file_handle:
+            return
+        try:
+            self._file_handle.write(data)
+            self._file_handle.flush()
+        except (OSError, ValueError) as exc:
+            self._record_error(exc)
+
+    def _record_error(self, exc: Exception) -> None:
+        if self._write_error is None:
+            self._write_error = exc
+
     def _pid_to_column(self, name: str) -> str:
         """Convert PID name to short column name."""
         mappings = {
@@ -196,7 +256,7 @@ class SessionLogger:
         if not self._headers_written:
             self._csv_fieldnames = list(row.keys())
             self._csv_writer = csv.DictWriter(
-                self._file_handle, 
+                self._buffer,
                 fieldnames=self._csv_fieldnames,
                 extrasaction="ignore"
             )
@@ -209,15 +269,16 @@ class SessionLogger:
             return
 
         self._csv_writer.writerow(row)
-        self._file_handle.flush()
 
     def _rewrite_csv_with_new_fields(self, new_fields: List[str], row: Dict) -> None:
         if not self.session_file or not self._file_handle:
             return
 
         # Flush and close so we can read the file contents.
-        self._file_handle.flush()
+        self._flush_buffer()
         self._file_handle.close()
+        # Rows written after a failed reopen have nowhere to go
+        self._file_handle = None
 
         updated_fields = self._csv_fieldnames + [f for f in new_fields if f not in self._csv_fieldnames]
         existing_rows: List[Dict[str, Any]] = []
@@ -231,7 +292,7 @@ class SessionLogger:
         self._file_handle = open(self.session_file, "w", newline="", encoding="utf-8")
         self._csv_fieldnames = updated_fields
         self._csv_writer = csv.DictWriter(
-            self._file_handle,
+            self._buffer,
             fieldnames=self._csv_fieldnames,
             extrasaction="ignore",
         )
@@ -240,7 +301,7 @@ class SessionLogger:
         for old_row in existing_rows:
             self._csv_writer.writerow(old_row)
         self._csv_writer.writerow(row)
-        self._file_handle.flush()
+        self._flush_buffer()
     
     def end_session(self) -> Dict[str, Any]:
         """End the current logging session."""
@@ -268,7 +329,12 @@ class SessionLogger:
             with open(self.session_file, "w", encoding="utf-8") as f:
                 json.dump(output, f, indent=2, ensure_ascii=False)
         
-        # Close CSV file
+        # Drain queued CSV rows, then close the file
+        if self._writer_thread is not None and self._queue is not None:
+            self._queue.put_nowait(_STOP)
+            self._writer_thread.join()
+        self._writer_thread = None
+        self._queue = None
         if self._file_handle:
             self._file_handle.close()
             self._file_handle = None
@@ -278,6 +344,10 @@ class SessionLogger:
         self._csv_writer = None
         self._json_data = []
         
+        error, self._write_error = self._write_error, None
+        if error is not None:
+            raise error
+        
         return summary
     
     @property
@@ -1,15 +1,32 @@
 from __future__ import annotations
 
+import re
 import time
-from typing import Optional, List, Tuple, Callable
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import ClassVar, Dict, FrozenSet, Optional, List, Tuple, Callable
 
 from ..elm import ELM327
 from ..elm import DeviceDisconnectedError, CommunicationError
+from ..bluetooth.ports import clear_port_cache
 
 from ..protocol import (
     group_by_ecu,
     merge_payloads,
     find_obd_response_payload,
+    find_prefix,
+    reassemble_isotp_frames,
+    single_ecu_payload,
+)
+
+
+# Any of these in a reply means the command should be retried; IGNORECASE
+# spares an upper() copy of every response
+_RETRY_STATUS_RE = re.compile(
+    "|".join(
+        re.escape(err)
+        for err in ["NO DATA", "UNABLE TO CONNECT", "ERROR", "STOPPED", "BUS", "CAN ERROR", "?", "BUFFER FULL"]
+    ),
+    re.IGNORECASE,
 )
 
 
@@ -33,7 +50,8 @@ class BaseScanner:
     - robust query helper (_obd_query_payload)
     """
 
-    ERROR_RESPONSES = {"NO DATA", "ERROR", "NO CONNECT", "INVALID", "DISCONNECTED"}
+    # Status strings ELM327.send_obd() returns instead of hex data
+    ERROR_RESPONSES: ClassVar[FrozenSet[str]] = frozenset({"NO DATA", "ERROR", "NO CONNECT", "INVALID", "DISCONNECTED"})
 
     ECU_PREFER = [
         "7E8", "7E0", "7E9", "7E1", "7EA", "7E2", "7EB", "7E3",
@@ -48,66 +66,137 @@ class BaseScanner:
     ):
         self.elm = ELM327(port=port, baudrate=baudrate, raw_logger=raw_logger)
         self._connected = False
+        self._multi_pid_supported = True
+        self._frame_hints_supported = True
+        # Mode 01 PIDs the vehicle advertises (0100/0120/...), None = unknown
+        self._supported_pids: Optional[FrozenSet[str]] = None
+        # ECUs that answered 0100 at connect (None = not counted)
+        self._responding_ecus: Optional[int] = None
+
+        # ELM "faster responses" (ATAT2 + ATS0, optional ATH0), reapplied on every connect
+        self.fast_responses = False
+        self.headers_off = False
+        # Opt-in: append the expected frame count to queries that pass one,
+        # when a single ECU answers
+        self.frame_hints = False
 
     # -----------------------------
     # Connection
     # -----------------------------
     def connect(self) -> bool:
-        self.elm.connect()
-        is_ble = str(self.elm.port or "").lower().startswith("ble:")
-        connect_timeout = max(self.elm.timeout, 5.0 if is_ble else 8.0)
+        self._multi_pid_supported = True
+        self._frame_hints_supported = True
+        self._supported_pids = None
+        self._responding_ecus = None
+        try:
+            self._connect_elm(self.elm)
+        except Exception:
+            self._connected = False
+            raise
+        return self._on_connected()
+
+    def _connect_elm(self, elm: ELM327) -> None:
+        """
+        Open `elm` and get an answer from the vehicle; raises ConnectionError otherwise.
+
+        Touches nothing but `elm`, so auto_connect() can run it on probe threads.
+        """
+        # Start from ATH1/ATS1; test_vehicle_connection / fast responses may drop them again
+        elm.headers_on = True
+        elm.connect()
+        is_ble = str(elm.port or "").lower().startswith("ble:")
+        connect_timeout = max(elm.timeout, 5.0 if is_ble else 8.0)
         if is_ble:
             time.sleep(0.3)
 
         # First: give auto protocol enough time to respond (avoid spamming ECU)
-        if self.elm.test_vehicle_connection(
+        if elm.test_vehicle_connection(
             retries=1 if is_ble else 1,
             retry_delay_s=0.5,
             timeout=connect_timeout,
         ):
-            self._connected = True
-            return True
+            return
 
         # If auto failed, try to lock into a working protocol (safe to fail)
         if not is_ble:
             try:
-                self.elm.negotiate_protocol(timeout_s=connect_timeout, retries=1, retry_delay_s=1.0)
-                self._connected = True
-                return True
+                elm.negotiate_protocol(timeout_s=connect_timeout, retries=1, retry_delay_s=1.0)
             except Exception:
                 pass
+            else:
+                return
 
         # Final quick retry after negotiation attempt
-        if not is_ble and self.elm.test_vehicle_connection(
+        if not is_ble and elm.test_vehicle_connection(
             retries=0,
             retry_delay_s=1.0,
             timeout=connect_timeout,
         ):
-            self._connected = True
-            return True
+            return
 
-        self._connected = False
         raise ConnectionError("No response from vehicle ECU")
 
+    def _on_connected(self) -> bool:
+        if self.fast_responses:
+            self.elm.apply_fast_responses(headers_off=self.headers_off)
+        self._connected = True
+        return True
 
     def auto_connect(self) -> str:
         ports = ELM327.find_ports()
         if not ports:
             raise ConnectionError("No USB serial ports found. Is the ELM327 plugged in?")
 
+        self.disconnect()
+        self._multi_pid_supported = True
+        self._frame_hints_supported = True
+        self._supported_pids = None
+        self._responding_ecus = None
+
+        # Probe every port at once on a throwaway ELM327; a dead port costs its
+        # open + ECU timeouts, so the wait is the slowest probe, not their sum.
+        # Probes only touch their own ELM327; scanner state is set on this thread.
+        probes = {
+            port: ELM327(
+                port=port,
+                baudrate=self.elm.baudrate,
+                timeout=self.elm.timeout,
+                raw_logger=self.elm.raw_logger,
+            )
+            for port in ports
+        }
+        winner: Optional[str] = None
         last_error: Optional[Exception] = None
-
-        for port in ports:
-            try:
-                self.elm.port = port
-                self.connect()
-                return port
-            except Exception as e:
-                last_error = e
+        futures: Dict["Future[None]", str] = {}
+        pool = ThreadPoolExecutor(max_workers=min(8, len(ports)), thread_name_prefix="obd-port-probe")
+        try:
+            for port, elm in probes.items():
+                futures[pool.submit(self._connect_elm, elm)] = port
+            for future in as_completed(futures):
                 try:
-                    self.disconnect()
-                except Exception:
-                    pass
+                    future.result()
+                except Exception as e:
+                    last_error = e
+                    continue
+                winner = futures[future]
+                break
+        finally:
+            for future in futures:
+                future.cancel()
+            # Closing a losing port makes its pending serial I/O fail fast, so
+            # the join below does not sit out that probe's ECU timeouts
+            for port, elm in probes.items():
+                if port != winner:
+                    elm.close()
+            pool.shutdown(wait=True)
+            for port, elm in probes.items():
+                if port != winner:
+                    elm.close()
+
+        if winner is not None:
+            self.elm = probes[winner]
+            self._on_connected()
+            return winner
 
         raise ConnectionError(f"No responding OBD device found. Tried: {ports}. Last error: {last_error}")
 
@@ -117,6 +206,7 @@ class BaseScanner:
             self.elm.close()
         except Exception:
             pass
+        clear_port_cache()
 
     @property
     def is_connected(self) -> bool:
@@ -143,9 +233,10 @@ class BaseScanner:
             try:
                 lines = self.elm.send_obd_lines(command)
                 last_lines = lines
-                joined = " ".join(lines).upper()
-
-                if not any(err in joined for err in ["NO DATA", "UNABLE TO CONNECT", "ERROR", "STOPPED", "BUS", "CAN ERROR", "?", "BUFFER FULL"]):
+                if not _RETRY_STATUS_RE.search(" ".join(lines)):
+                    return lines
+                if any(ln.strip() == "?" for ln in lines):
+                    # The ELM rejected the command itself; resending won't help
                     return lines
 
             except DeviceDisconnectedError:
@@ -160,18 +251,59 @@ class BaseScanner:
     # -----------------------------
     # Stage 1 robust helper
     # -----------------------------
-    def _obd_query_payload(self, command: str, expected_prefix: List[str]) -> Optional[Tuple[str, List[str]]]:
+    def _obd_query_payload(
+        self,
+        command: str,
+        expected_prefix: List[str],
+        expected_frames: Optional[int] = None,
+        reassemble: bool = False,
+    ) -> Optional[Tuple[str, List[str]]]:
+        """
+        expected_frames:
+          - with frame_hints on, sent as "<command> <n>" so the ELM returns
+            after n frames instead of waiting out its timeout (ELM327 v1.3+).
+            Only when a single ECU can answer (headers off, or one ECU replied
+            to 0100 at connect): otherwise the first frame could come from the
+            wrong ECU and the ECU_PREFER choice would never see the others.
+            Adapters answering "?" get plain commands until the next connect().
+        reassemble:
+          - with headers on, rebuild each ECU's multi-frame answer from its
+            ISO-TP frames, so no PCI byte is left between the data bytes.
+        """
         self._check_connected()
         try:
-            lines = self._send_obd_lines_retry(command, retries=1)
+            lines = None
+            if (
+                expected_frames
+                and self.frame_hints
+                and self._frame_hints_supported
+                and (not self.elm.headers_on or self._responding_ecus == 1)
+            ):
+                lines = self._send_obd_lines_retry(f"{command} {min(expected_frames, 0xF):X}", retries=1)
+                if any(ln.strip() == "?" for ln in lines):
+                    self._frame_hints_supported = False
+                    lines = None
+            if lines is None:
+                lines = self._send_obd_lines_retry(command, retries=1)
         except DeviceDisconnectedError:
             self._handle_disconnection()
             raise ConnectionLostError("Device disconnected")
         except CommunicationError as e:
             raise ScannerError(f"Communication error: {e}")
 
+        if not self.elm.headers_on:
+            # Single ECU: one flat payload, no per-ECU grouping
+            payload = single_ecu_payload(lines)
+            i = find_prefix(payload, expected_prefix)
+            return ("NOHDR", payload[i:]) if i >= 0 else None
+
         grouped = group_by_ecu(lines, headers_on=self.elm.headers_on)
         merged = merge_payloads(grouped, headers_on=self.elm.headers_on)
+        if reassemble:
+            for ecu, frames in grouped.items():
+                whole = reassemble_isotp_frames(frames)
+                if whole is not None:
+                    merged[ecu] = whole
 
         prefer = self.ECU_PREFER if self.elm.headers_on else None
         return find_obd_response_payload(merged, expected_prefix, prefer_ecus=prefer)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
 from typing import List, Optional
 
 from .models import DiagnosticCode, FreezeFrameData, SensorReading
@@ -7,9 +9,14 @@ from .base import ConnectionLostError, ScannerError
 from ..elm import DeviceDisconnectedError, CommunicationError
 from ..dtc import parse_dtc_response, decode_dtc_bytes
 from ..pids.standard_mode01 import PIDS
-from ..pids.decode import decode_pid_response
+from ..pids.decode import decode_pid_response, decode_pid_response_bytes
 from ..utils import cr_now
 
+# Mode 02 PIDs read for a freeze frame, paired with their metadata once
+_FREEZE_PIDS = tuple(
+    (pid, PIDS[pid]) for pid in ("04", "05", "06", "07", "0B", "0C", "0D", "0E", "0F", "11") if pid in PIDS
+)
+
 
 class DtcMixin:
     """
@@ -18,7 +25,8 @@ class DtcMixin:
       - _check_connected()
       - _obd_query_payload()
       - elm, _handle_disconnection()
-    Also requires self.dtc_db in concrete class.
+    Also requires self.dtc_db and self._desc_cache (dict) in concrete class,
+    and _supported_pids (None or the Mode 01 PIDs to try in freeze frames).
     """
 
     def read_dtcs(self) -> List[DiagnosticCode]:
@@ -34,38 +42,63 @@ class DtcMixin:
             ("0A", "permanent", ["4A"]),
         ]
 
-        try:
-            for mode, status, prefix in modes:
-                found = self._obd_query_payload(mode, expected_prefix=prefix)
-                if not found:
-                    continue
-
-                ecu, payload = found
-                hex_payload = "".join(payload).upper()
-                if not hex_payload:
-                    continue
+        # The ELM channel is strictly sequential, but parsing a reply and
+        # looking up its descriptions can run while the next mode is queried
+        jobs: List["Future[List[DiagnosticCode]]"] = []
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="dtc-parse") as pool:
+            try:
+                for mode, status, prefix in modes:
+                    found = self._obd_query_payload(mode, expected_prefix=prefix)
+                    if not found:
+                        continue
 
-                for code in parse_dtc_response(hex_payload, mode):
-                    if code in seen:
+                    ecu, payload = found
+                    hex_payload = "".join(payload).upper()
+                    if not hex_payload:
                         continue
-                    seen.add(code)
-                    dtcs.append(
-                        DiagnosticCode(
-                            code=code,
-                            description=self.dtc_db.get_description(code),
-                            status=status,
-                            timestamp=read_time,
-                        )
-                    )
 
-        except DeviceDisconnectedError:
-            self._handle_disconnection()
-            raise ConnectionLostError("Device disconnected")
-        except CommunicationError as e:
-            raise ScannerError(f"Communication error: {e}")
+                    jobs.append(pool.submit(self._parse_dtc_job, hex_payload, mode, status, read_time))
+
+            except DeviceDisconnectedError:
+                self._handle_disconnection()
+                raise ConnectionLostError("Device disconnected")
+            except CommunicationError as e:
+                raise ScannerError(f"Communication error: {e}")
+
+            for job in jobs:
+                for dtc in job.result():
+                    if dtc.code in seen:
+                        continue
+                    seen.add(dtc.code)
+                    dtcs.append(dtc)
 
         return dtcs
 
+    def _parse_dtc_job(self, hex_payload: str, mode: str, status: str, read_time: datetime) -> List[DiagnosticCode]:
+        get_description = self._desc
+        out: List[DiagnosticCode] = []
+        seen: set[str] = set()
+        for code in parse_dtc_response(hex_payload, mode):
+            if code in seen:
+                continue
+            seen.add(code)
+            out.append(
+                DiagnosticCode(
+                    code=code,
+                    description=get_description(code),
+                    status=status,
+                    timestamp=read_time,
+                )
+            )
+        return out
+
+    def _desc(self, code: str) -> str:
+        # Same code often comes back in several modes / scans; cleared on set_manufacturer()
+        desc = self._desc_cache.get(code)
+        if desc is None:
+            desc = self._desc_cache[code] = self.dtc_db.get_description(code)
+        return desc
+
     def clear_dtcs(self) -> bool:
         self._check_connected()
         try:
@@ -94,15 +127,12 @@ class DtcMixin:
             # NOTE: Many ECUs don't provide the freeze-frame DTC in a consistent way via OBD Mode 02.
             # We'll keep it Unknown unless you later validate a working query on a specific vehicle/ECU.
 
-            freeze_pids = ["04", "05", "06", "07", "0B", "0C", "0D", "0E", "0F", "11"]
             readings: dict[str, SensorReading] = {}
 
-            for pid in freeze_pids:
-                pid = pid.upper()
-                pid_info = PIDS.get(pid)
-                if not pid_info:
+            supported = self._supported_pids
+            for pid, pid_info in _FREEZE_PIDS:
+                if supported is not None and pid not in supported:
                     continue
-
                 found = self._obd_query_payload(f"02{pid}", expected_prefix=["42", pid])
                 if not found:
                     continue
@@ -112,13 +142,15 @@ class DtcMixin:
                     continue
 
                 # payload example: ["42", "<PID>", "<A>", "<B>", ...]
-                if payload[0].upper() != "42" or payload[1].upper() != pid:
+                if payload[0] != "42" or payload[1] != pid:
                     continue
 
                 data_tokens = payload[2:]
-                data_hex = "".join(data_tokens).upper()
-
-                value = decode_pid_response(pid, data_hex)
+                data_hex = "".join(data_tokens)
+                try:
+                    value = decode_pid_response_bytes(pid, bytes.fromhex(data_hex))
+                except ValueError:
+                    value = decode_pid_response(pid, data_hex)
                 if value is None:
                     continue
 
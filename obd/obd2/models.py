@@ -4,10 +4,10 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, Optional
 
-from ..utils import cr_now
+from ..utils import DATACLASS_SLOTS, cr_now
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SensorReading:
     name: str
     value: Optional[float]
@@ -22,7 +22,7 @@ class SensorReading:
         return self.timestamp.strftime("%Y-%m-%d %H:%M:%S")
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DiagnosticCode:
     code: str
     description: str
@@ -34,7 +34,7 @@ class DiagnosticCode:
         return self.timestamp.strftime("%Y-%m-%d %H:%M:%S")
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ReadinessStatus:
     monitor_name: str
     available: bool
@@ -47,7 +47,7 @@ class ReadinessStatus:
         return "Complete" if self.complete else "Incomplete"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FreezeFrameData:
     dtc_code: str
     readings: Dict[str, SensorReading]
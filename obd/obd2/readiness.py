@@ -4,6 +4,35 @@ from typing import Dict, Tuple
 
 from .models import ReadinessStatus
 
+MIL_MONITOR = "MIL (Check Engine Light)"
+
+_A, _B, _C, _D = range(4)
+
+# (monitor, supported byte, supported mask, incomplete byte, incomplete mask)
+# over the 0101 data bytes A-D, built once instead of on every read
+_SPARK_MONITORS: Tuple[Tuple[str, int, int, int, int], ...] = (
+    ("Misfire", _B, 1 << 0, _C, 1 << 0),
+    ("Fuel System", _B, 1 << 1, _C, 1 << 1),
+    ("Components", _B, 1 << 2, _C, 1 << 2),
+    ("Catalyst", _B, 1 << 4, _D, 1 << 0),
+    ("Heated Catalyst", _B, 1 << 5, _D, 1 << 1),
+    ("Evaporative System", _B, 1 << 6, _D, 1 << 2),
+    ("Secondary Air", _B, 1 << 7, _D, 1 << 3),
+    ("A/C Refrigerant", _C, 1 << 3, _D, 1 << 4),
+    ("Oxygen Sensor", _C, 1 << 4, _D, 1 << 5),
+    ("Oxygen Sensor Heater", _C, 1 << 5, _D, 1 << 6),
+    ("EGR System", _C, 1 << 6, _D, 1 << 7),
+)
+
+_DIESEL_MONITORS: Tuple[Tuple[str, int, int, int, int], ...] = (
+    ("NMHC Catalyst", _C, 1 << 0, _D, 1 << 0),
+    ("NOx/SCR Aftertreatment", _C, 1 << 1, _D, 1 << 1),
+    ("Boost Pressure", _C, 1 << 3, _D, 1 << 3),
+    ("Exhaust Gas Sensor", _C, 1 << 5, _D, 1 << 5),
+    ("PM Filter", _C, 1 << 6, _D, 1 << 6),
+    ("EGR/VVT System", _C, 1 << 7, _D, 1 << 7),
+)
+
 
 class ReadinessMixin:
     def read_readiness(self) -> Dict[str, ReadinessStatus]:
@@ -28,45 +57,14 @@ class ReadinessMixin:
         monitors: Dict[str, ReadinessStatus] = {}
 
         mil_on = bool(A & 0x80)
-        monitors["MIL (Check Engine Light)"] = ReadinessStatus("MIL (Check Engine Light)", True, not mil_on)
-
-        is_spark = not bool(B & 0x08)
-
-        if is_spark:
-            cont = [("Misfire", 0), ("Fuel System", 1), ("Components", 2)]
-            for name, bit in cont:
-                supported = bool(B & (1 << bit))
-                incomplete = bool(C & (1 << bit))
-                monitors[name] = ReadinessStatus(name, supported, (not incomplete) if supported else False)
-
-            noncont = [
-                ("Catalyst", ("B", 4), 0),
-                ("Heated Catalyst", ("B", 5), 1),
-                ("Evaporative System", ("B", 6), 2),
-                ("Secondary Air", ("B", 7), 3),
-                ("A/C Refrigerant", ("C", 3), 4),
-                ("Oxygen Sensor", ("C", 4), 5),
-                ("Oxygen Sensor Heater", ("C", 5), 6),
-                ("EGR System", ("C", 6), 7),
-            ]
-            for name, (src, bit), d_bit in noncont:
-                supported = bool((B if src == "B" else C) & (1 << bit))
-                incomplete = bool(D & (1 << d_bit))
-                monitors[name] = ReadinessStatus(name, supported, (not incomplete) if supported else False)
-
-        else:
-            diesel = [
-                ("NMHC Catalyst", ("C", 0), 0),
-                ("NOx/SCR Aftertreatment", ("C", 1), 1),
-                ("Boost Pressure", ("C", 3), 3),
-                ("Exhaust Gas Sensor", ("C", 5), 5),
-                ("PM Filter", ("C", 6), 6),
-                ("EGR/VVT System", ("C", 7), 7),
-            ]
-            for name, (_src, bit), d_bit in diesel:
-                supported = bool(C & (1 << bit))
-                incomplete = bool(D & (1 << d_bit))
-                monitors[name] = ReadinessStatus(name, supported, (not incomplete) if supported else False)
+        monitors[MIL_MONITOR] = ReadinessStatus(MIL_MONITOR, True, not mil_on)
+
+        data = (A, B, C, D)
+        table = _SPARK_MONITORS if not (B & 0x08) else _DIESEL_MONITORS
+        for name, src, supported_mask, inc_src, incomplete_mask in table:
+            supported = bool(data[src] & supported_mask)
+            incomplete = bool(data[inc_src] & incomplete_mask)
+            monitors[name] = ReadinessStatus(name, supported, (not incomplete) if supported else False)
 
         return monitors
 
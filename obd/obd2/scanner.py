@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional, Callable, List
+from typing import Optional, Callable, Dict, List
 
 from .base import BaseScanner
 from .dtcs import DtcMixin
@@ -29,9 +29,17 @@ class OBDScanner(
     ):
         super().__init__(port=port, baudrate=baudrate, raw_logger=raw_logger)
         self.dtc_db = DTCDatabase(manufacturer=manufacturer)
+        self._desc_cache: Dict[str, str] = {}
+
+    def _on_connected(self) -> bool:
+        connected = super()._on_connected()
+        # One bitmap query per connect lets reads skip PIDs the vehicle lacks
+        self._supported_pids = self._read_supported_pids()
+        return connected
 
     def set_manufacturer(self, manufacturer: str):
         self.dtc_db.set_manufacturer(manufacturer)
+        self._desc_cache.clear()
 
 
 # Backwards/forwards compatible aliases
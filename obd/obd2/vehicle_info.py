@@ -21,7 +21,8 @@ class VehicleInfoMixin:
             info["elm_version"] = self.elm.elm_version or "unknown"
             info["headers_mode"] = "ON" if self.elm.headers_on else "OFF"
 
-            found = self._obd_query_payload("0902", expected_prefix=["49", "02"])
+            # VIN: 3 frames on CAN, 5 messages on the older protocols
+            found = self._obd_query_payload("0902", expected_prefix=["49", "02"], expected_frames=5)
             if found:
                 ecu, payload = found
 
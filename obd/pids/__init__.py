@@ -1,16 +1,28 @@
 from .models import OBDPid
 from .standard_mode01 import PIDS
-from .decode import decode_pid_response
+from .decode import decode_pid_response, decode_pid_response_bytes, decode_pid_responses
 from .registry import get_pid_info, list_available_pids
-from .sets import DIAGNOSTIC_PIDS, TEMPERATURE_PIDS, THROTTLE_PIDS
+from .sets import (
+    DIAGNOSTIC_PIDS,
+    TEMPERATURE_PIDS,
+    THROTTLE_PIDS,
+    DIAGNOSTIC_PID_SET,
+    TEMPERATURE_PID_SET,
+    THROTTLE_PID_SET,
+)
 
 __all__ = [
     "OBDPid",
     "PIDS",
     "decode_pid_response",
+    "decode_pid_response_bytes",
+    "decode_pid_responses",
     "get_pid_info",
     "list_available_pids",
     "DIAGNOSTIC_PIDS",
     "TEMPERATURE_PIDS",
     "THROTTLE_PIDS",
+    "DIAGNOSTIC_PID_SET",
+    "TEMPERATURE_PID_SET",
+    "THROTTLE_PID_SET",
 ]
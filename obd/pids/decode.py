@@ -1,9 +1,61 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
+from ..protocol.payload import HEX2INT
+from .models import OBDPid
 from .standard_mode01 import PIDS
 
+Decoder = Callable[[str], Optional[float]]
+BytesDecoder = Callable[[bytes], Optional[float]]
+
+
+def _make_decoder(pid_info: OBDPid) -> Decoder:
+    formula = pid_info.formula
+    # HEX2INT takes either case, so the slices need no upper()
+    hex2 = HEX2INT.get
+
+    if pid_info.bytes == 1:
+        def decode_a(hex_data: str) -> Optional[float]:
+            if len(hex_data) < 2:
+                return None
+            a = hex2(hex_data[0:2])
+            return None if a is None else formula(a)
+
+        return decode_a
+
+    if pid_info.bytes == 2:
+        def decode_ab(hex_data: str) -> Optional[float]:
+            if len(hex_data) < 4:
+                return None
+            a = hex2(hex_data[0:2])
+            b = hex2(hex_data[2:4])
+            return None if a is None or b is None else formula(a, b)
+
+        return decode_ab
+
+    return lambda hex_data: None
+
+
+def _make_bytes_decoder(pid_info: OBDPid) -> BytesDecoder:
+    formula = pid_info.formula
+
+    if pid_info.bytes == 1:
+        return lambda raw: formula(raw[0]) if len(raw) >= 1 else None
+    if pid_info.bytes == 2:
+        return lambda raw: formula(raw[0], raw[1]) if len(raw) >= 2 else None
+    return lambda raw: None
+
+
+# One decoder per PID, specialized on its byte count at import
+_DECODERS: Dict[str, Decoder] = {pid: _make_decoder(info) for pid, info in PIDS.items()}
+_BYTES_DECODERS: Dict[str, BytesDecoder] = {pid: _make_bytes_decoder(info) for pid, info in PIDS.items()}
+
+
+def decoders_for(pid: str) -> Tuple[Decoder, BytesDecoder]:
+    """(hex string, bytes) decoders of a known PID; KeyError for unknown ones."""
+    return _DECODERS[pid], _BYTES_DECODERS[pid]
+
 
 def decode_pid_response(pid: str, hex_data: str) -> Optional[float]:
     """
@@ -16,23 +68,31 @@ def decode_pid_response(pid: str, hex_data: str) -> Optional[float]:
     Returns:
         float value or None
     """
-    pid = (pid or "").strip().upper()
-    if pid not in PIDS:
+    decode = _DECODERS.get((pid or "").strip().upper())
+    if decode is None or not isinstance(hex_data, str):
         return None
+    return decode(hex_data)
 
-    pid_info = PIDS[pid]
 
-    try:
-        if pid_info.bytes == 1 and len(hex_data) >= 2:
-            a = int(hex_data[0:2], 16)
-            return pid_info.formula(a)
+def decode_pid_response_bytes(pid: str, raw: bytes) -> Optional[float]:
+    """
+    decode_pid_response() for data already converted to bytes
+    (e.g. bytes.fromhex("".join(data_tokens))): no hex parsing per byte.
+    """
+    decode = _BYTES_DECODERS.get((pid or "").strip().upper())
+    if decode is None or not isinstance(raw, (bytes, bytearray)):
+        return None
+    return decode(raw)
 
-        if pid_info.bytes == 2 and len(hex_data) >= 4:
-            a = int(hex_data[0:2], 16)
-            b = int(hex_data[2:4], 16)
-            return pid_info.formula(a, b)
 
-    except (ValueError, TypeError):
-        return None
+def decode_pid_responses(pid: str, hex_payloads: Iterable[str]) -> List[Optional[float]]:
+    """
+    decode_pid_response() for many responses of the same PID.
 
-    return None
+    The PID lookup happens once for the whole batch, which matters when
+    re-decoding a logged stream of raw_hex values.
+    """
+    decode = _DECODERS.get((pid or "").strip().upper())
+    if decode is None:
+        return [None for _ in hex_payloads]
+    return [decode(h) if isinstance(h, str) else None for h in hex_payloads]
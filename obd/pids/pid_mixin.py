@@ -1,12 +1,41 @@
 # obd/obd2/pid_mixin.py
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Optional, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
 
+from ..pids.models import OBDPid
 from ..pids.standard_mode01 import PIDS
-from ..pids.decode import decode_pid_response
+from ..pids.decode import BytesDecoder, Decoder, decoders_for
 from ..pids.sets import DIAGNOSTIC_PIDS
 from ..obd2.models import SensorReading
+from ..protocol import find_prefix, group_by_ecu, merge_payloads
+
+# SAE J1979: a single Mode 01 request may carry up to 6 PIDs
+MAX_PIDS_PER_REQUEST = 6
+
+# data tokens -> (raw hex, decoded value)
+_Parser = Callable[[Sequence[str]], Tuple[str, Optional[float]]]
+
+
+def _make_pid_parser(decode: Decoder, decode_bytes: BytesDecoder) -> _Parser:
+    def parse(data_tokens: Sequence[str]) -> Tuple[str, Optional[float]]:
+        # Tokens come clean and uppercase from normalize_tokens()
+        data_hex = "".join(data_tokens)
+        try:
+            # Whole-byte data (the normal case) is converted in one C call
+            return data_hex, decode_bytes(bytes.fromhex(data_hex))
+        except ValueError:
+            return data_hex, decode(data_hex)
+
+    return parse
+
+
+# Everything read_pid() needs per PID, built once at import:
+# (request, expected reply prefix, metadata, parser)
+_PID_QUERIES: Dict[str, Tuple[str, List[str], OBDPid, _Parser]] = {
+    pid: (f"01{pid}", ["41", pid], info, _make_pid_parser(*decoders_for(pid))) for pid, info in PIDS.items()
+}
 
 
 class PidMixin:
@@ -14,9 +43,15 @@ class PidMixin:
     Mode 01 PID reads over the base OBD2 query engine.
 
     Expects parent class to implement:
-      - _obd_query_payload(command: str, expected_prefix: List[str])
+      - _obd_query_payload(command: str, expected_prefix: List[str], expected_frames: Optional[int] = None,
+          reassemble: bool = False)
           -> Optional[tuple[str, List[str]]]
             where payload tokens look like: ["41", "<PID>", "<A>", "<B>", ...]
+      - _multi_pid_supported: bool (batched reads allowed)
+      - _supported_pids: Optional[FrozenSet[str]] (None = not known, read everything)
+      - _responding_ecus: Optional[int], set from the 0100 reply
+      - _send_obd_lines_retry(command: str, retries: int) and elm.headers_on,
+          for _read_supported_pids()
     """
 
     def read_pid(
@@ -35,6 +70,18 @@ class PidMixin:
           - if True, returns SensorReading even if decoder returns None (value=None)
             (default False)
         """
+        answer = self._query_pid(pid)
+        if answer is None:
+            return None
+        return self._build_reading(*answer, round_to=round_to, allow_empty=allow_empty)
+
+    def _query_pid(
+        self, pid: str
+    ) -> Optional[Tuple[str, OBDPid, _Parser, List[str], Optional[str]]]:
+        """
+        Round-trip half of read_pid(): sends the request and checks the reply.
+        Returns (pid, pid_info, parse, data_tokens, ecu) for _build_reading(), or None.
+        """
         if pid is None:
             return None
 
@@ -46,11 +93,18 @@ class PidMixin:
         if len(pid) == 1:
             pid = "0" + pid
 
-        pid_info = PIDS.get(pid)
-        if not pid_info:
+        # Don't spend an ELM timeout on a PID the vehicle says it lacks
+        supported = self._supported_pids
+        if supported is not None and pid not in supported:
+            return None
+
+        query = _PID_QUERIES.get(pid)
+        if not query:
             return None
+        command, prefix, pid_info, parse = query
 
-        found = self._obd_query_payload(f"01{pid}", expected_prefix=["41", pid])
+        # Single-PID answers fit in one frame
+        found = self._obd_query_payload(command, expected_prefix=prefix, expected_frames=1)
         if not found:
             return None
 
@@ -60,13 +114,24 @@ class PidMixin:
 
         # Defensive: ensure it actually matches what we expect
         # payload example: ["41", "0C", "1A", "F8"]
-        if payload[0].upper() != "41" or payload[1].upper() != pid:
+        # Tokens come uppercase from normalize_tokens()
+        if payload[0] != "41" or payload[1] != pid:
             return None
 
-        data_tokens = payload[2:]
-        data_hex = "".join(t.strip() for t in data_tokens if t and t.strip()).upper()
+        return pid, pid_info, parse, payload[2:], ecu
 
-        value = decode_pid_response(pid, data_hex)
+    def _build_reading(
+        self,
+        pid: str,
+        pid_info: OBDPid,
+        parse: _Parser,
+        data_tokens: Sequence[str],
+        ecu: Optional[str],
+        *,
+        round_to: int = 2,
+        allow_empty: bool = False,
+    ) -> Optional[SensorReading]:
+        data_hex, value = parse(data_tokens)
 
         if value is None and not allow_empty:
             return None
@@ -108,6 +173,188 @@ class PidMixin:
           - if True, raises exceptions (useful in tests)
           - if False, continues scanning and skips failures
         """
+        normalized = self._normalize_pids(pids, dedupe=dedupe)
+
+        results: Dict[str, SensorReading] = {}
+
+        for pid in normalized:
+            try:
+                reading = self.read_pid(pid, round_to=round_to)
+                if reading:
+                    results[pid] = reading
+            except Exception:
+                if stop_on_error:
+                    raise
+                # continue scanning even if one PID breaks
+                continue
+
+        return results
+
+    def read_live_data_pipelined(
+        self,
+        pids: Optional[Sequence[str]] = None,
+        *,
+        round_to: int = 2,
+        dedupe: bool = True,
+        stop_on_error: bool = False,
+    ) -> Dict[str, SensorReading]:
+        """
+        read_live_data() with decode overlapped with I/O: each PID's reply is
+        decoded into a SensorReading on a worker thread while the next request
+        is already on the wire. The serial port is only used from this thread.
+        """
+        normalized = self._normalize_pids(pids, dedupe=dedupe)
+
+        results: Dict[str, SensorReading] = {}
+        jobs: List[Tuple[str, "Future[Optional[SensorReading]]"]] = []
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="pid-decode") as pool:
+            for pid in normalized:
+                try:
+                    answer = self._query_pid(pid)
+                except Exception:
+                    if stop_on_error:
+                        raise
+                    continue
+                if answer is not None:
+                    jobs.append((pid, pool.submit(self._build_reading, *answer, round_to=round_to)))
+
+            for pid, job in jobs:
+                try:
+                    reading = job.result()
+                except Exception:
+                    if stop_on_error:
+                        raise
+                    continue
+                if reading:
+                    results[pid] = reading
+
+        return results
+
+    def read_live_data_batched(
+        self,
+        pids: Optional[Sequence[str]] = None,
+        *,
+        round_to: int = 2,
+        stop_on_error: bool = False,
+    ) -> Dict[str, SensorReading]:
+        """
+        Read a set of PIDs (Mode 01) packing up to 6 PIDs per request.
+
+        One "01 0C 0D 05 ..." round-trip replaces one round-trip per PID.
+        The response is walked as "41 <PID> <bytes...> <PID> <bytes...>",
+        slicing each PID by its known data length.
+
+        PIDs missing from a batched answer (unsupported PID, or an ECU/protocol
+        that only answers single-PID requests) fall back to read_pid().
+        If a batch request gets no answer at all, batching is disabled for
+        this scanner until the next connect().
+        """
+        normalized = self._normalize_pids(pids, dedupe=True)
+
+        results: Dict[str, SensorReading] = {}
+        supported = self._supported_pids
+        batchable = [p for p in normalized if p in PIDS and (supported is None or p in supported)]
+
+        if self._multi_pid_supported and len(batchable) > 1:
+            for start in range(0, len(batchable), MAX_PIDS_PER_REQUEST):
+                chunk = batchable[start : start + MAX_PIDS_PER_REQUEST]
+                try:
+                    found = self._read_pid_batch(chunk, round_to=round_to)
+                except Exception:
+                    if stop_on_error:
+                        raise
+                    continue
+                if not found:
+                    self._multi_pid_supported = False
+                    break
+                results.update(found)
+
+        missing = [p for p in normalized if p not in results]
+        if missing:
+            results.update(
+                self.read_live_data(missing, round_to=round_to, stop_on_error=stop_on_error)
+            )
+
+        # Keep the caller's PID order
+        return {pid: results[pid] for pid in normalized if pid in results}
+
+    def _read_pid_batch(self, chunk: Sequence[str], *, round_to: int = 2) -> Dict[str, SensorReading]:
+        found = self._obd_query_payload("01" + "".join(chunk), expected_prefix=["41"], reassemble=True)
+        if not found:
+            return {}
+
+        ecu, payload = found
+        pending = set(chunk)
+        out: Dict[str, SensorReading] = {}
+
+        # payload example: ["41", "0C", "1A", "F8", "0D", "00", "05", "7B"]
+        i = 1
+        n = len(payload)
+        while i < n and pending:
+            pid = payload[i]
+            if pid not in pending:
+                # Padding, or a PID we can't size: nothing after it can be trusted
+                break
+
+            _command, _prefix, pid_info, parse = _PID_QUERIES[pid]
+            size = pid_info.bytes
+            data_tokens = payload[i + 1 : i + 1 + size]
+            if len(data_tokens) < size:
+                break
+
+            pending.discard(pid)
+            i += 1 + size
+
+            reading = self._build_reading(pid, pid_info, parse, data_tokens, ecu, round_to=round_to)
+            if reading:
+                out[pid] = reading
+
+        return out
+
+    def _read_supported_pids(self) -> Optional[FrozenSet[str]]:
+        """
+        Mode 01 PIDs advertised by the 0100/0120/0140/0160 bitmaps, OR'ed over
+        every answering ECU. None when a range the vehicle advertises can't be
+        read, so callers fall back to trying every PID.
+        """
+        supported: Set[str] = set()
+        for base in (0x00, 0x20, 0x40, 0x60):
+            bitmap = self._read_pid_bitmap(f"{base:02X}")
+            if bitmap is None:
+                return None
+            supported.update(f"{base + 1 + bit:02X}" for bit in range(32) if bitmap & (0x80000000 >> bit))
+            # Last bit: "PIDs base+0x21..base+0x40 supported"
+            if not bitmap & 1:
+                break
+        return frozenset(supported)
+
+    def _read_pid_bitmap(self, base_pid: str) -> Optional[int]:
+        try:
+            lines = self._send_obd_lines_retry(f"01{base_pid}", retries=1)
+        except Exception:
+            return None
+        headers_on = self.elm.headers_on
+        prefix = ["41", base_pid]
+        bitmap: Optional[int] = None
+        answered = 0
+        for payload in merge_payloads(group_by_ecu(lines, headers_on=headers_on), headers_on=headers_on).values():
+            i = find_prefix(payload, prefix)
+            data = payload[i + 2 : i + 6] if i >= 0 else []
+            if len(data) < 4:
+                continue
+            try:
+                bitmap = (bitmap or 0) | int("".join(data), 16)
+            except ValueError:
+                continue
+            answered += 1
+        if base_pid == "00" and headers_on:
+            # Every emission ECU answers 0100: this is how many reply to a mode 01 query
+            self._responding_ecus = answered
+        return bitmap
+
+    @staticmethod
+    def _normalize_pids(pids: Optional[Iterable[str]], *, dedupe: bool = True) -> List[str]:
         pid_list: Iterable[str] = pids if pids is not None else DIAGNOSTIC_PIDS
 
         # Dedupe while preserving order
@@ -128,20 +375,7 @@ class PidMixin:
                 seen.add(p)
             normalized.append(p)
 
-        results: Dict[str, SensorReading] = {}
-
-        for pid in normalized:
-            try:
-                reading = self.read_pid(pid, round_to=round_to)
-                if reading:
-                    results[pid] = reading
-            except Exception:
-                if stop_on_error:
-                    raise
-                # continue scanning even if one PID breaks
-                continue
-
-        return results
+        return normalized
 
 
 __all__ = ["PidMixin"]
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
-# Commonly useful for troubleshooting
-DIAGNOSTIC_PIDS = ["05", "0C", "0D", "11", "45", "49", "4A", "4C", "42", "0B", "06", "07"]
+from typing import FrozenSet, Tuple
 
-TEMPERATURE_PIDS = ["05", "0F", "5C"]
+# Commonly useful for troubleshooting (tuples keep the read/display order)
+DIAGNOSTIC_PIDS: Tuple[str, ...] = ("05", "0C", "0D", "11", "45", "49", "4A", "4C", "42", "0B", "06", "07")
 
-THROTTLE_PIDS = ["11", "45", "47", "4C", "49", "4A"]
+TEMPERATURE_PIDS: Tuple[str, ...] = ("05", "0F", "5C")
+
+THROTTLE_PIDS: Tuple[str, ...] = ("11", "45", "47", "4C", "49", "4A")
+
+# Same groups for O(1) membership tests
+DIAGNOSTIC_PID_SET: FrozenSet[str] = frozenset(DIAGNOSTIC_PIDS)
+TEMPERATURE_PID_SET: FrozenSet[str] = frozenset(TEMPERATURE_PIDS)
+THROTTLE_PID_SET: FrozenSet[str] = frozenset(THROTTLE_PIDS)
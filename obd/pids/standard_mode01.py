@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from types import MappingProxyType
+from typing import Mapping
+
 from .models import OBDPid
 
-# Mode 01 - Live Data PIDs
-PIDS = {
+# Mode 01 - Live Data PIDs (read-only registry)
+PIDS: Mapping[str, OBDPid] = MappingProxyType({
     "04": OBDPid(
         pid="04",
         name="Calculated Engine Load",
@@ -254,4 +257,4 @@ PIDS = {
         max_value=1.275,
         description="Bank 1 Sensor 2 O2 voltage",
     ),
-}
+})
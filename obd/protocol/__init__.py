@@ -1,17 +1,21 @@
 # obd/protocol/__init__.py
-from .normalize import normalize_tokens
-from .ecu import group_by_ecu, merge_payloads, find_obd_response_payload
+from .normalize import normalize_tokens, normalize_lines
+from .ecu import group_by_ecu, merge_payloads, find_obd_response_payload, find_prefix, single_ecu_payload
 from .payload import payload_from_tokens
-from .isotp import strip_isotp_pci_from_payload
+from .isotp import reassemble_isotp_frames, strip_isotp_pci_from_payload
 from .ascii import extract_ascii_from_hex_tokens, is_valid_vin
 
 __all__ = [
     "normalize_tokens",
+    "normalize_lines",
     "group_by_ecu",
     "merge_payloads",
     "find_obd_response_payload",
+    "find_prefix",
+    "single_ecu_payload",
     "payload_from_tokens",
     "strip_isotp_pci_from_payload",
+    "reassemble_isotp_frames",
     "extract_ascii_from_hex_tokens",
     "is_valid_vin",
 ]
@@ -4,10 +4,22 @@ import re
 from typing import List
 
 VIN_RE = re.compile(r"^[A-HJ-NPR-Z0-9]{17}$")  # excluye I,O,Q
+# Mismo alfabeto que VIN_RE, para validar sin pasar por el motor de regex
+_VIN_CHARS = frozenset("ABCDEFGHJKLMNPRSTUVWXYZ0123456789")
+
+# Todo byte fuera de ASCII imprimible (32..126), para bytes.translate()
+_NON_PRINTABLE = bytes(b for b in range(256) if not 32 <= b <= 126)
 
 def extract_ascii_from_hex_tokens(tokens: List[str]) -> str:
+    tokens = tokens or []
+    # Caso normal (tokens de 2 dígitos): decodificar todo de una con fromhex
+    try:
+        if all(len(t) == 2 for t in tokens):
+            return bytes.fromhex(" ".join(tokens)).translate(None, _NON_PRINTABLE).decode("ascii")
+    except (TypeError, ValueError):
+        pass
     s = ""
-    for t in tokens or []:
+    for t in tokens:
         try:
             b = int(t, 16)
         except Exception:
@@ -18,4 +30,4 @@ def extract_ascii_from_hex_tokens(tokens: List[str]) -> str:
 
 def is_valid_vin(vin: str) -> bool:
     vin = (vin or "").strip().upper()
-    return bool(VIN_RE.match(vin))
+    return len(vin) == 17 and _VIN_CHARS.issuperset(vin)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from itertools import chain
 from typing import Dict, List, Optional, Tuple
 
-from .normalize import is_noise, normalize_tokens, is_hexish_tokens
+from .normalize import normalize_lines
 from .payload import payload_from_tokens
 
 def group_by_ecu(lines: List[str], headers_on: bool = True) -> Dict[str, List[List[str]]]:
@@ -11,34 +12,21 @@ def group_by_ecu(lines: List[str], headers_on: bool = True) -> Dict[str, List[Li
       ecu -> [ [tokens_line1], [tokens_line2], ... ]
     """
     out: Dict[str, List[List[str]]] = {}
-    for ln in lines or []:
-        if not ln:
-            continue
-        if is_noise(ln):
-            continue
-
-        tokens = normalize_tokens(ln)
-        if not tokens or not is_hexish_tokens(tokens):
-            continue
-
-        if headers_on:
-            ecu = tokens[0]
-            out.setdefault(ecu, []).append(tokens)
-        else:
-            out.setdefault("NOHDR", []).append(tokens)
+    # normalize_lines() drops noise and only keeps hex digits, so no further validation
+    for tokens in normalize_lines(lines):
+        ecu = tokens[0] if headers_on else "NOHDR"
+        out.setdefault(ecu, []).append(tokens)
     return out
 
 def merge_payloads(grouped: Dict[str, List[List[str]]], headers_on: bool = True) -> Dict[str, List[str]]:
     """
     Aplana todas las líneas por ECU en un solo payload (lista de tokens hex).
     """
-    merged: Dict[str, List[str]] = {}
-    for ecu, msgs in (grouped or {}).items():
-        out: List[str] = []
-        for msg in msgs:
-            out.extend(payload_from_tokens(msg, headers_on=headers_on))
-        merged[ecu] = out
-    return merged
+    # dict keeps the ECU order of first appearance; chain builds each list in one go
+    return {
+        ecu: list(chain.from_iterable(payload_from_tokens(msg, headers_on=headers_on) for msg in msgs))
+        for ecu, msgs in (grouped or {}).items()
+    }
 
 def find_obd_response_payload(
     merged_payloads: Dict[str, List[str]],
@@ -59,12 +47,37 @@ def find_obd_response_payload(
         rest = [e for e in ecu_order if e not in preferred]
         ecu_order = preferred + rest
 
-    n = len(expected_prefix)
     for ecu in ecu_order:
         payload = merged_payloads.get(ecu, [])
-        if len(payload) < n:
-            continue
-        for i in range(0, len(payload) - n + 1):
-            if payload[i : i + n] == expected_prefix:
-                return ecu, payload[i:]
+        i = find_prefix(payload, expected_prefix)
+        if i >= 0:
+            return ecu, payload[i:]
     return None
+
+def find_prefix(payload: List[str], expected_prefix: List[str]) -> int:
+    """
+    Índice donde empieza expected_prefix dentro de payload, o -1.
+    """
+    n = len(expected_prefix)
+    if not n:
+        return -1
+    first = expected_prefix[0]
+    second = expected_prefix[1] if n > 1 else None
+    last = len(payload) - n + 1
+    # list.index() scans for the first token in C; the usual 1-2 token
+    # prefixes are then checked without slicing the payload
+    i = -1
+    while True:
+        try:
+            i = payload.index(first, i + 1, last)
+        except ValueError:
+            return -1
+        if n == 1 or (payload[i + 1] == second and (n == 2 or payload[i + 2 : i + n] == expected_prefix[2:])):
+            return i
+
+def single_ecu_payload(lines: List[str]) -> List[str]:
+    """
+    Headers OFF: merge_payloads(group_by_ecu(lines, False), False)["NOHDR"]
+    sin armar los dicts intermedios.
+    """
+    return list(chain.from_iterable(payload_from_tokens(tokens, headers_on=False) for tokens in normalize_lines(lines)))
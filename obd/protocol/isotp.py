@@ -1,6 +1,15 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Dict, List, Optional
+
+# Byte PCI -> cuántos tokens saltar, según el tipo de frame (nibble alto):
+# - 0x0? Single frame: 1 byte PCI
+# - 0x1? First frame: 2 bytes PCI (1? + length)
+# - 0x2? Consecutive frame: 1 byte PCI
+# - 0x3? Flow control: lo más seguro es saltar este byte y los siguientes 2
+# Incluye minúsculas para no tener que hacer upper() antes de buscar
+_PCI_SKIP: Dict[str, int] = {f"{b:02X}": (1, 2, 1, 3)[b >> 4] for b in range(0x40)}
+_PCI_SKIP.update({k.lower(): v for k, v in _PCI_SKIP.items()})
 
 def strip_isotp_pci_from_payload(payload: List[str]) -> List[str]:
     """
@@ -13,46 +22,48 @@ def strip_isotp_pci_from_payload(payload: List[str]) -> List[str]:
     out: List[str] = []
     i = 0
     n = len(payload or [])
+    skip_for = _PCI_SKIP
 
     while i < n:
-        t = (payload[i] or "").upper()
-        if len(t) != 2:
-            # Si no es byte, lo dejamos pasar
-            out.append(t)
-            i += 1
-            continue
-
-        try:
-            b = int(t, 16)
-        except ValueError:
-            out.append(t)
-            i += 1
-            continue
-
-        frame_type = (b & 0xF0) >> 4  # high nibble
-
-        # 0x0? Single frame (1 byte PCI)
-        if frame_type == 0x0:
-            i += 1
+        t = payload[i] or ""
+        # Tokens que no son byte, o bytes de datos (0x4?..0xF?), pasan en mayúsculas
+        skip = skip_for.get(t)
+        if skip:
+            i += skip
             continue
+        out.append(t.upper())
+        i += 1
 
-        # 0x1? First frame (2 bytes PCI: 1? + length)
-        if frame_type == 0x1:
-            i += 2
-            continue
+    return out
 
-        # 0x2? Consecutive frame (1 byte PCI)
-        if frame_type == 0x2:
-            i += 1
-            continue
+def reassemble_isotp_frames(frames: List[List[str]]) -> Optional[List[str]]:
+    """
+    Rebuild an ISO-TP First Frame + Consecutive Frames response.
 
-        # 0x3? Flow control: generalmente no queremos esos bytes
-        if frame_type == 0x3:
-            # lo más seguro: saltar este byte y los siguientes 2 si existen
-            i += 3
+    Each frame still carries its CAN header token. Returns None when the
+    response does not start with a First Frame.
+    """
+    total: Optional[int] = None
+    out: List[str] = []
+    for frame in frames:
+        data = frame[1:]
+        if not data:
             continue
-
-        out.append(t)
-        i += 1
-
-    return out
+        try:
+            pci = int(data[0], 16)
+        except ValueError:
+            return None
+        kind = pci >> 4
+        if total is None:
+            if kind != 0x1 or len(data) < 2:
+                return None
+            try:
+                total = ((pci & 0x0F) << 8) | int(data[1], 16)
+            except ValueError:
+                return None
+            out.extend(data[2:])
+        elif kind == 0x2:
+            out.extend(data[1:])
+    if total is None:
+        return None
+    return out[:total]
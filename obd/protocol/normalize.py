@@ -19,29 +19,75 @@ NOISE_PREFIXES = (
     "DATA ERROR",
 )
 
-def is_noise(line: str) -> bool:
-    up = (line or "").strip().upper()
-    if not up:
-        return True
+# Blank, a bare "OK", an ELM327 banner or any noise prefix, in one match()
+_NOISE_RE = re.compile(
+    r"\s*(?:$|OK\s*$|ELM327|" + "|".join(re.escape(p) for p in NOISE_PREFIXES) + ")",
+    re.IGNORECASE,
+)
 
-    # OK como línea suelta
-    if up == "OK":
-        return True
+# Every byte value that isn't an uppercase hex digit, for bytes.translate(None, ...)
+NON_HEX_BYTES = bytes(b for b in range(256) if b not in b"0123456789ABCDEF")
 
-    # ELM327 version banners
-    if up.startswith("ELM327"):
-        return True
+# bytes.translate tables for normalize_tokens(): keep hex digits, spaces and
+# ":" (turned into a space), uppercase a-f, delete every other byte
+_TOKEN_TABLE = bytes.maketrans(b"abcdef:", b"ABCDEF ")
+_TOKEN_DELETE = bytes(b for b in range(256) if b not in b"0123456789ABCDEFabcdef :")
+# Same, but "\n" survives so several lines can be cleaned in one pass
+_LINES_DELETE = bytes(b for b in _TOKEN_DELETE if b != 0x0A)
 
-    return any(up.startswith(p) for p in NOISE_PREFIXES)
+def is_noise(line: str) -> bool:
+    return _NOISE_RE.match(line or "") is not None
 
 def normalize_tokens(line: str) -> List[str]:
     """
     Limpia una línea a solo hex y espacios, devuelve tokens uppercase.
+
+    Con ATS0 (sin espacios) el ELM manda bytes pegados: "410C1AF8",
+    "7E8064100BE3EA813" o "0:410C1AF8". Se parten en bytes igual que con ATS1:
+    - ":" (índice de frame multi-línea) actúa como separador
+    - token par > 2 -> pares de bytes
+    - token impar > 3 -> header CAN 11-bit (3 chars) + pares de bytes
     """
     if not line:
         return []
-    clean = re.sub(r"[^0-9A-Fa-f ]", "", line)
-    return [t.upper() for t in clean.split() if t]
+    clean = line.encode("ascii", "ignore").translate(_TOKEN_TABLE, _TOKEN_DELETE).decode("ascii")
+    return _split_tokens(clean)
+
+def normalize_lines(lines: List[str]) -> List[List[str]]:
+    """
+    normalize_tokens() para una respuesta completa: descarta las líneas de
+    ruido y las que quedan vacías, y limpia el resto en una sola pasada.
+    """
+    match_noise = _NOISE_RE.match
+    kept = [ln for ln in lines or [] if ln and not match_noise(ln)]
+    if not kept:
+        return []
+    joined = "\n".join(kept)
+    if joined.count("\n") != len(kept) - 1:
+        # Alguna línea trae "\n" propio: limpiar una por una
+        cleaned = [normalize_tokens(ln) for ln in kept]
+        return [tokens for tokens in cleaned if tokens]
+    blob = joined.encode("ascii", "ignore").translate(_TOKEN_TABLE, _LINES_DELETE).decode("ascii")
+    out: List[List[str]] = []
+    for clean in blob.split("\n"):
+        tokens = _split_tokens(clean)
+        if tokens:
+            out.append(tokens)
+    return out
+
+def _split_tokens(clean: str) -> List[str]:
+    tokens: List[str] = []
+    for t in clean.split():
+        n = len(t)
+        if n <= 3:
+            tokens.append(t)
+            continue
+        start = 0
+        if n % 2:
+            tokens.append(t[:3])
+            start = 3
+        tokens.extend(t[i : i + 2] for i in range(start, n, 2))
+    return tokens
 
 def is_hexish_tokens(tokens: List[str]) -> bool:
     if not tokens:
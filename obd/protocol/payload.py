@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Dict, List
+
+_HEX_DIGITS = "0123456789ABCDEFabcdef"
+# 1- and 2-digit hex token -> value, so the LEN check needs no int()/try
+HEX2INT: Dict[str, int] = {a: int(a, 16) for a in _HEX_DIGITS}
+HEX2INT.update({a + b: int(a + b, 16) for a in _HEX_DIGITS for b in _HEX_DIGITS})
 
 def payload_from_tokens(tokens: List[str], headers_on: bool = True) -> List[str]:
     """
@@ -21,17 +26,11 @@ def payload_from_tokens(tokens: List[str], headers_on: bool = True) -> List[str]
         return []
 
     # drop "LEN" si encaja
-    ln_tok = rest[0]
-    if len(ln_tok) in (1, 2):
-        try:
-            ln = int(ln_tok, 16)
-            remaining = len(rest) - 1
-            # Heurística conservadora:
-            # - ln > 0
-            # - ln <= remaining (encaja exacto o al menos plausible)
-            if 0 < ln <= remaining:
-                return rest[1:]
-        except ValueError:
-            pass
+    # Heurística conservadora:
+    # - ln > 0
+    # - ln <= remaining (encaja exacto o al menos plausible)
+    ln = HEX2INT.get(rest[0])
+    if ln is not None and 0 < ln <= len(rest) - 1:
+        return rest[1:]
 
     return rest
@@ -1,18 +1,165 @@
+import atexit
+import queue
+import sys
+import threading
 import time
+import weakref
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, Optional, TextIO
 
 from app.infrastructure.persistence.data_paths import logs_dir
 
+# Entries are queued to a writer thread, which buffers them and writes once
+# the buffer reaches FLUSH_BYTES or FLUSH_INTERVAL_S has passed since the last write.
+FLUSH_BYTES = 64 * 1024
+FLUSH_INTERVAL_S = 1.0
+# Entries kept for a retry while writes fail; past this they are dropped
+MAX_PENDING_BYTES = 16 * FLUSH_BYTES
+
+_STOP = object()
+
 class RawLogger:
     def __init__(self, path: Optional[str] = None):
         default_path = logs_dir() / "obd_raw.log"
         self.path = Path(path) if path else default_path
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        # The writer thread owns the file; it holds no reference back to self
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._writer_thread: Optional[threading.Thread] = None
+        # First write failure seen by the writer, raised by flush()/close()
+        self._errors: List[Exception] = []
+        # Several threads may log at once (auto_connect probes): start one writer only
+        self._start_lock = threading.Lock()
+        self._closed = False
+        # Timestamp text only changes once a second; reuse it within the second
+        self._ts_sec = -1
+        self._ts_str = ""
+        _live_loggers.add(self)
 
     def __call__(self, direction: str, command: str, lines: List[str]):
-        ts = time.strftime("%Y-%m-%d %H:%M:%S")
-        with self.path.open("a", encoding="utf-8") as f:
-            f.write(f"[{ts}] {direction} {command}\n")
-            for ln in lines:
-                f.write(f"  {ln}\n")
+        if self._closed:
+            return
+        now = int(time.time())
+        if now != self._ts_sec:
+            self._ts_sec = now
+            self._ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        if self._writer_thread is None:
+            self._start_writer()
+        self._queue.put((self._ts_str, direction, command, tuple(lines)))
+
+    def _start_writer(self) -> None:
+        with self._start_lock:
+            if self._writer_thread is not None:
+                return
+            thread = threading.Thread(
+                target=_write_entries, args=(self._queue, self.path, self._errors), name="raw-log-writer", daemon=True
+            )
+            thread.start()
+            self._writer_thread = thread
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Block until every entry logged so far has been written."""
+        if self._writer_thread is None or self._closed:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+        self._raise_write_error()
+
+    def close(self) -> None:
+        """Write pending entries, stop the writer thread and close the file."""
+        self._stop(join=True)
+        self._raise_write_error()
+
+    def _raise_write_error(self) -> None:
+        if self._errors:
+            raise self._errors.pop()
+
+    def _stop(self, join: bool) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        with self._start_lock:
+            thread = self._writer_thread
+        if thread is None:
+            return
+        self._queue.put(_STOP)
+        if join and thread is not threading.current_thread():
+            thread.join()
+
+    def __del__(self):
+        # Don't block the garbage collector; the writer drains and exits on its own
+        self._stop(join=False)
+
+
+def _write_entries(q: "queue.SimpleQueue[Any]", path: Path, errors: List[Exception]) -> None:
+    f: Optional[TextIO] = None
+    pending: List[str] = []
+    pending_bytes = 0
+    last_flush = time.monotonic()
+
+    def write_out() -> None:
+        nonlocal f, pending_bytes
+        if not pending:
+            return
+        data = "".join(pending)
+        try:
+            if f is None:
+                f = path.open("a", encoding="utf-8")
+            f.write(data)
+            f.flush()
+        except (OSError, ValueError) as exc:
+            # Report the first failure once; keep the entries for the next
+            # attempt, with a reopened file, unless too much has piled up
+            if not errors:
+                errors.append(exc)
+            if f is not None:
+                try:
+                    f.close()
+                except (OSError, ValueError):
+                    pass
+                f = None
+            if pending_bytes < MAX_PENDING_BYTES:
+                return
+        pending.clear()
+        pending_bytes = 0
+
+    while True:
+        try:
+            item = q.get(timeout=FLUSH_INTERVAL_S)
+        except queue.Empty:
+            item = None
+        if item is _STOP:
+            write_out()
+            if f is not None:
+                try:
+                    f.close()
+                except OSError:
+                    pass
+            return
+        if isinstance(item, threading.Event):
+            write_out()
+            item.set()
+            continue
+        if item is not None:
+            ts, direction, command, lines = item
+            entry = f"[{ts}] {direction} {command}\n" + "".join(f"  {ln}\n" for ln in lines)
+            pending.append(entry)
+            pending_bytes += len(entry)
+        now = time.monotonic()
+        if pending_bytes >= FLUSH_BYTES or now - last_flush >= FLUSH_INTERVAL_S:
+            write_out()
+            last_flush = now
+
+
+# Loggers still alive at exit get their queued entries written out
+_live_loggers: "weakref.WeakSet[RawLogger]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_live_loggers() -> None:
+    for logger in list(_live_loggers):
+        try:
+            logger.close()
+        except (OSError, ValueError) as exc:
+            print(f"raw log {logger.path}: {exc}", file=sys.stderr)
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from functools import lru_cache
 
+
+@lru_cache(maxsize=128)
 def normalize_brand(brand: str) -> str:
     cleaned = (brand or "").strip().lower().replace(" ", "_")
     if cleaned in {"landrover", "land_rover", "land-rover"}:
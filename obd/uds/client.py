@@ -1,27 +1,47 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from ..elm import ELM327
 from .decoder import decode_did_value
 from .dids import find_did, find_did_by_name
 from .routines import find_routine
-from .services import UdsService
+from .services import NEGATIVE_RESPONSE_SID, UdsService, single_byte
 from .transport import UdsTransport
 from .exceptions import UdsNegativeResponse, UdsResponseError
 from .modules import find_module
 from .brands import normalize_brand
 
 
+# DID scans convert the same identifiers over and over; both helpers are pure
+@lru_cache(maxsize=4096)
 def _to_did_bytes(did: str | int) -> bytes:
     if isinstance(did, int):
         return did.to_bytes(2, byteorder="big")
-    cleaned = did.strip().replace("0x", "").replace(" ", "")
-    return int(cleaned, 16).to_bytes(2, byteorder="big")
+    try:
+        # int() already accepts surrounding whitespace and a 0x prefix
+        value = int(did, 16)
+    except ValueError:
+        value = int(did.strip().replace("0x", "").replace(" ", ""), 16)
+    return value.to_bytes(2, byteorder="big")
+
+
+@lru_cache(maxsize=4096)
+def _did_hex(did_bytes: bytes) -> str:
+    """2-byte DID as 4 uppercase hex digits (b"\\xf1\\x90" -> "F190")."""
+    return f"{int.from_bytes(did_bytes, 'big'):04X}"
+
+
+# A CAN single frame carries 7 data bytes: SID 0x22 plus three 2-byte DIDs.
+# The ELM327 cannot send multi-frame requests without manual flow control.
+MAX_DIDS_PER_REQUEST = 3
 
 
 def _to_hex_bytes(value: str) -> bytes:
-    cleaned = (value or "").strip().replace("0x", "").replace(" ", "")
+    if not value:
+        return b""
+    cleaned = value.strip().replace("0x", "").replace(" ", "")
     return bytes.fromhex(cleaned) if cleaned else b""
 
 
@@ -111,14 +131,15 @@ class UdsClient:
         if not response:
             raise UdsResponseError("Empty UDS response")
 
-        if UdsService.is_negative_response(response):
-            svc, nrc = UdsService.parse_negative(response)
-            raise UdsNegativeResponse(svc, nrc)
+        first = response[0]
+        # Same test as UdsService.is_negative_response, inlined for DID scans
+        if first == NEGATIVE_RESPONSE_SID and len(response) >= 3:
+            raise UdsNegativeResponse(response[1], response[2])
 
         expected = UdsService.positive_response(service_id)
-        if response[0] != expected:
+        if first != expected:
             raise UdsResponseError(
-                f"Unexpected response SID 0x{response[0]:02X} "
+                f"Unexpected response SID 0x{first:02X} "
                 f"(expected 0x{expected:02X})"
             )
 
@@ -170,7 +191,7 @@ class UdsClient:
           - 0x01: default session
           - 0x03: extended diagnostic session
         """
-        self._send_and_expect(0x10, bytes([session_type]))
+        self._send_and_expect(0x10, single_byte(session_type))
 
     def tester_present(self) -> None:
         """Send Tester Present (0x3E 00)."""
@@ -192,21 +213,101 @@ class UdsClient:
             "value": "1HGCM82633A004352"
           }
         """
-        norm_brand = normalize_brand(brand)
-        did_str = f"{int(did):04X}" if isinstance(did, int) else did
-        entry = find_did(norm_brand, did_str)
+        return self._read_did(normalize_brand(brand), did)
 
+    def _read_did(
+        self, norm_brand: str, did: str | int, entry: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """read_did() for an already normalized brand, optionally with the DID's catalog entry."""
         did_bytes = _to_did_bytes(did)
         response = self._send_and_expect(0x22, did_bytes)
 
         if len(response) < 3:
             raise UdsResponseError("Response too short for DID read")
 
-        resp_did = response[1:3]
-        data = response[3:]
+        return self._did_info(norm_brand, response[1:3], response[3:], entry)
 
+    def read_dids(self, brand: str, dids: Sequence[str | int]) -> List[Dict[str, Any]]:
+        """
+        Read several DIDs with as few 0x22 requests as possible.
+
+        DIDs are packed MAX_DIDS_PER_REQUEST per request and the positive
+        response is split on the requested DID identifiers. DIDs the ECU
+        left out, every DID of a request rejected with a negative response,
+        and every DID of a response that cannot be split unambiguously are
+        retried one at a time. Results keep the requested order; a DID
+        that still fails carries an "error" key instead of "raw".
+        """
+        norm_brand = normalize_brand(brand)
+        wanted = [_to_did_bytes(did) for did in dids]
+        by_did: Dict[bytes, Dict[str, Any]] = {}
+
+        for i in range(0, len(wanted), MAX_DIDS_PER_REQUEST):
+            chunk = wanted[i : i + MAX_DIDS_PER_REQUEST]
+            if len(chunk) < 2:
+                continue
+            try:
+                response = self._send_and_expect(0x22, b"".join(chunk))
+            except UdsNegativeResponse:
+                # 0x13 (request too long), 0x31 (none of them supported), ...:
+                # the single reads below find out which DIDs really fail
+                continue
+            for did_bytes, data in self._split_multi_did(response, chunk).items():
+                by_did[did_bytes] = self._did_info(norm_brand, did_bytes, data)
+
+        results: List[Dict[str, Any]] = []
+        for did_bytes in wanted:
+            info = by_did.get(did_bytes)
+            if info is None:
+                try:
+                    info = self.read_did(norm_brand, int.from_bytes(did_bytes, "big"))
+                except (UdsNegativeResponse, UdsResponseError) as exc:
+                    info = {"did": did_bytes.hex().upper(), "error": str(exc)}
+            results.append(info)
+        return results
+
+    @staticmethod
+    def _split_multi_did(response: bytes, requested: List[bytes]) -> Dict[bytes, bytes]:
+        # 62 <DID> <data> <DID> <data> ...; the ECU answers in request order
+        # and may skip unsupported DIDs. Values carry no length, so every
+        # occurrence of a later requested DID is a possible boundary. Take the
+        # split that answers the most DIDs; if two splits tie (a value holds a
+        # later DID's bytes), leave the whole response to single reads.
+        parses: List[List[Tuple[bytes, int, int]]] = []
+        end = len(response)
+
+        def walk(pos: int, first: int, acc: List[Tuple[bytes, int, int]]) -> None:
+            head = response[pos : pos + 2]
+            for j in range(first, len(requested)):
+                if requested[j] != head:
+                    continue
+                start = pos + 2
+                later = requested[j + 1 :]
+                parses.append(acc + [(head, start, end)])
+                for nxt in range(start, end - 1):
+                    if response[nxt : nxt + 2] in later:
+                        walk(nxt, j + 1, acc + [(head, start, nxt)])
+
+        if len(response) >= 3:
+            walk(1, 0, [])
+        if not parses:
+            return {}
+        most = max(len(parse) for parse in parses)
+        best = [parse for parse in parses if len(parse) == most]
+        if len(best) != 1:
+            return {}
+        return {did: response[start:stop] for did, start, stop in best[0]}
+
+    @staticmethod
+    def _did_info(
+        norm_brand: str, resp_did: bytes, data: bytes, entry: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        did_str = _did_hex(resp_did)
+        # A caller-supplied entry only counts if the ECU answered for that DID
+        if entry is None or entry.get("did", "").upper() != did_str:
+            entry = find_did(norm_brand, did_str)
         info: Dict[str, Any] = {
-            "did": f"{int.from_bytes(resp_did, 'big'):04X}",
+            "did": did_str,
             "raw": data.hex().upper(),
         }
         if entry:
@@ -222,7 +323,7 @@ class UdsClient:
         entry = find_did_by_name(norm_brand, name)
         if not entry:
             return None
-        return self.read_did(norm_brand, entry["did"])
+        return self._read_did(norm_brand, entry["did"], entry)
 
     def read_vin(self, brand: str) -> Dict[str, Any]:
         """
@@ -242,7 +343,7 @@ class UdsClient:
         'brand' is only used for metadata lookup; can be None.
         """
         norm_brand = normalize_brand(brand) if brand else None
-        did_str = f"{int(did):04X}" if isinstance(did, int) else did
+        did_str = _did_hex(did.to_bytes(2, "big")) if isinstance(did, int) else did
 
         entry = find_did(norm_brand, did_str) if norm_brand else None
         did_bytes = _to_did_bytes(did)
@@ -256,7 +357,7 @@ class UdsClient:
         resp_did = response[1:3]
 
         info: Dict[str, Any] = {
-            "did": f"{int.from_bytes(resp_did, 'big'):04X}",
+            "did": _did_hex(resp_did),
             "raw": data.hex().upper(),
         }
         if entry:
@@ -287,7 +388,9 @@ class UdsClient:
             raise UdsResponseError(f"Unknown routine: {routine_name}")
 
         routine_id = int(routine["routine_id"], 16)
-        data = bytes([subfunction]) + routine_id.to_bytes(2, "big") + _to_hex_bytes(payload_hex)
+        data = b"".join(
+            (single_byte(subfunction), routine_id.to_bytes(2, "big"), _to_hex_bytes(payload_hex))
+        )
         response = self._send_and_expect(0x31, data)
 
         return {
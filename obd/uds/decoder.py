@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional
 
 
 def decode_ascii(data: bytes) -> str:
@@ -10,10 +10,7 @@ def decode_ascii(data: bytes) -> str:
 
 def decode_uint(data: bytes) -> int:
     """Big-endian unsigned integer."""
-    value = 0
-    for b in data:
-        value = (value << 8) | b
-    return value
+    return int.from_bytes(data, "big")
 
 
 def decode_hex(data: bytes) -> str:
@@ -21,6 +18,17 @@ def decode_hex(data: bytes) -> str:
     return data.hex().upper()
 
 
+_DECODERS: Dict[str, Callable[[bytes], Any]] = {
+    "ascii": decode_ascii,
+    "uint": decode_uint,
+    "hex": decode_hex,
+}
+
+# Decoder per raw 'decoder' value as written in the DID files, so repeated
+# reads skip the lowercasing
+_RESOLVED: Dict[Optional[str], Callable[[bytes], Any]] = {}
+
+
 def decode_did_value(entry: Dict[str, Any], data: bytes) -> Any:
     """
     Decode a DID value using the 'decoder' key in the entry.
@@ -30,9 +38,9 @@ def decode_did_value(entry: Dict[str, Any], data: bytes) -> Any:
       - "uint"
       - "hex" (default)
     """
-    decoder = (entry.get("decoder") or "hex").lower()
-    if decoder == "ascii":
-        return decode_ascii(data)
-    if decoder == "uint":
-        return decode_uint(data)
-    return decode_hex(data)
\ No newline at end of file
+    name = entry.get("decoder")
+    decoder = _RESOLVED.get(name)
+    if decoder is None:
+        decoder = _DECODERS.get((name or "hex").lower(), decode_hex)
+        _RESOLVED[name] = decoder
+    return decoder(data)
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import copy
 import json
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from .paths import uds_data_dir
 
@@ -13,31 +15,52 @@ BRAND_FILES = {
 }
 
 
-def load_brand_dids(brand: str) -> List[Dict[str, Any]]:
-    key = (brand or "").lower()
-    filename = BRAND_FILES.get(key)
-    if not filename:
-        return []
+@lru_cache(maxsize=None)
+def _parsed(filename: str) -> Tuple[Dict[str, Any], ...]:
     path = DATA_DIR / filename
     if not path.exists():
+        return ()
+    return tuple(json.loads(path.read_text(encoding="utf-8")))
+
+
+# Indices are built once per brand file; the entries in them are shared,
+# so callers must treat what find_did()/find_did_by_name() return as read-only
+@lru_cache(maxsize=None)
+def _did_index(filename: str) -> Dict[str, Dict[str, Any]]:
+    return {entry["did"].upper(): entry for entry in _parsed(filename) if "did" in entry}
+
+
+@lru_cache(maxsize=None)
+def _name_index(filename: str) -> Dict[str, Dict[str, Any]]:
+    index: Dict[str, Dict[str, Any]] = {}
+    for entry in _parsed(filename):
+        index.setdefault((entry.get("name") or "").strip().lower(), entry)
+    return index
+
+
+def _brand_file(brand: str) -> Optional[str]:
+    return BRAND_FILES.get((brand or "").lower())
+
+
+def load_brand_dids(brand: str) -> List[Dict[str, Any]]:
+    filename = _brand_file(brand)
+    if not filename:
         return []
-    return json.loads(path.read_text(encoding="utf-8"))
+    return copy.deepcopy(list(_parsed(filename)))
 
 
 def did_map(brand: str) -> Dict[str, Dict[str, Any]]:
-    entries = load_brand_dids(brand)
-    return {entry["did"].upper(): entry for entry in entries if "did" in entry}
+    filename = _brand_file(brand)
+    return dict(_did_index(filename)) if filename else {}
 
 
 def find_did(brand: str, did: str) -> Optional[Dict[str, Any]]:
     """Find DID metadata by numeric DID string (e.g. 'F190')."""
-    return did_map(brand).get(did.upper())
+    filename = _brand_file(brand)
+    return _did_index(filename).get(did.upper()) if filename else None
 
 
 def find_did_by_name(brand: str, name: str) -> Optional[Dict[str, Any]]:
     """Find DID metadata by logical name (case-insensitive)."""
-    target = (name or "").strip().lower()
-    for entry in load_brand_dids(brand):
-        if (entry.get("name") or "").strip().lower() == target:
-            return entry
-    return None
+    filename = _brand_file(brand)
+    return _name_index(filename).get((name or "").strip().lower()) if filename else None
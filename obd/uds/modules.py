@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import copy
 import json
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from .paths import uds_data_dir
 
@@ -30,15 +32,33 @@ STANDARD_MODULES = [
 ]
 
 
-def load_brand_modules(brand: str) -> List[Dict[str, Any]]:
-    key = (brand or "").lower()
-    filename = BRAND_FILES.get(key)
-    if not filename:
-        return []
+@lru_cache(maxsize=None)
+def _parsed(filename: str) -> Tuple[Dict[str, Any], ...]:
     path = DATA_DIR / filename
     if not path.exists():
+        return ()
+    return tuple(json.loads(path.read_text(encoding="utf-8")))
+
+
+# Standard + brand modules by lowercased name, built once per brand file;
+# find_module() hands out shared, read-only entries
+@lru_cache(maxsize=None)
+def _name_index(filename: Optional[str]) -> Dict[str, Dict[str, Any]]:
+    entries: List[Dict[str, Any]] = list(STANDARD_MODULES)
+    if filename:
+        entries.extend(_parsed(filename))
+    return {entry["name"].lower(): entry for entry in entries if "name" in entry}
+
+
+def _brand_file(brand: str) -> Optional[str]:
+    return BRAND_FILES.get((brand or "").lower())
+
+
+def load_brand_modules(brand: str) -> List[Dict[str, Any]]:
+    filename = _brand_file(brand)
+    if not filename:
         return []
-    return json.loads(path.read_text(encoding="utf-8"))
+    return copy.deepcopy(list(_parsed(filename)))
 
 
 def load_standard_modules() -> List[Dict[str, Any]]:
@@ -46,13 +66,12 @@ def load_standard_modules() -> List[Dict[str, Any]]:
 
 
 def module_map(brand: str, include_standard: bool = True) -> Dict[str, Dict[str, Any]]:
-    entries: List[Dict[str, Any]] = []
     if include_standard:
-        entries.extend(load_standard_modules())
-    entries.extend(load_brand_modules(brand))
+        return dict(_name_index(_brand_file(brand)))
+    entries = load_brand_modules(brand)
     return {entry["name"].lower(): entry for entry in entries if "name" in entry}
 
 
 def find_module(brand: str, name: str) -> Optional[Dict[str, Any]]:
     """Find module definition by logical name (e.g. 'generic_engine', 'bcm')."""
-    return module_map(brand).get((name or "").lower())
+    return _name_index(_brand_file(brand)).get((name or "").lower())
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import copy
 import json
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from .paths import uds_data_dir
 
@@ -13,22 +15,37 @@ BRAND_FILES = {
 }
 
 
-def load_brand_routines(brand: str) -> List[Dict[str, Any]]:
-    key = (brand or "").lower()
-    filename = BRAND_FILES.get(key)
-    if not filename:
-        return []
+@lru_cache(maxsize=None)
+def _parsed(filename: str) -> Tuple[Dict[str, Any], ...]:
     path = DATA_DIR / filename
     if not path.exists():
+        return ()
+    return tuple(json.loads(path.read_text(encoding="utf-8")))
+
+
+# Built once per brand file; find_routine() hands out shared, read-only entries
+@lru_cache(maxsize=None)
+def _name_index(filename: str) -> Dict[str, Dict[str, Any]]:
+    return {entry["name"].lower(): entry for entry in _parsed(filename) if "name" in entry}
+
+
+def _brand_file(brand: str) -> Optional[str]:
+    return BRAND_FILES.get((brand or "").lower())
+
+
+def load_brand_routines(brand: str) -> List[Dict[str, Any]]:
+    filename = _brand_file(brand)
+    if not filename:
         return []
-    return json.loads(path.read_text(encoding="utf-8"))
+    return copy.deepcopy(list(_parsed(filename)))
 
 
 def routine_map(brand: str) -> Dict[str, Dict[str, Any]]:
-    entries = load_brand_routines(brand)
-    return {entry["name"].lower(): entry for entry in entries if "name" in entry}
+    filename = _brand_file(brand)
+    return dict(_name_index(filename)) if filename else {}
 
 
 def find_routine(brand: str, name: str) -> Optional[Dict[str, Any]]:
     """Find routine definition by logical name (e.g. 'open_calipers')."""
-    return routine_map(brand).get((name or "").lower())
+    filename = _brand_file(brand)
+    return _name_index(filename).get((name or "").lower()) if filename else None
@@ -20,6 +20,21 @@ SERVICE_NAMES = {
 
 NEGATIVE_RESPONSE_SID = 0x7F
 
+# One-byte bytes objects for every value, so SIDs and subfunctions are not
+# rebuilt via bytes([n]) on each request
+BYTE_VALUES = tuple(bytes((i,)) for i in range(256))
+
+
+# Positive response SID for every request SID: POSITIVE_RESPONSES[0x22] == 0x62
+POSITIVE_RESPONSES = bytes((sid + 0x40) & 0xFF for sid in range(256))
+
+
+def single_byte(value: int) -> bytes:
+    """bytes([value]), served from BYTE_VALUES for 0..255."""
+    if 0 <= value <= 0xFF:
+        return BYTE_VALUES[value]
+    return bytes([value])
+
 
 @dataclass(frozen=True)
 class UdsService:
@@ -32,11 +47,13 @@ class UdsService:
 
     @staticmethod
     def positive_response(service_id: int) -> int:
+        if 0 <= service_id <= 0xFF:
+            return POSITIVE_RESPONSES[service_id]
         return (service_id + 0x40) & 0xFF
 
     @staticmethod
     def build_request(service_id: int, data: bytes = b"") -> bytes:
-        return bytes([service_id]) + data
+        return single_byte(service_id) + data
 
     @staticmethod
     def is_negative_response(payload: bytes) -> bool:
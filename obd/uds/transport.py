@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import List, Optional
 
 from ..elm import ELM327, CommunicationError, DeviceDisconnectedError
-from ..protocol import group_by_ecu, merge_payloads
+from ..protocol import group_by_ecu, merge_payloads, reassemble_isotp_frames
 from .exceptions import UdsTransportError
 
 
@@ -62,6 +62,11 @@ class UdsTransport:
             raise UdsTransportError(str(exc))
 
         grouped = group_by_ecu(lines, headers_on=self.headers_on)
+        if self.headers_on:
+            frames = grouped.get(self.rx_id) or next(iter(grouped.values()), [])
+            reassembled = reassemble_isotp_frames(frames)
+            if reassembled is not None:
+                return _tokens_to_bytes(reassembled)
         merged = merge_payloads(grouped, headers_on=self.headers_on)
 
         if self.headers_on:
@@ -2,6 +2,8 @@
 OBD-II Scanner Utilities (compat shim).
 """
 
+import sys
+
 from app.application.time_utils import (
     APP_NAME,
     CR_TZ,
@@ -12,6 +14,9 @@ from app.application.time_utils import (
     cr_timestamp_filename,
 )
 
+# slots=True drops the per-instance __dict__ (dataclass support needs Python 3.10+)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 __all__ = [
     "CR_TZ",
     "VERSION",
@@ -20,4 +25,5 @@ __all__ = [
     "cr_timestamp",
     "cr_timestamp_filename",
     "cr_time_only",
+    "DATACLASS_SLOTS",
 ]
@@ -1 +1,11 @@
 # Tests package
+import atexit
+import os
+import shutil
+import tempfile
+
+# Scanners build a DTCDatabase, which caches parsed CSVs under
+# $XDG_CACHE_HOME; keep test runs out of the user's real cache.
+_CACHE_HOME = tempfile.mkdtemp(prefix="obd2py-test-cache-")
+os.environ["XDG_CACHE_HOME"] = _CACHE_HOME
+atexit.register(shutil.rmtree, _CACHE_HOME, True)
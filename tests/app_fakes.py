@@ -61,6 +61,9 @@ class DummyScanner(ScannerPort):
     def set_port(self, port: str) -> None:
         return None
 
+    def set_fast_responses(self, enabled: bool, headers_off: bool = False, frame_hints: bool = False) -> None:
+        return None
+
     def connect(self) -> bool:
         self.is_connected = True
         return True
@@ -166,7 +169,7 @@ class DummyDtcDb(DtcLookupPort):
     def lookup(self, code: str) -> Optional[Dict[str, Any]]:
         return {"code": code, "description": "Test"} if code else None
 
-    def search(self, text: str) -> List[Dict[str, Any]]:
+    def search(self, text: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         return [{"code": "P0001", "description": "Test"}] if text else []
 
     def set_manufacturer(self, manufacturer: str) -> None:
@@ -354,6 +357,9 @@ class DummyUdsClient(UdsClientPort):
     def read_did(self, brand: str, did: str) -> Dict[str, Any]:
         return {"did": did}
 
+    def read_dids(self, brand: str, dids: List[str]) -> List[Dict[str, Any]]:
+        return [{"did": did} for did in dids]
+
     def send_raw(self, service_id: int, data: bytes, *, raise_on_negative: bool = False) -> bytes:
         return b""
 
@@ -74,6 +74,9 @@ class FakeScanner(ScannerPort):
     def set_port(self, port: str) -> None:
         self._port = port
 
+    def set_fast_responses(self, enabled: bool, headers_off: bool = False, frame_hints: bool = False) -> None:
+        return None
+
     def connect(self) -> bool:
         self.is_connected = True
         return True
@@ -220,13 +223,14 @@ class FakeDtcDatabase(DtcLookupPort):
             return None
         return {"code": code.upper(), "description": desc}
 
-    def search(self, text: str) -> List[Dict[str, Any]]:
+    def search(self, text: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         text = text.lower()
-        return [
+        matches = [
             {"code": code, "description": desc}
             for code, desc in self._codes.items()
             if text in code.lower() or text in desc.lower()
         ]
+        return matches[:limit] if limit is not None else matches
 
     def set_manufacturer(self, manufacturer: str) -> None:
         self._manufacturer = manufacturer
@@ -444,6 +448,9 @@ class FakeUdsClient(UdsClientPort):
     def read_did(self, brand: str, did: str) -> Dict[str, Any]:
         return {"did": did, "value": None}
 
+    def read_dids(self, brand: str, dids: List[str]) -> List[Dict[str, Any]]:
+        return [self.read_did(brand, did) for did in dids]
+
     def send_raw(self, service_id: int, data: bytes, *, raise_on_negative: bool = False) -> bytes:
         return b""
 
@@ -14,8 +14,10 @@ class SettingsServiceTests(unittest.TestCase):
                 "manufacturer": "chrysler",
                 "log_format": "json",
                 "monitor_interval": 2.5,
+                "elm_frame_hints": True,
                 "verbose": True,
                 "last_ble_address": "AA:BB",
+                "last_port": "/dev/ttyUSB1",
                 "ble_notice_shown": True,
                 "vehicle_group": "chrysler",
                 "brand_id": "3",
@@ -30,8 +32,10 @@ class SettingsServiceTests(unittest.TestCase):
         self.assertEqual(state.manufacturer, "chrysler")
         self.assertEqual(state.log_format, "json")
         self.assertEqual(state.monitor_interval, 2.5)
+        self.assertTrue(state.elm_frame_hints)
         self.assertTrue(state.verbose)
         self.assertEqual(state.last_ble_address, "AA:BB")
+        self.assertEqual(state.last_port, "/dev/ttyUSB1")
         self.assertTrue(state.ble_notice_shown)
         self.assertEqual(state.vehicle_group, "chrysler")
         self.assertEqual(state.brand_id, "3")
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import io
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest import mock
+
+from app.bootstrap import container as container_module
+from app.presentation.cli.actions import live_monitor as live_monitor_module
+from obd.obd2.models import SensorReading
+from tests.fakes import FakeScanner, build_fake_container
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: List[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(round(seconds, 3))
+        self.now += seconds
+
+
+class _RecordingLogger:
+    def __init__(self) -> None:
+        self.rows: List[Dict[str, Any]] = []
+
+    def start_session(self, format: str = "csv") -> str:
+        return "session-0001"
+
+    def log_readings(self, readings: Dict[str, Any]) -> None:
+        self.rows.append(dict(readings))
+
+    def end_session(self) -> Dict[str, Any]:
+        return {"file": "session-0001", "duration_seconds": 0, "reading_count": len(self.rows)}
+
+
+class _Telemetry:
+    def __init__(self, logger: _RecordingLogger) -> None:
+        self._logger = logger
+
+    def create_logger(self) -> _RecordingLogger:
+        return self._logger
+
+
+class LiveMonitorScheduleTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.container = build_fake_container(Path(tmp.name))
+        self.state = self.container.state
+        scanner = FakeScanner()
+        scanner.is_connected = True
+        self.state.scanner = scanner
+        self.state.monitor_interval = 1.0
+        self.state.pid_rate_hz = {"0C": 10.0, "05": 0.5}
+        self.logger = _RecordingLogger()
+        self.container.telemetry_log = _Telemetry(self.logger)
+        self.clock = _FakeClock()
+        self.requests: List[List[str]] = []
+
+        old_container = container_module._container
+        container_module._container = self.container
+        self.addCleanup(setattr, container_module, "_container", old_container)
+        patcher = mock.patch.object(live_monitor_module, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _run(self, ticks: int, answer=lambda pid, n: True) -> str:
+        def read_live_data(pids=None):
+            self.requests.append(list(pids))
+            if len(self.requests) >= ticks:
+                self.state.stop_monitoring = True
+            n = len(self.requests)
+            return {
+                pid: SensorReading(name=f"PID {pid}", value=float(n), unit="", pid=pid, raw_hex="")
+                for pid in pids
+                if answer(pid, n)
+            }
+
+        self.container.scans.read_live_data = read_live_data  # type: ignore[assignment]
+        out = io.StringIO()
+        with mock.patch("builtins.input", return_value="y"), redirect_stdout(out):
+            live_monitor_module.live_monitor(self.state)
+        return out.getvalue()
+
+    def test_ticks_at_the_fastest_pid_rate(self) -> None:
+        self._run(ticks=11)
+        self.assertEqual({0.1}, set(self.clock.sleeps))
+        self.assertEqual(["05", "0C", "0D", "11", "49", "42"], self.requests[0])
+        self.assertEqual(["0C"], self.requests[1])
+        self.assertEqual(["0C", "0D", "11", "49", "42"], self.requests[10])
+
+    def test_prints_rows_once_per_monitor_interval(self) -> None:
+        output = self._run(ticks=21)
+        rows = [line for line in output.splitlines() if line[:1].isdigit()]
+        self.assertIn("1s", output)
+        self.assertEqual(3, len(rows))
+        self.assertEqual(21, len(self.logger.rows))
+
+    def test_zero_interval_still_sleeps(self) -> None:
+        self.state.monitor_interval = 0.0
+        self.state.pid_rate_hz = {}
+        self._run(ticks=3)
+        self.assertEqual({live_monitor_module.MIN_TICK_S}, set(self.clock.sleeps))
+
+    def test_logs_only_new_samples(self) -> None:
+        self._run(ticks=3)
+        self.assertEqual(3, len(self.logger.rows))
+        self.assertEqual(6, len(self.logger.rows[0]))
+        self.assertEqual(["0C"], list(self.logger.rows[1]))
+        self.assertEqual(["0C"], list(self.logger.rows[2]))
+
+    def test_unanswered_pid_is_not_shown_as_current(self) -> None:
+        output = self._run(ticks=11, answer=lambda pid, n: not (pid == "42" and n > 1))
+        rows = [line for line in output.splitlines() if line[:1].isdigit()]
+        self.assertTrue(rows[0].rstrip().endswith("1.0V"))
+        self.assertTrue(rows[-1].rstrip().endswith("---"))
+        self.assertNotIn("42", self.logger.rows[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import json
+import socket
+import ssl
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+
+from app.infrastructure.billing import paywall_config
+from app.infrastructure.billing import paywall_client
+from app.infrastructure.billing.paywall_client import PaywallBalance, PaywallClient, PaywallError
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:  # noqa: N802
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        self.server.peers.append(self.client_address)  # type: ignore[attr-defined]
+        self.server.payloads.append((self.path, payload))  # type: ignore[attr-defined]
+        if self.path == "/v1/fail":
+            self._reply(402, {"error": {"message": "need payment"}})
+            return
+        if self.path == "/v1/credits/consume_batch" and not self.server.batch_supported:  # type: ignore[attr-defined]
+            self._reply(404, {"error": "not found"})
+            return
+        if self.path.startswith("/v1/credits/"):
+            self._reply(200, {"free_remaining": 0, "paid_credits": 10 - len(self.server.payloads)})  # type: ignore[attr-defined]
+            return
+        self._reply(200, {"ok": True, "n": len(self.server.payloads)})  # type: ignore[attr-defined]
+
+    def _reply(self, status: int, body: dict) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *_args) -> None:
+        pass
+
+
+TLS_DIR = Path(__file__).parent / "fixtures" / "tls"
+
+
+class InfraPaywallClientHttpTests(unittest.TestCase):
+    def setUp(self) -> None:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        server.peers = []  # type: ignore[attr-defined]
+        server.payloads = []  # type: ignore[attr-defined]
+        server.batch_supported = True  # type: ignore[attr-defined]
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.server = server
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        config_dir = Path(tmp.name)
+        patchers = [
+            mock.patch.dict("os.environ", {"NO_PROXY": "*"}),
+            mock.patch.object(paywall_config, "CONFIG_DIR", config_dir),
+            mock.patch.object(paywall_config, "CONFIG_PATH", config_dir / "config.json"),
+            mock.patch.object(paywall_config, "_CONFIG_CACHE", None),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.api_base = f"http://127.0.0.1:{server.server_address[1]}"
+        self.client = PaywallClient(api_base=self.api_base, warm_up=False)
+        self.addCleanup(self.client.close)
+
+    def test_requests_reuse_one_connection(self) -> None:
+        for i in range(3):
+            data = self.client._request_json("POST", "/v1/ping", {"i": i}, use_auth=False)
+            self.assertEqual(i + 1, data["n"])
+        self.assertEqual(1, len(set(self.server.peers)))
+        self.assertEqual([0, 1, 2], [payload["i"] for _path, payload in self.server.payloads])
+
+    def test_error_status_maps_to_paywall_error(self) -> None:
+        with self.assertRaises(PaywallError) as ctx:
+            self.client._request_json("POST", "/v1/fail", {}, use_auth=False)
+        self.assertEqual(402, ctx.exception.status_code)
+        self.assertEqual("need payment", str(ctx.exception))
+        self.assertTrue(self.client._request_json("POST", "/v1/ping", {}, use_auth=False)["ok"])
+
+    def test_closed_server_connection_is_replaced(self) -> None:
+        self.client._request_json("POST", "/v1/ping", {}, use_auth=False)
+        for conn in self.client._pool._idle:
+            conn.sock.shutdown(socket.SHUT_RDWR)
+        self.assertTrue(self.client._request_json("POST", "/v1/ping", {}, use_auth=False)["ok"])
+        self.assertEqual(2, len(set(self.server.peers)))
+
+    def _queue_pending(self, count: int) -> None:
+        paywall_config.update_identity("subject", "token")
+        self.client._identity = paywall_config.get_identity()
+        for _ in range(count):
+            paywall_config.add_pending_consumption("report", 1)
+
+    def test_sync_pending_sends_one_batch(self) -> None:
+        self._queue_pending(3)
+        self.client.sync_pending()
+        self.assertEqual(["/v1/credits/consume_batch"], [path for path, _payload in self.server.payloads])
+        self.assertEqual(3, len(self.server.payloads[0][1]["items"]))
+        self.assertEqual([], paywall_config.load_pending_consumptions())
+        self.assertEqual((0, 9), paywall_config.load_balance())
+
+    def test_sync_pending_falls_back_without_batch_endpoint(self) -> None:
+        self.server.batch_supported = False
+        self._queue_pending(2)
+        self.client.sync_pending()
+        paths = [path for path, _payload in self.server.payloads]
+        self.assertEqual(["/v1/credits/consume_batch"] + ["/v1/credits/consume"] * 2, paths)
+        self.assertEqual([], paywall_config.load_pending_consumptions())
+
+        self._queue_pending(2)
+        self.client.sync_pending()
+        self.assertEqual(["/v1/credits/consume"] * 2, [path for path, _payload in self.server.payloads[3:]])
+
+    def test_network_failure_keeps_unsent_items_queued(self) -> None:
+        self.client._batch_consume_supported = False
+        self._queue_pending(3)
+        pending = paywall_config.load_pending_consumptions()
+
+        def request_json(method, path, payload, **_kwargs):
+            if payload["request_id"] == pending[1]["id"]:
+                raise PaywallError("connection refused")
+            return {"free_remaining": 0, "paid_credits": 5}
+
+        with mock.patch.object(self.client, "_request_json", side_effect=request_json):
+            self.client.sync_pending()
+        left = [item["id"] for item in paywall_config.load_pending_consumptions()]
+        self.assertIn(pending[1]["id"], left)
+        self.assertEqual(len(left), len(set(left)))
+
+    def test_balance_reply_is_reused_within_ttl(self) -> None:
+        paywall_config.update_identity("subject", "token")
+        self.client._identity = paywall_config.get_identity()
+        replies = [{"free_remaining": 1, "paid_credits": n} for n in range(5)]
+        with mock.patch.object(self.client, "_request_json", side_effect=replies) as request_json:
+            self.assertEqual(0, self.client.get_balance().paid_credits)
+            self.assertEqual(0, self.client.get_balance().paid_credits)
+            self.assertEqual(1, request_json.call_count)
+            self.assertEqual(1, self.client.get_balance(force=True).paid_credits)
+            self.client.consume("report")
+            self.assertEqual(3, self.client.get_balance().paid_credits)
+            self.client._balance_ttl = 0
+            self.assertEqual(4, self.client.get_balance().paid_credits)
+
+    def test_wait_for_balance_backs_off(self) -> None:
+        sleeps = []
+        balances = [PaywallBalance(0, 0)] * 8 + [PaywallBalance(0, 1)]
+        with mock.patch.object(self.client, "get_balance", side_effect=balances), mock.patch.object(
+            paywall_client.time, "sleep", side_effect=sleeps.append
+        ), mock.patch.object(paywall_client.random, "uniform", return_value=1.0):
+            self.assertEqual(1, self.client.wait_for_balance(timeout_seconds=60).paid_credits)
+        self.assertEqual([0.5, 0.75, 1.125, 1.6875], sleeps[:4])
+        self.assertEqual(8.0, max(sleeps))
+
+    def test_wait_for_balance_honours_poll_hint(self) -> None:
+        sleeps = []
+
+        def get_balance(*, force=False):
+            self.client._poll_after = 3.0
+            return PaywallBalance(0, len(sleeps))
+
+        with mock.patch.object(self.client, "get_balance", side_effect=get_balance), mock.patch.object(
+            paywall_client.time, "sleep", side_effect=sleeps.append
+        ):
+            self.client.wait_for_balance(min_paid=2, timeout_seconds=60)
+        self.assertEqual([3.0, 3.0], sleeps)
+
+    def test_oversized_reply_is_refused(self) -> None:
+        with mock.patch.object(paywall_client, "_MAX_RESPONSE_BYTES", 8):
+            with self.assertRaises(PaywallError) as ctx:
+                self.client._request_json("POST", "/v1/ping", {}, use_auth=False)
+        self.assertIsNone(ctx.exception.status_code)
+        self.assertTrue(self.client._request_json("POST", "/v1/ping", {}, use_auth=False)["ok"])
+
+    def test_reset_identity_drops_the_in_memory_identity(self) -> None:
+        paywall_config.update_identity("subject", "token")
+        self.client._identity = paywall_config.get_identity()
+        device_id = self.client.identity.device_id
+        self.client.reset_identity()
+        self.assertIsNone(self.client.identity.subject_id)
+        self.assertIsNone(self.client.identity.access_token)
+        self.assertEqual(device_id, self.client.identity.device_id)
+        self.assertIsNone(paywall_config.get_identity().subject_id)
+
+    def test_warm_up_parks_a_ready_connection(self) -> None:
+        client = PaywallClient(api_base=self.api_base)
+        self.addCleanup(client.close)
+        for thread in threading.enumerate():
+            if thread.name == "paywall-warmup":
+                thread.join(5)
+        self.assertEqual(1, len(client._pool._idle))
+        client._request_json("POST", "/v1/ping", {}, use_auth=False)
+        self.assertEqual(1, len(set(self.server.peers)))
+
+    def test_out_of_order_replies_keep_the_lowest_balance(self) -> None:
+        self.client._batch_consume_supported = False
+        self._queue_pending(2)
+        first, second = paywall_config.load_pending_consumptions()
+
+        def request_json(method, path, payload, **_kwargs):
+            if payload["request_id"] == first["id"]:
+                # Applied first on the server, but its reply arrives last
+                time.sleep(0.1)
+                return {"free_remaining": 0, "paid_credits": 4}
+            return {"free_remaining": 0, "paid_credits": 3}
+
+        with mock.patch.object(self.client, "_request_json", side_effect=request_json):
+            self.client.sync_pending()
+        self.assertEqual((0, 3), paywall_config.load_balance())
+        self.assertEqual([], paywall_config.load_pending_consumptions())
+
+
+class InfraPaywallClientHttpsTests(unittest.TestCase):
+    def setUp(self) -> None:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        server_ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        server_ctx.load_cert_chain(TLS_DIR / "localhost.crt", TLS_DIR / "localhost.key")
+        server.socket = server_ctx.wrap_socket(server.socket, server_side=True)
+        server.peers = []  # type: ignore[attr-defined]
+        server.payloads = []  # type: ignore[attr-defined]
+        server.batch_supported = True  # type: ignore[attr-defined]
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.server = server
+
+        client_ctx = ssl.create_default_context(cafile=str(TLS_DIR / "localhost.crt"))
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        config_dir = Path(tmp.name)
+        patchers = [
+            mock.patch.dict("os.environ", {"NO_PROXY": "*"}),
+            mock.patch.object(ssl, "_create_default_https_context", lambda: client_ctx),
+            mock.patch.object(paywall_config, "CONFIG_DIR", config_dir),
+            mock.patch.object(paywall_config, "CONFIG_PATH", config_dir / "config.json"),
+            mock.patch.object(paywall_config, "_CONFIG_CACHE", None),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.client = PaywallClient(api_base=f"https://127.0.0.1:{server.server_address[1]}", warm_up=False)
+        self.addCleanup(self.client.close)
+
+    def test_warmed_tls_connection_is_reused(self) -> None:
+        pool = self.client._pool_for(f"{self.client.api_base}/")
+        pool.warm()
+        conn = pool._idle[0]
+        self.assertEqual("TLSv1.3", conn.sock.version())
+        # Give the server's session tickets time to arrive on the idle socket
+        time.sleep(0.2)
+        self.assertFalse(paywall_client._connection_dropped(conn))
+        self.assertTrue(self.client._request_json("POST", "/v1/ping", {}, use_auth=False)["ok"])
+        self.assertTrue(self.client._request_json("POST", "/v1/ping", {}, use_auth=False)["ok"])
+        self.assertEqual([conn], pool._idle)
+        self.assertEqual(1, len(set(self.server.peers)))
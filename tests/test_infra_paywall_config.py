@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from app.infrastructure.billing import paywall_config
+from app.infrastructure.billing.paywall_client import PaywallClient
+
+
+class InfraPaywallConfigTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.path = self.dir / "config.json"
+        for name, value in (("CONFIG_DIR", self.dir), ("CONFIG_PATH", self.path), ("_CONFIG_CACHE", None)):
+            patcher = mock.patch.object(paywall_config, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_getters_reuse_parsed_config(self) -> None:
+        paywall_config.ensure_device_id()
+        paywall_config.update_identity("subject", "token")
+        with mock.patch.object(paywall_config.json, "loads", wraps=json.loads) as loads:
+            for _ in range(3):
+                identity = paywall_config.get_identity()
+                paywall_config.load_balance()
+        loads.assert_not_called()
+        self.assertEqual("subject", identity.subject_id)
+        self.assertTrue(identity.device_id)
+
+    def test_external_write_is_picked_up(self) -> None:
+        paywall_config.save_balance(3, 1)
+        self.assertEqual((3, 1), paywall_config.load_balance())
+        config = json.loads(self.path.read_text(encoding="utf-8"))
+        config["paywall"]["balance"] = {"free_remaining": 10, "paid_credits": 20}
+        self.path.write_text(json.dumps(config), encoding="utf-8")
+        self.assertEqual((10, 20), paywall_config.load_balance())
+
+    def test_load_config_returns_a_copy(self) -> None:
+        paywall_config.set_api_base("http://example")
+        config = paywall_config.load_config()
+        config["paywall"]["api_base"] = "http://other"
+        with mock.patch.dict("os.environ", {"PAYWALL_API_BASE": ""}):
+            self.assertEqual("http://example", paywall_config.get_api_base())
+
+    def test_save_leaves_no_temp_files(self) -> None:
+        paywall_config.add_pending_consumption("report", 2)
+        paywall_config.add_pending_consumption("report", 3)
+        self.assertEqual(["config.json"], sorted(p.name for p in self.dir.iterdir()))
+        self.assertEqual(5, paywall_config.pending_total())
+
+    def test_transaction_saves_once(self) -> None:
+        with mock.patch.object(paywall_config, "save_config", wraps=paywall_config.save_config) as save:
+            with paywall_config.config_transaction() as section:
+                paywall_config.ensure_device_id()
+                paywall_config.update_identity("subject", "token")
+                paywall_config.save_balance(1, 2)
+                self.assertEqual("subject", paywall_config.get_identity().subject_id)
+                self.assertEqual({"free_remaining": 1, "paid_credits": 2}, section["balance"])
+                self.assertFalse(self.path.exists())
+        self.assertEqual(1, save.call_count)
+        self.assertEqual((1, 2), paywall_config.load_balance())
+
+    def test_unchanged_transaction_skips_write(self) -> None:
+        paywall_config.save_balance(1, 2)
+        with mock.patch.object(paywall_config, "save_config") as save:
+            with paywall_config.config_transaction():
+                paywall_config.load_balance()
+                with paywall_config.config_transaction():
+                    paywall_config.get_api_base()
+        save.assert_not_called()
+
+    def test_transaction_keeps_writes_made_before_an_error(self) -> None:
+        with self.assertRaises(RuntimeError):
+            with paywall_config.config_transaction():
+                paywall_config.save_balance(4, 5)
+                raise RuntimeError("request failed")
+        self.assertEqual((4, 5), paywall_config.load_balance())
+
+    def test_transaction_is_per_thread(self) -> None:
+        paywall_config.save_balance(1, 1)
+        seen = []
+
+        def worker() -> None:
+            seen.append(paywall_config.load_balance())
+            paywall_config.save_balance(7, 7)
+
+        with paywall_config.config_transaction():
+            paywall_config.save_balance(2, 2)
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+            self.assertEqual((7, 7), json_balance(self.path))
+            self.assertEqual((2, 2), paywall_config.load_balance())
+        self.assertEqual([(1, 1)], seen)
+        self.assertEqual((2, 2), paywall_config.load_balance())
+
+    def test_flush_transaction_writes_before_exit(self) -> None:
+        paywall_config.add_pending_consumption("report", 1)
+        with paywall_config.config_transaction():
+            paywall_config.save_pending_consumptions([])
+            paywall_config.flush_transaction()
+            self.assertEqual([], json.loads(self.path.read_text(encoding="utf-8"))["paywall"]["pending_consumptions"])
+            with mock.patch.object(paywall_config, "save_config") as save:
+                paywall_config.flush_transaction()
+            save.assert_not_called()
+            paywall_config.save_balance(3, 0)
+        self.assertEqual((3, 0), json_balance(self.path))
+
+    def test_client_consume_writes_config_once(self) -> None:
+        paywall_config.ensure_device_id()
+        paywall_config.update_identity("subject", "token")
+        client = PaywallClient(api_base="http://example", warm_up=False)
+        with mock.patch.object(
+            client, "_request_json", return_value={"free_remaining": 1, "paid_credits": 0}
+        ), mock.patch.object(paywall_config, "save_config", wraps=paywall_config.save_config) as save:
+            balance = client.consume("report")
+        self.assertEqual(1, save.call_count)
+        self.assertEqual((1, 0), (balance.free_remaining, balance.paid_credits))
+
+    def test_client_consume_persists_synced_queue_first(self) -> None:
+        paywall_config.ensure_device_id()
+        paywall_config.add_pending_consumption("report", 1)
+        on_disk = []
+
+        def request_json(method, path, payload, **_kwargs):
+            on_disk.append(json.loads(self.path.read_text(encoding="utf-8"))["paywall"].get("pending_consumptions"))
+            if path == "/v1/identity/anonymous":
+                return {"subject_id": "subject", "access_token": "token"}
+            return {"free_remaining": 2 if payload.get("request_id") else 1, "paid_credits": 0}
+
+        client = PaywallClient(api_base="http://example", warm_up=False)
+        with mock.patch.object(client, "_request_json", side_effect=request_json), mock.patch.object(
+            paywall_config, "save_config", wraps=paywall_config.save_config
+        ) as save:
+            balance = client.consume("report")
+        self.assertEqual(2, save.call_count)
+        # The consume request went out after the synced item left the file
+        self.assertEqual([], on_disk[-1])
+        self.assertEqual((1, 0), (balance.free_remaining, balance.paid_credits))
+        self.assertEqual([], paywall_config.load_pending_consumptions())
+        self.assertEqual("subject", paywall_config.get_identity().subject_id)
+
+
+def json_balance(path: Path):
+    balance = json.loads(path.read_text(encoding="utf-8"))["paywall"]["balance"]
+    return (balance["free_remaining"], balance["paid_credits"])
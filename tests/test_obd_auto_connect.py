@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import threading
+import unittest
+from unittest import mock
+
+from obd.elm.elm327 import ELM327
+from obd.obd2.scanner import OBDScanner
+
+
+class AutoConnectTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.closed = []
+        self.lock = threading.Lock()
+
+        def fake_connect(elm: ELM327) -> bool:
+            if elm.port == "/dev/missing":
+                raise ConnectionError("Serial port error")
+            elm.connection = mock.Mock(is_open=True)
+            elm._is_connected = True  # pylint: disable=protected-access
+            return True
+
+        def fake_close(elm: ELM327) -> None:
+            with self.lock:
+                self.closed.append(elm.port)
+            elm._is_connected = False  # pylint: disable=protected-access
+
+        def fake_test(elm: ELM327, **_kwargs) -> bool:
+            return elm.port == "/dev/car"
+
+        def fake_negotiate(elm: ELM327, **_kwargs) -> str:
+            raise RuntimeError("no protocol")
+
+        patches = [
+            mock.patch.object(ELM327, "find_ports", return_value=["/dev/missing", "/dev/idle", "/dev/car"]),
+            mock.patch.object(ELM327, "connect", fake_connect),
+            mock.patch.object(ELM327, "close", fake_close),
+            mock.patch.object(ELM327, "test_vehicle_connection", fake_test),
+            mock.patch.object(ELM327, "negotiate_protocol", fake_negotiate),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_adopts_the_port_that_answers(self) -> None:
+        scanner = OBDScanner()
+        logger = mock.Mock()
+        scanner.elm.raw_logger = logger
+
+        self.assertEqual("/dev/car", scanner.auto_connect())
+        self.assertTrue(scanner.is_connected)
+        self.assertEqual("/dev/car", scanner.elm.port)
+        self.assertIs(logger, scanner.elm.raw_logger)
+        self.assertNotIn("/dev/car", self.closed)
+        self.assertLessEqual({"/dev/missing", "/dev/idle"}, set(self.closed))
+
+    def test_probe_threads_leave_scanner_state_alone(self) -> None:
+        scanner = OBDScanner()
+        with mock.patch.object(type(scanner), "_on_connected", autospec=True) as on_connected:
+            on_connected.side_effect = lambda s: self.assertIs(threading.main_thread(), threading.current_thread())
+            scanner.auto_connect()
+        on_connected.assert_called_once_with(scanner)
+
+    def test_no_answer_raises_connection_error(self) -> None:
+        ELM327.find_ports.return_value = ["/dev/missing", "/dev/idle"]
+        scanner = OBDScanner()
+        with self.assertRaises(ConnectionError):
+            scanner.auto_connect()
+        self.assertFalse(scanner.is_connected)
+        self.assertLessEqual({"/dev/missing", "/dev/idle"}, set(self.closed))
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import csv
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from obd.dtc import get_database
+from obd.dtc.database import DTCDatabase
+
+
+def _use_temp_cache(case: unittest.TestCase) -> Path:
+    tmp = tempfile.TemporaryDirectory()
+    case.addCleanup(tmp.cleanup)
+    patcher = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": tmp.name})
+    patcher.start()
+    case.addCleanup(patcher.stop)
+    return Path(tmp.name) / "obd2py"
+
+
+def _linear_search(db: DTCDatabase, query: str):
+    q = query.strip().lower()
+    return [
+        info
+        for info in db.codes.values()
+        if q in (info.description or "").lower() or q in (info.code or "").lower()
+    ]
+
+
+class DtcDatabaseSearchTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(tmp.cleanup)
+        patcher = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": tmp.name})
+        patcher.start()
+        cls.addClassCleanup(patcher.stop)
+        cls.db = DTCDatabase()
+
+    def test_search_matches_linear_scan(self) -> None:
+        for query in ["oxygen", "P01", "p0", "Air Flow", "circuit low", "u0100", "a"]:
+            with self.subTest(query=query):
+                self.assertEqual(_linear_search(self.db, query), self.db.search(query))
+
+    def test_search_no_match(self) -> None:
+        self.assertEqual([], self.db.search("zzzz not a dtc"))
+        self.assertEqual([], self.db.search(""))
+
+    def test_search_limit_returns_leading_matches(self) -> None:
+        full = self.db.search("sensor")
+        self.assertGreater(len(full), 5)
+        self.assertEqual(full[:5], self.db.search("sensor", limit=5))
+        self.assertEqual(self.db.search("p")[:3], self.db.search("p", limit=3))
+        self.assertEqual([], self.db.search("sensor", limit=0))
+
+    def test_search_many_matches_single_searches(self) -> None:
+        queries = ["oxygen", "p0", "a", "zzzz", "", "oxygen", "Air Flow"]
+        for limit in (None, 4):
+            with self.subTest(limit=limit):
+                results = self.db.search_many(queries, limit=limit)
+                self.assertEqual(set(queries), set(results))
+                for query in queries:
+                    self.assertEqual(self.db.search(query, limit=limit), results[query])
+
+    def test_search_after_manufacturer_switch(self) -> None:
+        db = DTCDatabase(manufacturer="jeep")
+        self.assertTrue(db.search("p0"))
+        db.set_manufacturer("landrover")
+        self.assertEqual(_linear_search(db, "p0"), db.search("p0"))
+
+
+class DtcCsvParsingTests(unittest.TestCase):
+    def test_malformed_line_skips_only_that_line(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "dtc.csv"
+            path.write_text(
+                "\ufeffP0001,Fuel Volume Regulator\n"
+                "# comment\n"
+                'P0002,"Fuel Volume ' + "x" * (csv.field_size_limit() + 1) + '"\n'
+                'P0003,"Unterminated quote\n'
+                'P0004,"Quoted, with comma"\n'
+                "P0005,Last line\n",
+                encoding="utf-8",
+            )
+            rows = DTCDatabase._parse_csv(path)
+        self.assertEqual(
+            [
+                ("P0001", "Fuel Volume Regulator"),
+                ("P0003", "Unterminated quote"),
+                ("P0004", "Quoted, with comma"),
+                ("P0005", "Last line"),
+            ],
+            rows,
+        )
+
+
+class DtcDatabaseCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cache_root = _use_temp_cache(self)
+        for shared in (DTCDatabase._FILE_CACHE, DTCDatabase._LAYER_CACHE):
+            patcher = mock.patch.dict(shared, clear=True)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_second_load_reads_pickle(self) -> None:
+        first = DTCDatabase(manufacturer="landrover")
+        first.search("oxygen")
+        self.assertEqual(2, len(list(self.cache_root.glob("dtc-*.rows.pkl"))))
+        self.assertEqual(1, len(list(self.cache_root.glob("dtc-*.idx.pkl"))))
+
+        with mock.patch.object(DTCDatabase, "_parse_csv") as parse_csv:
+            second = DTCDatabase(manufacturer="landrover")
+        parse_csv.assert_not_called()
+        self.assertEqual(first.codes, second.codes)
+        self.assertEqual(first.loaded_files, second.loaded_files)
+        self.assertEqual(_linear_search(second, "oxygen"), second.search("oxygen"))
+
+    def test_manufacturer_switch_reuses_generic_rows(self) -> None:
+        DTCDatabase(manufacturer="landrover")
+        with mock.patch.object(DTCDatabase, "_parse_csv", wraps=DTCDatabase._parse_csv) as parse_csv:
+            db = DTCDatabase()
+        parsed = {call.args[0].name for call in parse_csv.call_args_list}
+        self.assertNotIn("dtc_generic.csv", parsed)
+        self.assertNotIn("dtc_land_rover.csv", parsed)
+        self.assertIn("dtc_land_rover.csv", db.loaded_files)
+
+    def test_switch_between_brands_sharing_a_csv_skips_disk(self) -> None:
+        db = DTCDatabase(manufacturer="landrover")
+        with mock.patch.object(DTCDatabase, "_parse_csv") as parse_csv, mock.patch.object(
+            DTCDatabase, "_read_cache", return_value=None
+        ) as read_cache:
+            db.set_manufacturer("jaguar")
+        parse_csv.assert_not_called()
+        self.assertFalse([c for c in read_cache.call_args_list if c.args[1] == "rows"])
+        self.assertIn("dtc_land_rover.csv", db.loaded_files)
+        self.assertIn("jaguar", {info.source for info in db.codes.values()})
+
+    def test_manufacturer_switch_keeps_generic_layer(self) -> None:
+        db = DTCDatabase(manufacturer="landrover")
+        generic = db._raw.maps[-1]
+        db.set_manufacturer("jaguar")
+        self.assertIs(generic, db._raw.maps[-1])
+        self.assertIs(generic, DTCDatabase()._raw.maps[-1])
+
+    def test_corrupt_cache_falls_back_to_csv(self) -> None:
+        expected = DTCDatabase(manufacturer="jeep").codes
+        for path in self.cache_root.glob("dtc-*.pkl"):
+            path.write_bytes(b"not a pickle")
+        self.assertEqual(expected, DTCDatabase(manufacturer="jeep").codes)
+
+    def test_changed_csv_replaces_its_stale_pickles(self) -> None:
+        data = Path(self.cache_root.parent) / "data"
+        data.mkdir()
+        csv_path = data / "dtc_generic.csv"
+        csv_path.write_text("P0001,Old description\n", encoding="utf-8")
+        with mock.patch("obd.dtc.database.data_dir", return_value=data):
+            DTCDatabase().search("old")
+            old_files = set(self.cache_root.glob("dtc-*.pkl"))
+            self.assertEqual(2, len(old_files))
+
+            csv_path.write_text("P0001,New description\nP0002,Another\n", encoding="utf-8")
+            db = DTCDatabase()
+            db.search("new")
+        self.assertEqual("New description", db.get_description("P0001"))
+        new_files = set(self.cache_root.glob("dtc-*.pkl"))
+        self.assertEqual(2, len(new_files))
+        self.assertFalse(old_files & new_files)
+
+
+class DtcDefaultsTests(unittest.TestCase):
+    def setUp(self) -> None:
+        _use_temp_cache(self)
+
+    def test_get_database_reuses_instance_per_manufacturer(self) -> None:
+        self.assertIs(get_database("Land Rover"), get_database("land_rover"))
+        self.assertIs(get_database(), get_database(None))
+        self.assertIsNot(get_database(), get_database("land_rover"))
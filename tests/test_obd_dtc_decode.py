@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import unittest
+
+from obd.dtc import decode_dtc_bytes, parse_dtc_response
+
+
+class DtcDecodeTests(unittest.TestCase):
+    def test_decode_prefixes(self) -> None:
+        cases = {
+            "0133": "P0133",
+            "1234": "P1234",
+            "4123": "C0123",
+            "7E00": "C3E00",
+            "8abc": "B0ABC",
+            "C001": "U0001",
+            "FFFF": "U3FFF",
+        }
+        for raw, expected in cases.items():
+            with self.subTest(raw=raw):
+                self.assertEqual(expected, decode_dtc_bytes(raw))
+
+    def test_decode_rejects_non_hex(self) -> None:
+        for raw in ["", "013", "01G3", "01333"]:
+            with self.subTest(raw=raw):
+                self.assertTrue(decode_dtc_bytes(raw).startswith("INVALID"))
+
+    def test_parse_response(self) -> None:
+        self.assertEqual(["P0133", "C0123"], parse_dtc_response("43 01 33 41 23 00 00"))
+        self.assertEqual(["U0100"], parse_dtc_response("47C100", mode="07"))
+        self.assertEqual([], parse_dtc_response("43 00 00 00 00"))
+        self.assertEqual([], parse_dtc_response(""))
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+from obd.elm.elm327 import ELM327
+from tests.replay_transport import ReplaySerial
+
+
+class _NoInWaitingSerial(ReplaySerial):
+    # Like a driver that only hands bytes out through blocking read(1)
+    @property
+    def in_waiting(self) -> int:
+        return 0
+
+
+class Elm327BlockingReadTests(unittest.TestCase):
+    def _elm(self, serial_cls, lines):
+        elm = ELM327(port="REPLAY")
+        elm.connection = serial_cls([{"command": "0100", "lines": lines}])
+        elm._is_connected = True  # pylint: disable=protected-access
+        return elm
+
+    def test_blocking_read_keeps_every_byte(self) -> None:
+        elm = self._elm(_NoInWaitingSerial, ["41 00 BE 3F A8 13"])
+        elm._blocking_read = True  # pylint: disable=protected-access
+        self.assertEqual(["41 00 BE 3F A8 13"], elm.send_raw_lines("0100", timeout=1.0))
+
+    def test_polling_path_unchanged(self) -> None:
+        elm = self._elm(ReplaySerial, ["41 00 BE 3F A8 13"])
+        self.assertEqual(["41 00 BE 3F A8 13"], elm.send_raw_lines("0100", timeout=1.0))
+
+
+class Elm327SendObdTests(unittest.TestCase):
+    def _send(self, lines):
+        elm = ELM327(port="REPLAY")
+        elm.connection = ReplaySerial([{"command": "0100", "lines": lines}])
+        elm._is_connected = True  # pylint: disable=protected-access
+        return elm.send_obd("0100")
+
+    def test_status_priority_does_not_depend_on_position(self) -> None:
+        self.assertEqual("NO DATA", self._send(["CAN ERROR", "NO DATA"]))
+        self.assertEqual("NO CONNECT", self._send(["?", "UNABLE TO CONNECT"]))
+        self.assertEqual("INVALID", self._send(["?"]))
+
+    def test_hex_payload_is_compacted(self) -> None:
+        self.assertEqual("7E8064100BE3FA813", self._send(["7E8 06 41 00 BE 3F A8 13"]))
+
+
+class Elm327LowLatencyTests(unittest.TestCase):
+    def test_low_latency_requested_on_linux(self) -> None:
+        port = mock.Mock()
+        with mock.patch("obd.elm.elm327.platform_name", return_value="linux"):
+            self.assertTrue(ELM327._set_low_latency(port))  # pylint: disable=protected-access
+        port.set_low_latency_mode.assert_called_once_with(True)
+
+    def test_refused_low_latency_is_ignored(self) -> None:
+        port = mock.Mock()
+        port.set_low_latency_mode.side_effect = ValueError("Failed to update ASYNC_LOW_LATENCY flag")
+        with mock.patch("obd.elm.elm327.platform_name", return_value="linux"):
+            self.assertFalse(ELM327._set_low_latency(port))  # pylint: disable=protected-access
+        with mock.patch("obd.elm.elm327.platform_name", return_value="win32"):
+            self.assertFalse(ELM327._set_low_latency(mock.Mock()))  # pylint: disable=protected-access
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import unittest
+from typing import Dict, List
+
+from tests.replay_transport import ReplayFixture, build_replay_scanner
+
+
+def _scanner_with_steps(
+    steps: List[Dict[str, object]], headers_on: bool = False, frame_hints: bool = False
+):
+    fixture = ReplayFixture(steps=steps, meta={"headers_on": headers_on}, expected={})
+    scanner, _elm = build_replay_scanner(fixture)
+    scanner.frame_hints = frame_hints
+    return scanner
+
+
+class LiveDataBatchTests(unittest.TestCase):
+    def test_batched_single_frame(self) -> None:
+        steps = [
+            {"command": "010C0D05", "lines": ["41 0C 1A F8 0D 32 05 7B"]},
+        ]
+        scanner = _scanner_with_steps(steps)
+        readings = scanner.read_live_data_batched(["0C", "0D", "05"])
+        self.assertEqual(["0C", "0D", "05"], list(readings))
+        self.assertEqual(1726.0, readings["0C"].value)
+        self.assertEqual(50.0, readings["0D"].value)
+        self.assertEqual(83.0, readings["05"].value)
+
+    def test_batched_multi_frame_with_headers(self) -> None:
+        steps = [
+            {
+                "command": "010C0D0511",
+                "lines": [
+                    "7E8 10 0A 41 0C 1A F8 0D 32",
+                    "7E8 21 05 7B 11 40 00 00 00",
+                ],
+            },
+        ]
+        scanner = _scanner_with_steps(steps, headers_on=True)
+        readings = scanner.read_live_data_batched(["0C", "0D", "05", "11"])
+        self.assertEqual({"0C", "0D", "05", "11"}, set(readings))
+        self.assertEqual(83.0, readings["05"].value)
+        self.assertEqual("7E8", readings["11"].ecu)
+
+    def test_value_crossing_a_frame_boundary(self) -> None:
+        steps = [
+            {
+                "command": "01420C0D",
+                "lines": [
+                    "7E8 10 09 41 42 30 00 0C 1A",
+                    "7E8 21 F8 0D 32 00 00 00 00",
+                ],
+            },
+        ]
+        scanner = _scanner_with_steps(steps, headers_on=True)
+        readings = scanner.read_live_data_batched(["42", "0C", "0D"])
+        self.assertEqual(1726.0, readings["0C"].value)
+        self.assertEqual(50.0, readings["0D"].value)
+
+    def test_pid_starting_a_consecutive_frame(self) -> None:
+        steps = [
+            {
+                "command": "010C0D11",
+                "lines": [
+                    "7E8 10 08 41 0C 1A F8 0D 32",
+                    "7E8 21 11 40 00 00 00 00 00",
+                ],
+            },
+        ]
+        scanner = _scanner_with_steps(steps, headers_on=True)
+        readings = scanner.read_live_data_batched(["0C", "0D", "11"])
+        self.assertEqual({"0C", "0D", "11"}, set(readings))
+        self.assertEqual(25.1, readings["11"].value)
+
+    def test_missing_pid_falls_back_to_single_read(self) -> None:
+        steps = [
+            {"command": "010C0D", "lines": ["41 0C 1A F8"]},
+            {"command": "010D", "lines": ["41 0D 32"]},
+        ]
+        scanner = _scanner_with_steps(steps)
+        readings = scanner.read_live_data_batched(["0C", "0D"])
+        self.assertEqual(50.0, readings["0D"].value)
+
+    def test_unanswered_batch_disables_batching(self) -> None:
+        steps = [
+            {"command": "010C0D", "lines": ["NO DATA"]},
+            {"command": "010C0D", "lines": ["NO DATA"]},
+            {"command": "010C", "lines": ["41 0C 1A F8"]},
+            {"command": "010D", "lines": ["41 0D 32"]},
+            {"command": "010C", "lines": ["41 0C 1A F8"]},
+            {"command": "010D", "lines": ["41 0D 32"]},
+        ]
+        scanner = _scanner_with_steps(steps)
+        self.assertEqual(2, len(scanner.read_live_data_batched(["0C", "0D"])))
+        self.assertEqual(2, len(scanner.read_live_data_batched(["0C", "0D"])))
+
+    def test_batched_without_spaces(self) -> None:
+        steps = [
+            {"command": "010C0D", "lines": ["7E806410C1AF80D32"]},
+        ]
+        scanner = _scanner_with_steps(steps, headers_on=True)
+        readings = scanner.read_live_data_batched(["0C", "0D"])
+        self.assertEqual(1726.0, readings["0C"].value)
+        self.assertEqual("7E8", readings["0C"].ecu)
+        self.assertEqual(50.0, readings["0D"].value)
+
+    def test_pipelined_matches_sequential(self) -> None:
+        steps = [
+            {"command": "010C", "lines": ["41 0C 1A F8"]},
+            {"command": "0105", "lines": ["NO DATA"]},
+            {"command": "0105", "lines": ["NO DATA"]},
+            {"command": "010D", "lines": ["41 0D 32"]},
+        ]
+        expected = _scanner_with_steps(steps).read_live_data(["0C", "05", "0D"])
+        readings = _scanner_with_steps(steps).read_live_data_pipelined(["0C", "05", "0D"])
+        self.assertEqual(["0C", "0D"], list(readings))
+        self.assertEqual(
+            [(r.pid, r.value, r.raw_hex) for r in expected.values()],
+            [(r.pid, r.value, r.raw_hex) for r in readings.values()],
+        )
+
+
+class FrameHintTests(unittest.TestCase):
+    def test_read_pid_sends_frame_count(self) -> None:
+        scanner = _scanner_with_steps([{"command": "010D 1", "lines": ["41 0D 32"]}], frame_hints=True)
+        self.assertEqual(50.0, scanner.read_pid("0D").value)
+
+    def test_no_hint_unless_enabled(self) -> None:
+        scanner = _scanner_with_steps([{"command": "010D", "lines": ["41 0D 32"]}])
+        scanner.fast_responses = True
+        self.assertEqual(50.0, scanner.read_pid("0D").value)
+
+    def test_rejected_hint_falls_back_to_plain_command(self) -> None:
+        scanner = _scanner_with_steps(
+            [
+                {"command": "010D 1", "lines": ["?"]},
+                {"command": "010D", "lines": ["41 0D 32"]},
+                {"command": "010C", "lines": ["41 0C 1A F8"]},
+            ],
+            frame_hints=True,
+        )
+        self.assertEqual(50.0, scanner.read_pid("0D").value)
+        self.assertEqual(1726.0, scanner.read_pid("0C").value)
+
+    def test_no_hint_when_several_ecus_answer(self) -> None:
+        scanner = _scanner_with_steps(
+            [
+                {"command": "0100", "lines": ["7E9 06 41 00 00 18 00 00", "7E8 06 41 00 00 18 00 00"]},
+                {"command": "010D", "lines": ["7E9 03 41 0D 10", "7E8 03 41 0D 32"]},
+            ],
+            headers_on=True,
+            frame_hints=True,
+        )
+        scanner._supported_pids = scanner._read_supported_pids()
+        self.assertEqual(2, scanner._responding_ecus)
+        reading = scanner.read_pid("0D")
+        self.assertEqual(50.0, reading.value)
+        self.assertEqual("7E8", reading.ecu)
+
+    def test_hint_with_a_single_answering_ecu(self) -> None:
+        scanner = _scanner_with_steps(
+            [
+                {"command": "0100", "lines": ["7E8 06 41 00 00 18 00 00"]},
+                {"command": "010D 1", "lines": ["7E8 03 41 0D 32"]},
+            ],
+            headers_on=True,
+            frame_hints=True,
+        )
+        scanner._supported_pids = scanner._read_supported_pids()
+        self.assertEqual(50.0, scanner.read_pid("0D").value)
+
+
+class SupportedPidTests(unittest.TestCase):
+    def test_bitmaps_are_merged_across_ecus_and_ranges(self) -> None:
+        steps = [
+            # 7E8: 04, 05, next range; 7E9: 0C
+            {"command": "0100", "lines": ["7E8 06 41 00 18 00 00 01", "7E9 06 41 00 00 10 00 00"]},
+            {"command": "0120", "lines": ["7E8 06 41 20 80 00 00 00"]},
+        ]
+        scanner = _scanner_with_steps(steps, headers_on=True)
+        self.assertEqual(frozenset({"04", "05", "0C", "20", "21"}), scanner._read_supported_pids())
+
+    def test_unanswered_bitmap_means_unknown(self) -> None:
+        steps = [{"command": "0100", "lines": ["NO DATA"]}, {"command": "0100", "lines": ["NO DATA"]}]
+        self.assertIsNone(_scanner_with_steps(steps)._read_supported_pids())
+
+    def test_unsupported_pid_is_not_requested(self) -> None:
+        scanner = _scanner_with_steps([{"command": "010D", "lines": ["41 0D 32"]}])
+        scanner._supported_pids = frozenset({"0D"})
+        readings = scanner.read_live_data(["0C", "0D"])
+        self.assertEqual(["0D"], list(readings))
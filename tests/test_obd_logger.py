@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import csv
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from obd.logger import SessionLogger
+from obd.obd2.models import SensorReading
+from obd.rawlog import RawLogger
+
+
+def _reading(name: str, value: float, unit: str, pid: str) -> SensorReading:
+    return SensorReading(name=name, value=value, unit=unit, pid=pid, raw_hex="")
+
+
+class SessionLoggerCsvTests(unittest.TestCase):
+    def test_rows_are_flushed_on_end_session(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            logger = SessionLogger(tmp)
+            path = logger.start_session(format="csv")
+            for rpm in range(200):
+                logger.log_readings({"0C": _reading("Engine RPM", float(rpm), "rpm", "0C")})
+            summary = logger.end_session()
+
+            with open(path, encoding="utf-8", newline="") as f:
+                rows = list(csv.DictReader(f))
+            self.assertEqual(200, summary["reading_count"])
+            self.assertEqual([str(float(i)) for i in range(200)], [r["rpm"] for r in rows])
+
+    def test_new_columns_rewrite_earlier_rows(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            logger = SessionLogger(tmp)
+            path = logger.start_session(format="csv")
+            logger.log_readings({"0C": _reading("Engine RPM", 800.0, "rpm", "0C")})
+            logger.log_readings(
+                {
+                    "0C": _reading("Engine RPM", 900.0, "rpm", "0C"),
+                    "0D": _reading("Vehicle Speed", 12.0, "km/h", "0D"),
+                }
+            )
+            logger.log_event("NOTE", "done")
+            logger.end_session()
+
+            with open(path, encoding="utf-8", newline="") as f:
+                rows = list(csv.DictReader(f))
+            self.assertEqual(["800.0", "900.0", ""], [r["rpm"] for r in rows])
+            self.assertEqual(["", "12.0", ""], [r["speed"] for r in rows])
+            self.assertEqual("done", rows[2]["message"])
+
+    def test_failed_reopen_is_raised_from_end_session(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            logger = SessionLogger(tmp)
+            logger.start_session(format="csv")
+            logger.log_readings({"0C": _reading("Engine RPM", 800.0, "rpm", "0C")})
+            real_open = open
+
+            def failing_open(file, mode="r", *args, **kwargs):
+                if "w" in mode:
+                    raise PermissionError("read-only")
+                return real_open(file, mode, *args, **kwargs)
+
+            with mock.patch("builtins.open", failing_open):
+                logger.log_readings({"0D": _reading("Vehicle Speed", 12.0, "km/h", "0D")})
+                logger.log_readings({"0D": _reading("Vehicle Speed", 13.0, "km/h", "0D")})
+                with self.assertRaises(PermissionError):
+                    logger.end_session()
+            self.assertFalse(logger.is_active)
+
+
+class RawLoggerTests(unittest.TestCase):
+    def test_flush_writes_buffered_entries(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "raw.log")
+            logger = RawLogger(path)
+            logger("TX", "0100", [])
+            logger("RX", "0100", ["41 00 BE 3F A8 13"])
+            logger.flush()
+            with open(path, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+            logger.close()
+            self.assertFalse(logger._writer_thread.is_alive())  # pylint: disable=protected-access
+            self.assertEqual(3, len(lines))
+            self.assertTrue(lines[0].endswith("] TX 0100"))
+            self.assertEqual("  41 00 BE 3F A8 13", lines[2])
+
+    def test_failed_write_is_reported_and_retried(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "raw.log")
+            logger = RawLogger(path)
+            with mock.patch.object(Path, "open", side_effect=PermissionError("read-only")):
+                logger("TX", "0100", [])
+                with self.assertRaises(PermissionError):
+                    logger.flush()
+            logger("TX", "0902", [])
+            logger.close()
+            with open(path, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+            self.assertEqual(2, len(lines))
+            self.assertTrue(lines[0].endswith("] TX 0100"))
+
+    def test_concurrent_callers_start_one_writer(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "raw.log")
+            logger = RawLogger(path)
+            barrier = threading.Barrier(8)
+
+            def log() -> None:
+                barrier.wait()
+                logger("TX", "ATZ", [])
+
+            with mock.patch.object(threading.Thread, "start", autospec=True, side_effect=threading.Thread.start) as start:
+                workers = [threading.Thread(target=log) for _ in range(8)]
+                for worker in workers:
+                    worker.start()
+                for worker in workers:
+                    worker.join()
+            logger.close()
+            writers = [c for c in start.call_args_list if c.args[0].name == "raw-log-writer"]
+            self.assertEqual(1, len(writers))
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(8, len(f.read().splitlines()))
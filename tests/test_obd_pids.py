@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import unittest
+
+from obd.pids import PIDS, decode_pid_response, decode_pid_response_bytes, decode_pid_responses
+
+
+class DecodePidResponsesTests(unittest.TestCase):
+    def test_batch_matches_single_decode(self) -> None:
+        payloads = ["1AF8", "7B", "", "ZZ", "00FF", "FFFF00", "7"]
+        for pid in list(PIDS) + ["99", ""]:
+            with self.subTest(pid=pid):
+                expected = [decode_pid_response(pid, h) for h in payloads]
+                self.assertEqual(expected, decode_pid_responses(pid, payloads))
+
+    def test_engine_rpm(self) -> None:
+        self.assertEqual([1726.0, 0.0], decode_pid_responses("0c", ["1AF8", "0000"]))
+
+
+class DecodePidResponseBytesTests(unittest.TestCase):
+    def test_bytes_match_hex_decode(self) -> None:
+        payloads = [b"\x1a\xf8", b"\x7b", b"", b"\x00\xff", b"\xff\xff\x00"]
+        for pid in list(PIDS) + ["99", ""]:
+            with self.subTest(pid=pid):
+                self.assertEqual(
+                    [decode_pid_response(pid, raw.hex()) for raw in payloads],
+                    [decode_pid_response_bytes(pid, raw) for raw in payloads],
+                )
+
+    def test_rejects_non_bytes(self) -> None:
+        self.assertIsNone(decode_pid_response_bytes("0C", "1AF8"))
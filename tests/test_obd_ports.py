@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from obd.bluetooth import ports as bt_ports
+from obd.elm.ports import find_ports
+
+
+class PortCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        bt_ports.clear_port_cache()
+        self.addCleanup(bt_ports.clear_port_cache)
+
+    def test_comports_reused_within_ttl(self) -> None:
+        port = SimpleNamespace(device="/dev/ttyUSB0", description="USB ELM327", hwid="USB VID:PID")
+        with mock.patch.object(bt_ports.serial.tools.list_ports, "comports", return_value=[port]) as comports:
+            self.assertEqual(["/dev/ttyUSB0"], find_ports())
+            self.assertEqual(["/dev/ttyUSB0"], find_ports())
+            self.assertEqual(1, comports.call_count)
+
+            bt_ports.clear_port_cache()
+            find_ports()
+            self.assertEqual(2, comports.call_count)
+
+    def test_cache_expires_after_ttl(self) -> None:
+        port = SimpleNamespace(device="/dev/ttyUSB0", description="USB ELM327", hwid="USB VID:PID")
+        with mock.patch.object(bt_ports.serial.tools.list_ports, "comports", return_value=[port]) as comports:
+            with mock.patch.object(bt_ports.time, "monotonic", side_effect=[0.0, bt_ports.PORT_CACHE_TTL_S + 1]):
+                bt_ports.list_serial_ports()
+                bt_ports.list_serial_ports()
+            self.assertEqual(2, comports.call_count)
+
+    def test_empty_listing_is_not_cached(self) -> None:
+        port = SimpleNamespace(device="/dev/ttyUSB0", description="USB ELM327", hwid="USB VID:PID")
+        with mock.patch.object(bt_ports.serial.tools.list_ports, "comports", side_effect=[[], [port]]):
+            self.assertEqual([], find_ports())
+            self.assertEqual(["/dev/ttyUSB0"], find_ports())
+
+
+class BluetoothPortInfoTests(unittest.TestCase):
+    def test_classification(self) -> None:
+        cases = [
+            (("/dev/rfcomm0", "", ""), True),
+            (("/dev/cu.OBDII-Port", "Bluetooth-Incoming-Port", ""), True),
+            (("/dev/cu.Bluetooth-Incoming-Port", "n/a", "n/a"), False),
+            (("COM5", "Standard Serial over Bluetooth link", "BTHENUM\\{0000}"), True),
+            (("COM7", "Serial", "BTHENUM\\{1101}"), True),
+            (("/dev/ttyUSB0", "USB Serial", "USB VID:PID=1A86:7523"), False),
+            ((None, None, None), False),
+        ]
+        for args, expected in cases:
+            with self.subTest(args=args):
+                self.assertEqual(expected, bt_ports.is_bluetooth_port_info(*args))
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import unittest
+from pathlib import Path
+from typing import Dict, List
+from unittest import mock
+
+from obd.uds import dids
+from obd.uds.client import UdsClient
+from tests.replay_transport import ReplayFixture, build_replay_scanner
+
+CONFIGURE_STEPS: List[Dict[str, object]] = [
+    {"command": cmd, "lines": ["OK"]}
+    for cmd in ["ATSP6", "ATE0", "ATL0", "ATS0", "ATH1", "ATSH7E0"]
+]
+
+
+def _client(steps: List[Dict[str, object]]) -> UdsClient:
+    fixture = ReplayFixture(steps=CONFIGURE_STEPS + steps, meta={"headers_on": True}, expected={})
+    _scanner, elm = build_replay_scanner(fixture)
+    return UdsClient(elm)
+
+
+class UdsReadDidsTests(unittest.TestCase):
+    def test_multi_did_single_request(self) -> None:
+        client = _client(
+            [
+                {
+                    "command": "22 F1 90 F1 87",
+                    "lines": [
+                        "7E8 10 0C 62 F1 90 41 42 43",
+                        "7E8 21 44 F1 87 31 2E 30 00",
+                    ],
+                },
+            ]
+        )
+        results = client.read_dids("jeep", ["F190", "F187"])
+        self.assertEqual(["F190", "F187"], [r["did"] for r in results])
+        self.assertEqual("ABCD", results[0]["value"])
+        self.assertEqual("312E30", results[1]["raw"])
+
+    def test_incorrect_length_falls_back_to_single_reads(self) -> None:
+        client = _client(
+            [
+                {"command": "22 F1 90 F1 87", "lines": ["7E8 03 7F 22 13"]},
+                {"command": "22 F1 90", "lines": ["7E8 05 62 F1 90 41 42"]},
+                {"command": "22 F1 87", "lines": ["7E8 03 7F 22 31"]},
+            ]
+        )
+        results = client.read_dids("jeep", ["F190", "F187"])
+        self.assertEqual("AB", results[0]["value"])
+        self.assertIn("0x31", results[1]["error"])
+
+    def test_skipped_did_is_retried(self) -> None:
+        client = _client(
+            [
+                {"command": "22 F1 90 F1 8C F1 87", "lines": ["7E8 06 62 F1 87 31 32 33"]},
+                {"command": "22 F1 90", "lines": ["7E8 05 62 F1 90 41 42"]},
+                {"command": "22 F1 8C", "lines": ["7E8 04 62 F1 8C 07"]},
+            ]
+        )
+        results = client.read_dids("jeep", ["F190", "F18C", "F187"])
+        self.assertEqual(["4142", "07", "313233"], [r["raw"] for r in results])
+
+    def test_any_negative_response_falls_back_to_single_reads(self) -> None:
+        client = _client(
+            [
+                {"command": "22 F1 90 F1 87", "lines": ["7E8 03 7F 22 31"]},
+                {"command": "22 F1 90", "lines": ["7E8 05 62 F1 90 41 42"]},
+                {"command": "22 F1 87", "lines": ["7E8 03 7F 22 31"]},
+            ]
+        )
+        results = client.read_dids("jeep", ["F190", "F187"])
+        self.assertEqual("AB", results[0]["value"])
+        self.assertIn("0x31", results[1]["error"])
+
+    def test_value_holding_a_later_did_is_reread(self) -> None:
+        # F190's value "F1 87 01" contains F187's identifier: two valid splits
+        client = _client(
+            [
+                {"command": "22 F1 90 F1 87", "lines": ["7E8 09 62 F1 90 F1 87 01 F1 87 32"]},
+                {"command": "22 F1 90", "lines": ["7E8 06 62 F1 90 F1 87 01"]},
+                {"command": "22 F1 87", "lines": ["7E8 04 62 F1 87 32"]},
+            ]
+        )
+        results = client.read_dids("jeep", ["F190", "F187"])
+        self.assertEqual(["F18701", "32"], [r["raw"] for r in results])
+
+    def test_named_read_reuses_the_catalog_entry(self) -> None:
+        client = _client([{"command": "22 F1 90", "lines": ["7E8 05 62 F1 90 41 42"]}])
+        with mock.patch("obd.uds.client.find_did") as find_did:
+            result = client.read_did_named("Jeep", "VIN")
+        find_did.assert_not_called()
+        self.assertEqual({"did": "F190", "raw": "4142", "name": "VIN", "value": "AB"}, result)
+
+
+class UdsDidCatalogTests(unittest.TestCase):
+    def test_lookups_do_not_reread_the_brand_file(self) -> None:
+        dids.find_did("jeep", "F190")
+        with mock.patch.object(Path, "read_text", side_effect=AssertionError("re-read")):
+            self.assertEqual("VIN", dids.find_did("JEEP", "f190")["name"])
+            self.assertEqual("F190", dids.find_did_by_name("jeep", " vin ")["did"])
+            self.assertIsNone(dids.find_did("jeep", "0000"))
+
+    def test_load_brand_dids_returns_a_private_copy(self) -> None:
+        entries = dids.load_brand_dids("jeep")
+        entries[0]["name"] = "changed"
+        self.assertEqual("VIN", dids.find_did("jeep", "F190")["name"])
@@ -42,6 +42,7 @@ class PortContractTests(unittest.TestCase):
                 "set_manufacturer",
                 "set_raw_logger",
                 "set_port",
+                "set_fast_responses",
                 "connect",
                 "disconnect",
                 "get_transport",
@@ -96,7 +97,7 @@ class PortContractTests(unittest.TestCase):
             (VinCacheRepositoryImpl, ["get", "set"]),
             (I18nRepositoryImpl, ["load_all"]),
             (UdsDiscoveryService, ["discover"]),
-            (UdsClientAdapter, ["read_did", "send_raw"]),
+            (UdsClientAdapter, ["read_did", "read_dids", "send_raw"]),
             (UdsClientFactoryImpl, ["create", "module_map"]),
             (TelemetryLoggerAdapter, ["start_session", "log_readings", "end_session"]),
             (TelemetryLoggerFactoryImpl, ["create"]),